@@ -0,0 +1,33 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import importlib
+
+import pytest
+
+# Tests import the widgets both as `scripts.ui...` and `ui...`
+_PROGRESS_WIDGET_MODULES = ('scripts.ui.components.progress_widgets',
+                            'ui.components.progress_widgets')
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Provide a single QApplication for the whole test session."""
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QApplication
+    
+    app = QApplication.instance() or QApplication([])
+    QApplication.setEffectEnabled(Qt.UI_AnimateCombo, False)
+    return app
+
+
+@pytest.fixture(autouse=True)
+def _no_widget_animations(monkeypatch):
+    """Keep progress widget animation timers off; visual updates are irrelevant here."""
+    for name in _PROGRESS_WIDGET_MODULES:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        monkeypatch.setattr(module, '_animations_enabled', False)
@@ -8,15 +8,13 @@ system implemented for task 11.
 
 import sys
 import os
-import time
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton
-from PyQt5.QtCore import QTimer, pyqtSignal
+from PyQt5.QtCore import QTimer
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from scripts.ui.utils.status_manager import StatusManager, StatusLevel, ProgressType
-from scripts.ui.components.progress_widgets import ProgressPanel
+from scripts.ui.utils.status_manager import StatusLevel, ProgressType
 from scripts.ui.components.right_panel import RightPanel
 
 
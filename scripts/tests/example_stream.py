@@ -1,5 +1,4 @@
 import time
-import sys
 
 def main():
     for i in range(1, 31):
@@ -8,8 +8,9 @@ import unittest
 import sys
 import os
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Mirror pytest's pythonpath setting: the project root and the scripts directory
+_TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.dirname(os.path.dirname(_TESTS_DIR)), os.path.dirname(_TESTS_DIR)]
 
 def run_all_tests():
     """Discover and run all tests in the tests directory."""
@@ -6,15 +6,10 @@ loading, saving, validation, and error handling.
 """
 
 import os
-import sys
 import tempfile
 import shutil
 import yaml
 import unittest
-from unittest.mock import patch, MagicMock
-
-# Add the scripts directory to the path so we can import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from ui.utils.config import AppConfig, AppSettings, ConfigValidationError
 
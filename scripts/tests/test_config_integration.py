@@ -5,15 +5,11 @@ Tests the configuration system with actual project files and structure.
 """
 
 import os
-import sys
 import tempfile
 import shutil
 import unittest
 
-# Add the scripts directory to the path so we can import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from ui.utils.config import AppConfig, AppSettings
+from ui.utils.config import AppConfig
 
 
 class TestConfigIntegration(unittest.TestCase):
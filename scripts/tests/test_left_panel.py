@@ -0,0 +1,82 @@
+"""
+Unit tests for LeftPanel
+
+Tests PDF drop signal forwarding and console batching.
+"""
+
+import unittest
+import tempfile
+import shutil
+from unittest.mock import patch
+
+from PyQt5.QtWidgets import QApplication
+
+from ui.components.pdf_drop_widget import PDFDropWidget
+from ui.components.left_panel import LeftPanel
+
+
+class TestLeftPanelDropForwarding(unittest.TestCase):
+    """Test that LeftPanel forwards PDFDropWidget signals."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for testing."""
+        cls.app = QApplication.instance() or QApplication([])
+        
+    def setUp(self):
+        """Create a left panel whose PDF list starts out empty."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        with patch.object(PDFDropWidget, '_get_pdf_directory', return_value=self.temp_dir):
+            self.panel = LeftPanel()
+            self.panel.initialize()
+        self.addCleanup(self.panel.deleteLater)
+        
+    def test_signals_forwarded_with_empty_list(self):
+        """An empty drop list is falsy but must still be connected."""
+        self.assertEqual(self.panel.pdf_drop_widget.count(), 0)
+        dropped = []
+        preprocess = []
+        self.panel.pdf_dropped.connect(dropped.append)
+        self.panel.pdf_preprocess_requested.connect(preprocess.append)
+        
+        self.panel.pdf_drop_widget.pdf_dropped.emit("/tmp/a.pdf")
+        self.panel.pdf_drop_widget.pdf_preprocess_requested.emit("/tmp/b.pdf")
+        
+        self.assertEqual(dropped, ["/tmp/a.pdf"])
+        self.assertEqual(preprocess, ["/tmp/b.pdf"])
+
+
+class TestLeftPanelConsole(unittest.TestCase):
+    """Test LeftPanel console batching while the console is not visible."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for testing."""
+        cls.app = QApplication.instance() or QApplication([])
+        
+    def setUp(self):
+        """Create a left panel that has not been shown yet."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        with patch.object(PDFDropWidget, '_get_pdf_directory', return_value=self.temp_dir):
+            self.panel = LeftPanel()
+            self.panel.initialize()
+        self.panel.resize(400, 600)
+        self.addCleanup(self.panel.deleteLater)
+        
+    def test_lines_held_until_console_shown(self):
+        """Lines queued while hidden are appended once the console shows."""
+        self.panel.append_console_output("first")
+        self.panel._flush_pending_lines()
+        self.assertEqual(self.panel.console_output.toPlainText(), "")
+        self.assertEqual(self.panel._pending_lines, ["first"])
+        
+        self.panel.show()
+        self.assertTrue(self.panel.console_flush_timer.isActive())
+        self.panel._flush_pending_lines()
+        self.assertEqual(self.panel.console_output.toPlainText(), "first")
+
+
+if __name__ == '__main__':
+    unittest.main()
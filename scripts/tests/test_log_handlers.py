@@ -0,0 +1,114 @@
+"""
+Unit tests for the application logging handlers.
+"""
+
+import logging
+import os
+import queue
+import sys
+import tempfile
+import unittest
+
+from ui.utils.log_handlers import BufferedFileHandler, CachedTimeFormatter, DeferredQueueHandler
+
+
+class TestBufferedFileHandler(unittest.TestCase):
+    """Test cases for BufferedFileHandler."""
+
+    def setUp(self):
+        """Create a handler writing to a temporary log file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.log_path = os.path.join(self.temp_dir.name, 'app.log')
+
+        self.handler = BufferedFileHandler(self.log_path, flush_interval=3600)
+        self.addCleanup(self.handler.close)
+
+    def _emit(self, level, message):
+        record = logging.LogRecord('test', level, __file__, 0, message, None, None)
+        self.handler.handle(record)
+
+    def _read_log(self):
+        with open(self.log_path, encoding='utf-8') as log_file:
+            return log_file.read()
+
+    def test_file_opened_on_first_record(self):
+        """The log file is not created until a record is written."""
+        self.assertFalse(os.path.exists(self.log_path))
+        self._emit(logging.INFO, "first")
+        self.assertTrue(os.path.exists(self.log_path))
+
+    def test_info_records_stay_buffered(self):
+        """Records below flush_level are not flushed per record."""
+        self._emit(logging.INFO, "buffered")
+        self.assertEqual(self._read_log(), "")
+
+    def test_error_record_flushes_buffer(self):
+        """An ERROR record flushes itself and everything buffered before it."""
+        self._emit(logging.INFO, "buffered")
+        self._emit(logging.ERROR, "failure")
+        self.assertEqual(self._read_log(), "buffered\nfailure\n")
+
+    def test_close_flushes_buffer(self):
+        """Closing the handler writes out buffered records."""
+        self._emit(logging.INFO, "buffered")
+        self.handler.close()
+        self.assertEqual(self._read_log(), "buffered\n")
+        self.assertFalse(self.handler._flush_thread.is_alive())
+
+
+class TestCachedTimeFormatter(unittest.TestCase):
+    """Test cases for CachedTimeFormatter."""
+
+    FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+    def _record(self, created):
+        record = logging.LogRecord('test', logging.INFO, __file__, 0, "message", None, None)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        return record
+
+    def test_matches_standard_formatter(self):
+        """Output is identical to logging.Formatter, with and without datefmt."""
+        times = [1700000000.125, 1700000000.875, 1700000001.5, 1700000000.25]
+        for datefmt in (None, '%H:%M:%S'):
+            with self.subTest(datefmt=datefmt):
+                cached = CachedTimeFormatter(self.FORMAT, datefmt)
+                standard = logging.Formatter(self.FORMAT, datefmt)
+                for created in times:
+                    record = self._record(created)
+                    self.assertEqual(cached.format(record), standard.format(record))
+
+    def test_same_second_reuses_rendered_time(self):
+        """Records within one second render the timestamp once."""
+        formatter = CachedTimeFormatter(self.FORMAT)
+        formatter.format(self._record(1700000000.1))
+        cached_entry = formatter._time_cache
+        formatter.format(self._record(1700000000.9))
+        self.assertIs(formatter._time_cache, cached_entry)
+
+
+class TestDeferredQueueHandler(unittest.TestCase):
+    """Test cases for DeferredQueueHandler."""
+    
+    def test_record_enqueued_unformatted(self):
+        """The message and exc_info reach the queue untouched."""
+        log_queue = queue.SimpleQueue()
+        handler = DeferredQueueHandler(log_queue)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        record = logging.LogRecord('test', logging.ERROR, __file__, 0, "failed %s", ("job",), exc_info)
+        
+        handler.handle(record)
+        
+        queued = log_queue.get_nowait()
+        self.assertIs(queued, record)
+        self.assertEqual(queued.args, ("job",))
+        self.assertIs(queued.exc_info, exc_info)
+        self.assertIn("ValueError: boom", logging.Formatter().format(queued))
+
+
+if __name__ == '__main__':
+    unittest.main()
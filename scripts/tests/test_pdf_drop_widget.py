@@ -8,16 +8,12 @@ import unittest
 import os
 import tempfile
 import shutil
-from unittest.mock import Mock, patch, MagicMock
-import sys
-
-# Add the scripts directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import threading
+from unittest.mock import Mock, patch
 
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt, QUrl, QMimeData, QPoint
 from PyQt5.QtGui import QDragEnterEvent, QDragMoveEvent, QDropEvent, QDragLeaveEvent
-from PyQt5.QtTest import QTest
 
 from ui.components.pdf_drop_widget import PDFDropWidget
 
@@ -107,6 +103,11 @@ startxref
         mime_data.setUrls(urls)
         return mime_data
         
+    def _wait_for_copies(self):
+        """Let background copies finish and deliver their queued signals."""
+        self.widget._copy_pool.waitForDone()
+        QApplication.processEvents()
+        
     def _create_drag_event(self, mime_data, event_type='enter'):
         """Create a drag event for testing."""
         pos = QPoint(10, 10)
@@ -124,22 +125,15 @@ startxref
         """Test widget initialization."""
         self.assertFalse(self.widget._drag_active)
         self.assertTrue(self.widget.acceptDrops())
-        self.assertIsNotNone(self.widget._mime_db)
-        
-    def test_pdf_file_validation_valid_pdf(self):
-        """Test validation of valid PDF file."""
-        result = self.widget._is_valid_pdf_file(self.test_pdf_path)
-        self.assertTrue(result)
-        
-    def test_pdf_file_validation_invalid_file(self):
-        """Test validation of non-PDF file."""
-        result = self.widget._is_valid_pdf_file(self.test_non_pdf_path)
-        self.assertFalse(result)
         
-    def test_pdf_file_validation_nonexistent_file(self):
-        """Test validation of nonexistent file."""
-        result = self.widget._is_valid_pdf_file("/nonexistent/file.pdf")
-        self.assertFalse(result)
+    def test_pdf_file_validation_wrong_header(self):
+        """A .pdf file without the %PDF- header is rejected."""
+        fake_pdf_path = os.path.join(self.temp_dir, "fake.pdf")
+        with open(fake_pdf_path, 'wb') as f:
+            f.write(b"<html>not a pdf</html>")
+        result = self.widget._validate_pdf_file(fake_pdf_path)
+        self.assertFalse(result['valid'])
+        self.assertEqual(result['reason'], 'Not a valid PDF file')
         
     def test_comprehensive_pdf_validation_valid(self):
         """Test comprehensive PDF validation with valid file."""
@@ -191,6 +185,20 @@ startxref
         self.assertFalse(self.widget._drag_active)
         event.ignore.assert_called_once()
         
+    def test_drag_enter_checks_names_only(self):
+        """Drag-enter accepts by extension without reading or stat'ing files."""
+        missing_pdf_path = os.path.join(self.temp_dir, "missing.pdf")
+        mime_data = self._create_mime_data([self.test_non_pdf_path, missing_pdf_path])
+        event = self._create_drag_event(mime_data, 'enter')
+        event.acceptProposedAction = Mock()
+        
+        with patch('ui.components.pdf_drop_widget.os.stat') as mock_stat:
+            self.widget.dragEnterEvent(event)
+            
+        mock_stat.assert_not_called()
+        event.acceptProposedAction.assert_called_once()
+        self.assertTrue(self.widget._drag_active)
+        
     def test_drag_enter_no_urls(self):
         """Test drag enter event with no URLs."""
         mime_data = QMimeData()  # Empty mime data
@@ -253,6 +261,7 @@ startxref
         event.acceptProposedAction = Mock()
         
         self.widget.dropEvent(event)
+        self._wait_for_copies()
         
         self.assertFalse(self.widget._drag_active)
         event.acceptProposedAction.assert_called_once()
@@ -294,12 +303,82 @@ startxref
         event.acceptProposedAction = Mock()
         
         self.widget.dropEvent(event)
+        self._wait_for_copies()
         
         # Should have 2 successful drops and 1 rejection
         self.assertEqual(self.widget.pdf_dropped.emit.call_count, 2)
         self.assertEqual(self.widget.pdf_drop_rejected.emit.call_count, 1)
         self.assertEqual(self.widget.pdf_preprocess_requested.emit.call_count, 2)
         
+    def test_drop_event_same_file_twice_gets_unique_names(self):
+        """Parallel copies of one file never collide on a name."""
+        mime_data = self._create_mime_data([self.test_pdf_path, self.test_pdf_path])
+        event = self._create_drag_event(mime_data, 'drop')
+        
+        dropped = []
+        self.widget.pdf_dropped.connect(dropped.append)
+        
+        with patch.object(self.widget, 'refresh_pdf_list') as mock_refresh:
+            self.widget.dropEvent(event)
+            self._wait_for_copies()
+            
+        # Each copy adds its own row instead of rescanning the directory
+        mock_refresh.assert_not_called()
+        self.assertEqual(len(dropped), 2)
+        self.assertEqual(len(set(dropped)), 2)
+        for path in dropped:
+            self.assertTrue(os.path.exists(path))
+        self.assertEqual(self.widget._copy_pool.activeThreadCount(), 0)
+        self.assertEqual(self.widget.count(), 2)
+        
+    def test_drop_event_copy_failure_rejects_file(self):
+        """A copy that fails on the pool thread rejects the dropped file."""
+        mime_data = self._create_mime_data([self.test_pdf_path])
+        event = self._create_drag_event(mime_data, 'drop')
+        
+        rejected = []
+        self.widget.pdf_drop_rejected.connect(lambda path, reason: rejected.append(path))
+        
+        with patch('ui.components.pdf_drop_widget.shutil.copy2', side_effect=OSError("disk full")):
+            self.widget.dropEvent(event)
+            self._wait_for_copies()
+            
+        self.assertEqual(rejected, [self.test_pdf_path])
+        self.assertEqual(self.widget._copy_pool.activeThreadCount(), 0)
+        # The partial copy is removed again
+        self.assertEqual(os.listdir(os.path.join(self.temp_dir, "pdf")), [])
+        
+    def test_refresh_during_copy_hides_partial_file(self):
+        """A copy still running is not listed, on screen or on disk."""
+        copy_started = threading.Event()
+        release_copy = threading.Event()
+        real_copy2 = shutil.copy2
+        
+        def slow_copy2(source, dest):
+            with open(dest, 'wb') as f:
+                f.write(b"%PDF-")  # Partial content
+            copy_started.set()
+            release_copy.wait(5)
+            return real_copy2(source, dest)
+            
+        mime_data = self._create_mime_data([self.test_pdf_path])
+        event = self._create_drag_event(mime_data, 'drop')
+        pdf_dir = os.path.join(self.temp_dir, "pdf")
+        
+        with patch('ui.components.pdf_drop_widget.shutil.copy2', side_effect=slow_copy2):
+            self.widget.dropEvent(event)
+            try:
+                self.assertTrue(copy_started.wait(5))
+                self.widget.refresh_pdf_list()
+                self.assertEqual(self.widget.count(), 0)
+                self.assertFalse([name for name in os.listdir(pdf_dir) if name.endswith('.pdf')])
+            finally:
+                release_copy.set()
+                self._wait_for_copies()
+                
+        self.assertEqual(self.widget.count(), 1)
+        self.assertEqual(os.listdir(pdf_dir), ["test.pdf"])
+        
     def test_copy_pdf_to_data_dir(self):
         """Test copying PDF to data directory."""
         result_path = self.widget._copy_pdf_to_data_dir(self.test_pdf_path)
@@ -318,6 +397,31 @@ startxref
         self.assertNotEqual(result_path_1, result_path_2)
         self.assertTrue(result_path_2.endswith("test_1.pdf"))
         
+    def test_copy_pdf_never_overwrites_existing_file(self):
+        """A name already taken on disk is skipped, even if created meanwhile."""
+        pdf_dir = os.path.join(self.temp_dir, "pdf")
+        os.makedirs(pdf_dir)
+        existing_path = os.path.join(pdf_dir, "test.pdf")
+        with open(existing_path, 'wb') as f:
+            f.write(b"existing")
+            
+        result_path = self.widget._copy_pdf_to_data_dir(self.test_pdf_path)
+        
+        self.assertEqual(os.path.basename(result_path), "test_1.pdf")
+        with open(existing_path, 'rb') as f:
+            self.assertEqual(f.read(), b"existing")
+            
+    def test_copy_pdf_without_hard_links(self):
+        """Filesystems without hard links still get a unique, complete copy."""
+        self.widget._copy_pdf_to_data_dir(self.test_pdf_path)
+        with patch('ui.components.pdf_drop_widget.os.link', side_effect=PermissionError):
+            result_path = self.widget._copy_pdf_to_data_dir(self.test_pdf_path)
+            
+        self.assertEqual(os.path.basename(result_path), "test_1.pdf")
+        with open(result_path, 'rb') as copied, open(self.test_pdf_path, 'rb') as original:
+            self.assertEqual(copied.read(), original.read())
+        self.assertEqual(sorted(os.listdir(os.path.dirname(result_path))), ["test.pdf", "test_1.pdf"])
+        
     def test_copy_pdf_invalid_source(self):
         """Test copying with invalid source path."""
         with self.assertRaises(ValueError):
@@ -333,6 +437,16 @@ startxref
         self.assertEqual(self.widget.count(), 1)
         self.assertEqual(self.widget.item(0).text(), "test.pdf")
         
+    def test_refresh_pdf_list_skips_directories(self):
+        """Test that directories named like PDFs are not listed."""
+        self.widget._copy_pdf_to_data_dir(self.test_pdf_path)
+        os.makedirs(os.path.join(self.temp_dir, "pdf", "folder.pdf"))
+        
+        self.widget.refresh_pdf_list()
+        
+        self.assertEqual([self.widget.item(i).text() for i in range(self.widget.count())],
+                         ["test.pdf"])
+        
     def test_get_selected_pdf(self):
         """Test getting selected PDF path."""
         # Copy a PDF and refresh list
@@ -388,21 +502,37 @@ startxref
         
         self.assertFalse(self.widget.property("dragActive"))
         
-    @patch('os.path.getsize')
-    def test_validate_pdf_file_size_limits(self, mock_getsize):
+    def test_validate_pdf_file_size_limits(self):
         """Test PDF validation with file size limits."""
         # Test empty file
-        mock_getsize.return_value = 0
-        result = self.widget._validate_pdf_file(self.test_pdf_path)
+        empty_path = os.path.join(self.temp_dir, "empty.pdf")
+        open(empty_path, 'wb').close()
+        result = self.widget._validate_pdf_file(empty_path)
         self.assertFalse(result['valid'])
         self.assertEqual(result['reason'], 'File is empty')
         
-        # Test file too large
-        mock_getsize.return_value = 101 * 1024 * 1024  # 101MB
-        result = self.widget._validate_pdf_file(self.test_pdf_path)
+        # Test file too large (sparse, so nothing is actually written)
+        large_path = os.path.join(self.temp_dir, "large.pdf")
+        with open(large_path, 'wb') as f:
+            f.truncate(101 * 1024 * 1024)  # 101MB
+        result = self.widget._validate_pdf_file(large_path)
         self.assertFalse(result['valid'])
         self.assertEqual(result['reason'], 'File too large (>100MB)')
         
+    def test_validation_reads_header_once(self):
+        """Validating an unchanged file again does not re-read its header."""
+        with patch('builtins.open', wraps=open) as mock_open:
+            self.assertTrue(self.widget._validate_pdf_file(self.test_pdf_path)['valid'])
+            self.assertTrue(self.widget._validate_pdf_file(self.test_pdf_path)['valid'])
+        self.assertEqual(mock_open.call_count, 1)
+        
+    def test_validation_rereads_changed_file(self):
+        """A file rewritten on disk is validated again, not served from cache."""
+        self.assertTrue(self.widget._validate_pdf_file(self.test_pdf_path)['valid'])
+        with open(self.test_pdf_path, 'wb') as f:
+            f.write(b"no longer a pdf")
+        self.assertFalse(self.widget._validate_pdf_file(self.test_pdf_path)['valid'])
+        
     def test_error_handling_in_drag_events(self):
         """Test error handling in drag events."""
         # Test with None event
@@ -8,12 +8,7 @@ import unittest
 import os
 import tempfile
 import shutil
-from unittest.mock import Mock, patch, MagicMock
-from PyQt5.QtCore import QObject
-from PyQt5.QtTest import QTest
-
-import sys
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from unittest.mock import Mock, patch
 
 from scripts.ui.handlers.pdf_handler import PDFHandler, ProcessingState
 from scripts.ui.handlers.process_handler import ProcessManager
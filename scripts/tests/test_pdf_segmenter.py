@@ -1,6 +1,5 @@
 import unittest
-from unittest.mock import patch, MagicMock
-import os
+from unittest.mock import patch
 
 class TestPDFSegmenterSmoke(unittest.TestCase):
     @patch('pdf_segmenter.fitz')
@@ -2,94 +2,98 @@
 Unit tests for ProcessManager class.
 """
 
-import unittest
-from unittest.mock import Mock, patch, MagicMock
-import sys
-import os
+import pytest
+from unittest.mock import Mock, patch
 from PyQt5.QtCore import QProcess, QTimer
 from PyQt5.QtTest import QTest, QSignalSpy
-from PyQt5.QtWidgets import QApplication
-
-# Add the scripts directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from ui.handlers.process_handler import ProcessManager, ProcessState, ProcessInfo
 
 
-class TestProcessManager(unittest.TestCase):
+def _install_mock(pm, pid="test_id", state=ProcessState.RUNNING):
+    """Register a mock QProcess and matching ProcessInfo on a ProcessManager."""
+    mock = Mock()
+    pm.active_processes[pid] = mock
+    pm.process_info[pid] = ProcessInfo(pid, "echo", ["test"], None, state)
+    return mock
+
+
+class TestProcessManager:
     """Test cases for ProcessManager."""
     
-    @classmethod
-    def setUpClass(cls):
-        """Set up test class."""
-        if not QApplication.instance():
-            cls.app = QApplication([])
-        else:
-            cls.app = QApplication.instance()
-    
-    def setUp(self):
-        """Set up test case."""
+    @pytest.fixture(autouse=True)
+    def _setup_process_manager(self, qapp):
+        """Provide a fresh ProcessManager for each test."""
         self.process_manager = ProcessManager(auto_process_queue=False)
-        
-    def tearDown(self):
-        """Clean up test case."""
+        yield self.process_manager
         self.process_manager.cleanup()
         
     def test_initialization(self):
         """Test ProcessManager initialization."""
-        self.assertEqual(len(self.process_manager.active_processes), 0)
-        self.assertEqual(len(self.process_manager.process_queue), 0)
-        self.assertEqual(len(self.process_manager.process_info), 0)
-        self.assertEqual(self.process_manager.max_concurrent_processes, 1)
-        self.assertIsInstance(self.process_manager.queue_timer, QTimer)
+        pm = self.process_manager
+        assert (len(pm.active_processes), len(pm.process_queue), len(pm.process_info)) == (0, 0, 0)
+        assert pm.max_concurrent_processes == 1
+        assert isinstance(self.process_manager.queue_timer, QTimer)
         
     def test_queue_process(self):
         """Test process queuing."""
         # Test queuing a process
         process_id = self.process_manager.queue_process("echo", ["test"])
         
-        self.assertIsNotNone(process_id)
-        self.assertEqual(len(self.process_manager.process_queue), 1)
-        self.assertIn(process_id, self.process_manager.process_info)
-        self.assertEqual(self.process_manager.process_info[process_id].state, ProcessState.QUEUED)
+        assert process_id is not None
+        assert len(self.process_manager.process_queue) == 1
+        assert process_id in self.process_manager.process_info
+        assert self.process_manager.process_info[process_id].state == ProcessState.QUEUED
         
     def test_queue_process_with_custom_id(self):
         """Test queuing a process with custom ID."""
         custom_id = "test_process_123"
         process_id = self.process_manager.queue_process("echo", ["test"], process_id=custom_id)
         
-        self.assertEqual(process_id, custom_id)
-        self.assertIn(custom_id, self.process_manager.process_info)
+        assert process_id == custom_id
+        assert custom_id in self.process_manager.process_info
         
     @patch('ui.handlers.process_handler.QProcess')
     def test_start_process_success(self, mock_qprocess_class):
         """Test successful process start."""
         # Mock QProcess instance
         mock_process = Mock()
-        mock_process.waitForStarted.return_value = True
         mock_qprocess_class.return_value = mock_process
+        started_spy = QSignalSpy(self.process_manager.process_started)
         
         # Start process
         success = self.process_manager.start_process("test_id", "echo", ["test"])
         
-        self.assertTrue(success)
-        self.assertIn("test_id", self.process_manager.active_processes)
-        self.assertIn("test_id", self.process_manager.process_info)
-        self.assertEqual(self.process_manager.process_info["test_id"].state, ProcessState.RUNNING)
+        assert success
+        mock_process.waitForStarted.assert_not_called()
+        assert len(started_spy) == 0
+        
+        # Emit the started signal on the mock
+        mock_process.started.connect.call_args[0][0]()
+        
+        assert len(started_spy) == 1
+        assert started_spy[0][0] == "test_id"
+        assert "test_id" in self.process_manager.active_processes
+        assert self.process_manager.process_info["test_id"].state == ProcessState.RUNNING
         
     @patch('ui.handlers.process_handler.QProcess')
     def test_start_process_failure(self, mock_qprocess_class):
         """Test process start failure."""
         # Mock QProcess instance
         mock_process = Mock()
-        mock_process.waitForStarted.return_value = False
         mock_qprocess_class.return_value = mock_process
+        finished_spy = QSignalSpy(self.process_manager.process_finished)
         
         # Start process
         success = self.process_manager.start_process("test_id", "echo", ["test"])
+        assert success
+        
+        # Emit the errorOccurred signal on the mock
+        mock_process.errorOccurred.connect.call_args[0][0](mock_qprocess_class.FailedToStart)
         
-        self.assertFalse(success)
-        self.assertNotIn("test_id", self.process_manager.active_processes)
+        assert "test_id" not in self.process_manager.active_processes
+        assert self.process_manager.process_info["test_id"].state == ProcessState.FAILED
+        assert len(finished_spy) == 1
         
     def test_start_process_duplicate_id(self):
         """Test starting process with duplicate ID."""
@@ -100,7 +104,7 @@ class TestProcessManager(unittest.TestCase):
         # Try to start another process with same ID
         success = self.process_manager.start_process("test_id", "echo", ["test"])
         
-        self.assertFalse(success)
+        assert not success
         
     def test_max_concurrent_processes(self):
         """Test maximum concurrent processes limit."""
@@ -114,7 +118,7 @@ class TestProcessManager(unittest.TestCase):
         # Try to start another process
         success = self.process_manager.start_process("test_id", "echo", ["test"])
         
-        self.assertFalse(success)
+        assert not success
         
     def test_cancel_queued_process(self):
         """Test cancelling a queued process."""
@@ -124,88 +128,49 @@ class TestProcessManager(unittest.TestCase):
         # Cancel it
         success = self.process_manager.cancel_process(process_id)
         
-        self.assertTrue(success)
-        self.assertEqual(len(self.process_manager.process_queue), 0)
-        self.assertEqual(self.process_manager.process_info[process_id].state, ProcessState.CANCELLED)
+        assert success
+        assert len(self.process_manager.process_queue) == 0
+        assert self.process_manager.process_info[process_id].state == ProcessState.CANCELLED
         
     def test_cancel_running_process(self):
         """Test cancelling a running process."""
         # Add a mock process to active processes
-        mock_process = Mock()
-        mock_process.terminate.return_value = None
-        mock_process.waitForFinished.return_value = True
-        self.process_manager.active_processes["test_id"] = mock_process
-        self.process_manager.process_info["test_id"] = ProcessInfo(
-            process_id="test_id",
-            command="echo",
-            args=["test"],
-            working_dir=None,
-            state=ProcessState.RUNNING
-        )
+        mock_process = _install_mock(self.process_manager)
         
         # Cancel it
         success = self.process_manager.cancel_process("test_id")
         
-        self.assertTrue(success)
+        assert success
         mock_process.terminate.assert_called_once()
         
     def test_stop_process(self):
         """Test stopping a process."""
         # Add a mock process to active processes
-        mock_process = Mock()
-        mock_process.terminate.return_value = None
-        mock_process.waitForFinished.return_value = True
-        self.process_manager.active_processes["test_id"] = mock_process
-        self.process_manager.process_info["test_id"] = ProcessInfo(
-            process_id="test_id",
-            command="echo",
-            args=["test"],
-            working_dir=None,
-            state=ProcessState.RUNNING
-        )
+        mock_process = _install_mock(self.process_manager)
         
         # Stop it
         success = self.process_manager.stop_process("test_id")
         
-        self.assertTrue(success)
+        assert success
         mock_process.terminate.assert_called_once()
-        self.assertEqual(self.process_manager.process_info["test_id"].state, ProcessState.CANCELLED)
+        assert self.process_manager.process_info["test_id"].state == ProcessState.CANCELLED
         
     def test_stop_process_force(self):
         """Test force stopping a process."""
         # Add a mock process to active processes
-        mock_process = Mock()
-        mock_process.kill.return_value = None
-        self.process_manager.active_processes["test_id"] = mock_process
-        self.process_manager.process_info["test_id"] = ProcessInfo(
-            process_id="test_id",
-            command="echo",
-            args=["test"],
-            working_dir=None,
-            state=ProcessState.RUNNING
-        )
+        mock_process = _install_mock(self.process_manager)
         
         # Force stop it
         success = self.process_manager.stop_process("test_id", force=True)
         
-        self.assertTrue(success)
+        assert success
         mock_process.kill.assert_called_once()
         
     def test_stop_all_processes(self):
         """Test stopping all processes."""
         # Add mock processes
-        mock_process1 = Mock()
-        mock_process1.terminate.return_value = None
-        mock_process1.waitForFinished.return_value = True
-        mock_process1.kill.return_value = None
-        
-        mock_process2 = Mock()
-        mock_process2.terminate.return_value = None
-        mock_process2.waitForFinished.return_value = True
-        mock_process2.kill.return_value = None
-        
-        self.process_manager.active_processes["test1"] = mock_process1
-        self.process_manager.active_processes["test2"] = mock_process2
+        mock_process1 = _install_mock(self.process_manager, "test1")
+        mock_process2 = _install_mock(self.process_manager, "test2")
         
         # Add queued process
         self.process_manager.queue_process("echo", ["test"])
@@ -213,7 +178,7 @@ class TestProcessManager(unittest.TestCase):
         # Stop all
         self.process_manager.stop_all_processes()
         
-        self.assertEqual(len(self.process_manager.process_queue), 0)
+        assert len(self.process_manager.process_queue) == 0
         mock_process1.kill.assert_called_once()
         mock_process2.kill.assert_called_once()
         
@@ -232,11 +197,11 @@ class TestProcessManager(unittest.TestCase):
         # Get info
         retrieved_info = self.process_manager.get_process_info("test_id")
         
-        self.assertEqual(retrieved_info, process_info)
+        assert retrieved_info == process_info
         
         # Test non-existent process
         non_existent = self.process_manager.get_process_info("non_existent")
-        self.assertIsNone(non_existent)
+        assert non_existent is None
         
     def test_get_all_process_info(self):
         """Test getting all process information."""
@@ -253,46 +218,44 @@ class TestProcessManager(unittest.TestCase):
         # Get all info
         all_info = self.process_manager.get_all_process_info()
         
-        self.assertEqual(len(all_info), 1)
-        self.assertIn("test_id", all_info)
-        self.assertEqual(all_info["test_id"], process_info)
+        assert all_info == {"test_id": process_info}
         
     def test_get_queue_length(self):
         """Test getting queue length."""
-        self.assertEqual(self.process_manager.get_queue_length(), 0)
+        assert self.process_manager.get_queue_length() == 0
         
         # Add processes to queue
         self.process_manager.queue_process("echo", ["test1"])
         self.process_manager.queue_process("echo", ["test2"])
         
-        self.assertEqual(self.process_manager.get_queue_length(), 2)
+        assert self.process_manager.get_queue_length() == 2
         
     def test_get_active_process_count(self):
         """Test getting active process count."""
-        self.assertEqual(self.process_manager.get_active_process_count(), 0)
+        assert self.process_manager.get_active_process_count() == 0
         
         # Add mock processes
         mock_process = Mock()
         self.process_manager.active_processes["test1"] = mock_process
         self.process_manager.active_processes["test2"] = mock_process
         
-        self.assertEqual(self.process_manager.get_active_process_count(), 2)
+        assert self.process_manager.get_active_process_count() == 2
         
     def test_is_process_running(self):
         """Test checking if process is running."""
         # Test non-existent process
-        self.assertFalse(self.process_manager.is_process_running("non_existent"))
+        assert not self.process_manager.is_process_running("non_existent")
         
         # Add mock process
         mock_process = Mock()
         mock_process.state.return_value = QProcess.Running
         self.process_manager.active_processes["test_id"] = mock_process
         
-        self.assertTrue(self.process_manager.is_process_running("test_id"))
+        assert self.process_manager.is_process_running("test_id")
         
         # Test not running process
         mock_process.state.return_value = QProcess.NotRunning
-        self.assertFalse(self.process_manager.is_process_running("test_id"))
+        assert not self.process_manager.is_process_running("test_id")
         
     def test_clear_completed_processes(self):
         """Test clearing completed processes."""
@@ -305,26 +268,15 @@ class TestProcessManager(unittest.TestCase):
             state=ProcessState.FINISHED
         )
         
-        running_info = ProcessInfo(
-            process_id="running",
-            command="echo",
-            args=["test"],
-            working_dir=None,
-            state=ProcessState.RUNNING
-        )
-        
         self.process_manager.process_info["completed"] = completed_info
-        self.process_manager.process_info["running"] = running_info
         
         # Add running process to active processes
-        mock_process = Mock()
-        self.process_manager.active_processes["running"] = mock_process
+        _install_mock(self.process_manager, "running")
         
         # Clear completed
         self.process_manager.clear_completed_processes()
         
-        self.assertNotIn("completed", self.process_manager.process_info)
-        self.assertIn("running", self.process_manager.process_info)
+        assert list(self.process_manager.process_info) == ["running"]
         
     def test_handle_stdout(self):
         """Test handling stdout."""
@@ -342,7 +294,42 @@ class TestProcessManager(unittest.TestCase):
         self.process_manager._handle_stdout("test_id")
         
         # Check signal was emitted
-        self.assertEqual(len(spy), 2)  # Two lines of output
+        assert len(spy) == 2  # Two lines of output
+        
+    def test_handle_stdout_coalesces_progress(self):
+        """Test that progress lines are coalesced into one update per flush."""
+        spy = QSignalSpy(self.process_manager.process_progress_updated)
+        
+        mock_process = Mock()
+        mock_output = Mock()
+        mock_output.data.return_value = b"Progress: 10\nProgress: 20\nProgress: 30\n"
+        mock_process.readAllStandardOutput.return_value = mock_output
+        self.process_manager.active_processes["test_id"] = mock_process
+        
+        self.process_manager._handle_stdout("test_id")
+        
+        # Nothing is emitted until the flush timer fires
+        assert len(spy) == 0
+        assert self.process_manager.progress_timer.isActive()
+        
+        self.process_manager._flush_progress()
+        
+        assert len(spy) == 1
+        assert spy[0] == ["test_id", 30, "Progress: 30"]
+        assert not self.process_manager.progress_timer.isActive()
+        
+    def test_handle_finished_flushes_pending_progress(self):
+        """Test that buffered progress is emitted before process_finished."""
+        emitted = []
+        self.process_manager.process_progress_updated.connect(lambda *args: emitted.append("progress"))
+        self.process_manager.process_finished.connect(lambda *args: emitted.append("finished"))
+        
+        _install_mock(self.process_manager)
+        self.process_manager._pending_progress["test_id"] = (50, "Progress: 50")
+        
+        self.process_manager._handle_finished("test_id", 0)
+        
+        assert emitted == ["progress", "finished"]
         
     def test_handle_stderr(self):
         """Test handling stderr."""
@@ -360,61 +347,39 @@ class TestProcessManager(unittest.TestCase):
         self.process_manager._handle_stderr("test_id")
         
         # Check signal was emitted
-        self.assertEqual(len(spy), 1)
+        assert len(spy) == 1
         
     def test_handle_finished_success(self):
         """Test handling successful process completion."""
         # Create signal spy
         spy = QSignalSpy(self.process_manager.process_finished)
         
-        # Add process info
-        process_info = ProcessInfo(
-            process_id="test_id",
-            command="echo",
-            args=["test"],
-            working_dir=None,
-            state=ProcessState.RUNNING
-        )
-        self.process_manager.process_info["test_id"] = process_info
-        
         # Add mock process
-        mock_process = Mock()
-        self.process_manager.active_processes["test_id"] = mock_process
+        _install_mock(self.process_manager)
         
         # Handle finished
         self.process_manager._handle_finished("test_id", 0)
         
         # Check signal was emitted
-        self.assertEqual(len(spy), 1)
-        self.assertEqual(spy[0][0], "test_id")
-        self.assertEqual(spy[0][1], 0)
+        assert len(spy) == 1
+        assert spy[0][0] == "test_id"
+        assert spy[0][1] == 0
         
         # Check process info updated
-        self.assertEqual(self.process_manager.process_info["test_id"].state, ProcessState.FINISHED)
-        self.assertEqual(self.process_manager.process_info["test_id"].exit_code, 0)
+        assert self.process_manager.process_info["test_id"].state == ProcessState.FINISHED
+        assert self.process_manager.process_info["test_id"].exit_code == 0
         
     def test_handle_finished_failure(self):
         """Test handling failed process completion."""
-        # Add process info
-        process_info = ProcessInfo(
-            process_id="test_id",
-            command="echo",
-            args=["test"],
-            working_dir=None,
-            state=ProcessState.RUNNING
-        )
-        self.process_manager.process_info["test_id"] = process_info
-        
         # Add mock process
-        mock_process = Mock()
-        self.process_manager.active_processes["test_id"] = mock_process
+        _install_mock(self.process_manager)
         
         # Handle finished with error
         self.process_manager._handle_finished("test_id", 1)
         
         # Check process info updated
-        self.assertEqual(self.process_manager.process_info["test_id"].state, ProcessState.FAILED)
-        self.assertEqual(self.process_manager.process_info["test_id"].exit_code, 1)
+        assert self.process_manager.process_info["test_id"].state == ProcessState.FAILED
+        assert self.process_manager.process_info["test_id"].exit_code == 1
         
     def test_cleanup_process(self):
         """Test process cleanup."""
@@ -431,14 +396,14 @@ class TestProcessManager(unittest.TestCase):
         self.process_manager._cleanup_process("test_id")
         
         # Check process was removed and cleaned up
-        self.assertNotIn("test_id", self.process_manager.active_processes)
+        assert "test_id" not in self.process_manager.active_processes
         mock_process.deleteLater.assert_called_once()
         
     def test_get_python_executable(self):
         """Test getting Python executable."""
         executable = self.process_manager.get_python_executable()
-        self.assertIsInstance(executable, str)
-        self.assertTrue(len(executable) > 0)
+        assert isinstance(executable, str)
+        assert len(executable) > 0
         
     def test_queue_processing_with_auto_enabled(self):
         """Test automatic queue processing."""
@@ -462,28 +427,19 @@ class TestProcessManager(unittest.TestCase):
             
     def test_process_info_timestamps(self):
         """Test that process info includes timestamps."""
-        # Mock time function
-        with patch('time.time', return_value=1234567890.0):
-            # Add process info
-            process_info = ProcessInfo(
-                process_id="test_id",
-                command="echo",
-                args=["test"],
-                working_dir=None,
-                state=ProcessState.RUNNING
-            )
-            self.process_manager.process_info["test_id"] = process_info
-            
-            # Mock process
-            mock_process = Mock()
-            self.process_manager.active_processes["test_id"] = mock_process
-            
-            # Handle finished
-            self.process_manager._handle_finished("test_id", 0)
-            
-            # Check timestamps were set
-            self.assertIsNotNone(self.process_manager.process_info["test_id"].end_time)
-            self.assertEqual(self.process_manager.process_info["test_id"].end_time, 1234567890.0)
+        # Inject a fixed clock
+        self.process_manager.cleanup()
+        self.process_manager = ProcessManager(auto_process_queue=False, time_fn=lambda: 1234567890.0)
+        
+        # Add mock process
+        _install_mock(self.process_manager)
+        
+        # Handle finished
+        self.process_manager._handle_finished("test_id", 0)
+        
+        # Check timestamps were set
+        assert self.process_manager.process_info["test_id"].end_time is not None
+        assert self.process_manager.process_info["test_id"].end_time == 1234567890.0
             
     def test_process_states(self):
         """Test all process states are handled correctly."""
@@ -491,7 +447,7 @@ class TestProcessManager(unittest.TestCase):
                  ProcessState.FAILED, ProcessState.CANCELLED]
         
         for state in states:
-            self.assertIsInstance(state.value, str)
+            assert isinstance(state.value, str)
             
     def test_empty_queue_signal(self):
         """Test queue empty signal emission."""
@@ -502,7 +458,7 @@ class TestProcessManager(unittest.TestCase):
         self.process_manager._process_queue()
         
         # Check signal was emitted
-        self.assertEqual(len(spy), 1)
+        assert len(spy) == 1
         
     def test_process_output_line_splitting(self):
         """Test that multi-line output is split correctly."""
@@ -520,7 +476,22 @@ class TestProcessManager(unittest.TestCase):
         self.process_manager._handle_stdout("test_id")
         
         # Check that 3 signals were emitted (one for each line)
-        self.assertEqual(len(spy), 3)
+        assert len(spy) == 3
+        
+    def test_process_output_batch_per_read(self):
+        """Test that one stdout read emits its non-empty lines as one batch."""
+        spy = QSignalSpy(self.process_manager.process_output_batch)
+        
+        mock_process = Mock()
+        mock_output = Mock()
+        mock_output.data.return_value = b"line 1\n\n  line 2  \n"
+        mock_process.readAllStandardOutput.return_value = mock_output
+        self.process_manager.active_processes["test_id"] = mock_process
+        
+        self.process_manager._handle_stdout("test_id")
+        
+        assert len(spy) == 1
+        assert spy[0] == ["test_id", ["line 1", "line 2"]]
         
     def test_process_error_line_splitting(self):
         """Test that multi-line error output is split correctly."""
@@ -538,8 +509,8 @@ class TestProcessManager(unittest.TestCase):
         self.process_manager._handle_stderr("test_id")
         
         # Check that 2 signals were emitted (one for each line)
-        self.assertEqual(len(spy), 2)
+        assert len(spy) == 2
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
\ No newline at end of file
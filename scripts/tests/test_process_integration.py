@@ -2,37 +2,28 @@
 Integration tests for ProcessManager with real processes.
 """
 
-import unittest
-import sys
-import os
-import time
-from PyQt5.QtCore import QTimer
+import pytest
+from PyQt5.QtCore import QCoreApplication, QDeadlineTimer, QEventLoop
 from PyQt5.QtTest import QTest, QSignalSpy
-from PyQt5.QtWidgets import QApplication
-
-# Add the scripts directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from ui.handlers.process_handler import ProcessManager, ProcessState
 
 
-class TestProcessManagerIntegration(unittest.TestCase):
+def wait_until(condition, timeout_ms: int):
+    """Process Qt events until condition() is true or the deadline expires."""
+    deadline = QDeadlineTimer(timeout_ms)
+    while not condition() and not deadline.hasExpired():
+        QCoreApplication.processEvents(QEventLoop.WaitForMoreEvents, deadline.remainingTime())
+
+
+class TestProcessManagerIntegration:
     """Integration test cases for ProcessManager with real processes."""
     
-    @classmethod
-    def setUpClass(cls):
-        """Set up test class."""
-        if not QApplication.instance():
-            cls.app = QApplication([])
-        else:
-            cls.app = QApplication.instance()
-    
-    def setUp(self):
-        """Set up test case."""
+    @pytest.fixture(autouse=True)
+    def _setup_process_manager(self, qapp):
+        """Provide a fresh ProcessManager for each test."""
         self.process_manager = ProcessManager()
-        
-    def tearDown(self):
-        """Clean up test case."""
+        yield self.process_manager
         self.process_manager.cleanup()
         
     def test_real_process_execution(self):
@@ -46,28 +37,24 @@ class TestProcessManagerIntegration(unittest.TestCase):
         process_id = "echo_test"
         success = self.process_manager.start_process(process_id, "echo", ["Hello World"])
         
-        self.assertTrue(success)
+        assert success
         
         # Wait for process to complete
-        timeout = 5000  # 5 seconds
-        start_time = time.time()
-        
-        while len(finished_spy) == 0 and (time.time() - start_time) * 1000 < timeout:
-            QTest.qWait(100)
+        wait_until(lambda: len(finished_spy) > 0, 5000)
             
         # Check that process completed
-        self.assertEqual(len(started_spy), 1)
-        self.assertEqual(len(finished_spy), 1)
-        self.assertGreater(len(output_spy), 0)
+        assert len(started_spy) == 1
+        assert len(finished_spy) == 1
+        assert len(output_spy) > 0
         
         # Check exit code
-        self.assertEqual(finished_spy[0][1], 0)  # Exit code should be 0
+        assert finished_spy[0][1] == 0  # Exit code should be 0
         
         # Check process info
         process_info = self.process_manager.get_process_info(process_id)
-        self.assertIsNotNone(process_info)
-        self.assertEqual(process_info.state, ProcessState.FINISHED)
-        self.assertEqual(process_info.exit_code, 0)
+        assert process_info is not None
+        assert process_info.state == ProcessState.FINISHED
+        assert process_info.exit_code == 0
         
     def test_queue_processing_integration(self):
         """Test queue processing with real processes."""
@@ -83,31 +70,27 @@ class TestProcessManagerIntegration(unittest.TestCase):
             process_ids.append(process_id)
             
         # Check that processes are queued
-        self.assertEqual(self.process_manager.get_queue_length(), 3)
+        assert self.process_manager.get_queue_length() == 3
         
         # Wait for all processes to complete
-        timeout = 10000  # 10 seconds
-        start_time = time.time()
-        
-        while len(finished_spy) < 3 and (time.time() - start_time) * 1000 < timeout:
-            QTest.qWait(100)
+        wait_until(lambda: len(finished_spy) >= 3, 10000)
             
         # Wait a bit more for queue_empty signal
         QTest.qWait(200)
             
         # Check that all processes completed
-        self.assertEqual(len(started_spy), 3)
-        self.assertEqual(len(finished_spy), 3)
+        assert len(started_spy) == 3
+        assert len(finished_spy) == 3
         
         # Check that queue is empty
-        self.assertEqual(self.process_manager.get_queue_length(), 0)
+        assert self.process_manager.get_queue_length() == 0
         
         # Check all process info
         for process_id in process_ids:
             process_info = self.process_manager.get_process_info(process_id)
-            self.assertIsNotNone(process_info)
-            self.assertEqual(process_info.state, ProcessState.FINISHED)
-            self.assertEqual(process_info.exit_code, 0)
+            assert process_info is not None
+            assert process_info.state == ProcessState.FINISHED
+            assert process_info.exit_code == 0
             
     def test_process_cancellation_integration(self):
         """Test process cancellation with real processes."""
@@ -115,19 +98,19 @@ class TestProcessManagerIntegration(unittest.TestCase):
         process_id = self.process_manager.queue_process("echo", ["test"])
         
         # Verify it's queued
-        self.assertEqual(self.process_manager.get_queue_length(), 1)
+        assert self.process_manager.get_queue_length() == 1
         
         # Cancel before it starts
         success = self.process_manager.cancel_process(process_id)
-        self.assertTrue(success)
+        assert success
         
         # Verify it's removed from queue
-        self.assertEqual(self.process_manager.get_queue_length(), 0)
+        assert self.process_manager.get_queue_length() == 0
         
         # Check process info
         process_info = self.process_manager.get_process_info(process_id)
-        self.assertIsNotNone(process_info)
-        self.assertEqual(process_info.state, ProcessState.CANCELLED)
+        assert process_info is not None
+        assert process_info.state == ProcessState.CANCELLED
         
     def test_python_executable_integration(self):
         """Test using Python executable to run a script."""
@@ -146,20 +129,16 @@ class TestProcessManagerIntegration(unittest.TestCase):
             ["-c", "print('Hello from Python')"]
         )
         
-        self.assertTrue(success)
+        assert success
         
         # Wait for process to complete
-        timeout = 5000  # 5 seconds
-        start_time = time.time()
-        
-        while len(finished_spy) == 0 and (time.time() - start_time) * 1000 < timeout:
-            QTest.qWait(100)
+        wait_until(lambda: len(finished_spy) > 0, 5000)
             
         # Check that process completed successfully
-        self.assertEqual(len(started_spy), 1)
-        self.assertEqual(len(finished_spy), 1)
-        self.assertEqual(finished_spy[0][1], 0)  # Exit code should be 0
+        assert len(started_spy) == 1
+        assert len(finished_spy) == 1
+        assert finished_spy[0][1] == 0  # Exit code should be 0
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
\ No newline at end of file
@@ -2,384 +2,672 @@
 Integration tests for Progress and Status Management
 
 Tests the integration between status manager, progress widgets, and handlers.
+The test classes share no state, so the module can be run in parallel:
+
+    pytest scripts/tests/test_progress_status_integration.py -n auto --dist loadfile
 """
 
-import unittest
-import os
-import sys
-from unittest.mock import Mock, patch, MagicMock
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer
-from PyQt5.QtTest import QTest
+import pytest
+from unittest.mock import Mock, create_autospec, patch
+
+pytest.importorskip("PyQt5")
+
+from scripts.ui.utils.status_manager import (
+    StatusManager, StatusLevel, ProgressType, ProgressInfo, BusyIndicator, StatusMessage
+)
+
+# Widget modules are imported by the fixtures and tests that use them, so
+# selecting only the StatusManager tests does not load the widget tree.
+
+# One QApplication per (xdist worker) process, provided by conftest.py
+pytestmark = pytest.mark.usefixtures("qapp")
+
+# Shared, read-only widget test data; copy before mutating
+_PROGRESS_INFO = ProgressInfo(
+    id="test_progress",
+    title="Test Progress",
+    progress_type=ProgressType.DETERMINATE,
+    current=25,
+    maximum=100,
+    message="Processing..."
+)
+
+_BUSY_INFO = BusyIndicator(
+    id="test_busy",
+    operation="Test Operation",
+    message="Please wait..."
+)
+
+_STATUS_MESSAGE = StatusMessage(
+    id="test_status",
+    message="Test status message",
+    level=StatusLevel.INFO,
+    timestamp=None  # Will be set automatically
+)
+
+
+def _add_status_message(sm):
+    """Adding a status message stores it with its level and source."""
+    messages = sm.status_messages
+    message_id = sm.add_status_message("Test message", StatusLevel.INFO, "TestSource")
+    
+    assert message_id is not None
+    assert message_id in messages
+    
+    message = messages[message_id]
+    assert message.message == "Test message"
+    assert message.level == StatusLevel.INFO
+    assert message.source == "TestSource"
+
+
+def _add_status_messages(sm):
+    """Adding messages in bulk stores them all and emits one signal."""
+    batches = []
+    sm.status_messages_bulk_added.connect(batches.append)
+    try:
+        message_ids = sm.add_status_messages([
+            ("First", StatusLevel.INFO, "TestSource"),
+            ("Second", StatusLevel.WARNING, None),
+        ])
+    finally:
+        sm.status_messages_bulk_added.disconnect(batches.append)
+    
+    messages = sm.status_messages
+    assert batches == [message_ids]
+    assert [messages[message_id].message for message_id in message_ids] == ["First", "Second"]
+    assert messages[message_ids[1]].level == StatusLevel.WARNING
+    
+    # Batch options apply to every message of the batch
+    pinned_ids = sm.add_status_messages([("Pinned", StatusLevel.INFO, None)], persistent=True)
+    assert messages[pinned_ids[0]].persistent
+    assert pinned_ids[0] not in sm.message_order
+    
+    temporary_ids = sm.add_status_messages(
+        [("A", StatusLevel.INFO, None), ("B", StatusLevel.INFO, None)], auto_remove_ms=60000
+    )
+    assert set(temporary_ids) <= set(sm.auto_remove_deadlines)
+    assert sm.auto_remove_timer.isActive()
+
+
+def _update_status_message(sm):
+    """Updating a status message changes its text and level."""
+    message_id = sm.add_status_message("Original message")
+    
+    assert sm.update_status_message(message_id, "Updated message", StatusLevel.SUCCESS)
+    message = sm.status_messages[message_id]
+    assert message.message == "Updated message"
+    assert message.level == StatusLevel.SUCCESS
+
+
+def _remove_status_message(sm):
+    """Removing a status message drops it from the manager."""
+    message_id = sm.add_status_message("Test message")
+    
+    assert sm.remove_status_message(message_id)
+    assert message_id not in sm.status_messages
+
+
+def _evict_oldest_messages(sm):
+    """Past the cap, the oldest non-persistent message is evicted."""
+    removed = []
+    sm.status_message_removed.connect(removed.append)
+    sm.max_status_messages = 2
+    try:
+        persistent_id = sm.add_status_message("Pinned", persistent=True)
+        first_id = sm.add_status_message("First")
+        second_id = sm.add_status_message("Second")
+        third_id = sm.add_status_message("Third")
+    finally:
+        sm.max_status_messages = 500
+        sm.status_message_removed.disconnect(removed.append)
+    
+    messages = sm.status_messages
+    assert removed == [first_id]
+    assert first_id not in messages
+    assert {persistent_id, second_id, third_id} <= messages.keys()
+
+
+def _auto_remove_messages(sm):
+    """Temporary messages are removed once their delay has elapsed."""
+    from PyQt5.QtTest import QTest
+    
+    removed = []
+    sm.status_message_removed.connect(removed.append)
+    try:
+        late_id = sm.add_status_message("Late", auto_remove_ms=40)
+        early_id = sm.add_status_message("Early", auto_remove_ms=10)
+        dismissed_id = sm.add_status_message("Dismissed", auto_remove_ms=20)
+        kept_id = sm.add_status_message("Kept")
+        sm.remove_status_message(dismissed_id)
+        
+        QTest.qWait(100)
+    finally:
+        sm.status_message_removed.disconnect(removed.append)
+    
+    assert removed == [dismissed_id, early_id, late_id]
+    assert list(sm.status_messages) == [kept_id]
+    assert not sm.auto_remove_timer.isActive()
+
+
+def _cleanup_old_messages(sm):
+    """Periodic cleanup drops stale non-persistent messages only."""
+    stale_id = sm.add_status_message("Stale message")
+    persistent_id = sm.add_status_message("Pinned message", persistent=True)
+    fresh_id = sm.add_status_message("Fresh message")
+    
+    messages = sm.status_messages
+    messages[stale_id].timestamp -= 10 * 60
+    messages[persistent_id].timestamp -= 10 * 60
+    sm._cleanup_old_messages()
+    
+    assert stale_id not in messages
+    assert persistent_id in messages
+    assert fresh_id in messages
+
+
+def _start_progress(sm):
+    """Starting progress registers an active indicator."""
+    active_progress = sm.active_progress
+    progress_id = sm.start_progress("Test Progress", ProgressType.DETERMINATE, 100, "Starting...")
+    
+    assert progress_id is not None
+    assert progress_id in active_progress
+    
+    progress = active_progress[progress_id]
+    assert progress.title == "Test Progress"
+    assert progress.progress_type == ProgressType.DETERMINATE
+    assert progress.maximum == 100
+    assert progress.message == "Starting..."
+
+
+def _update_progress(sm):
+    """Updating progress changes its value and message."""
+    progress_id = sm.start_progress("Test Progress")
+    
+    assert sm.update_progress(progress_id, current=50, message="Half way done")
+    progress = sm.active_progress[progress_id]
+    assert progress.current == 50
+    assert progress.message == "Half way done"
+
 
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+def _finish_progress(sm):
+    """Finishing progress moves it to the history."""
+    progress_id = sm.start_progress("Test Progress")
+    
+    assert sm.finish_progress(progress_id, "Completed!")
+    assert progress_id not in sm.active_progress
+    assert len(sm.progress_history) == 1
+
+
+def _start_busy_indicator(sm):
+    """Starting a busy indicator registers it."""
+    busy_indicators = sm.busy_indicators
+    busy_id = sm.start_busy_indicator("Processing", "Please wait...")
+    
+    assert busy_id is not None
+    assert busy_id in busy_indicators
+    
+    busy = busy_indicators[busy_id]
+    assert busy.operation == "Processing"
+    assert busy.message == "Please wait..."
 
-from scripts.ui.utils.status_manager import StatusManager, StatusLevel, ProgressType
-from scripts.ui.components.progress_widgets import ProgressPanel, ProgressWidget, BusyWidget
-from scripts.ui.components.right_panel import RightPanel
-from scripts.ui.components.main_window import MainWindow
+
+def _finish_busy_indicator(sm):
+    """Finishing a busy indicator removes it."""
+    busy_id = sm.start_busy_indicator("Processing")
+    
+    assert sm.finish_busy_indicator(busy_id)
+    assert busy_id not in sm.busy_indicators
+
+
+def _is_busy(sm):
+    """The manager is busy while progress or busy indicators are active."""
+    assert not sm.is_busy()
+    
+    # Add progress indicator
+    progress_id = sm.start_progress("Test")
+    assert sm.is_busy()
+    
+    # Finish progress
+    sm.finish_progress(progress_id)
+    assert not sm.is_busy()
+    
+    # Add busy indicator
+    busy_id = sm.start_busy_indicator("Test")
+    assert sm.is_busy()
+    
+    # Finish busy
+    sm.finish_busy_indicator(busy_id)
+    assert not sm.is_busy()
+    
+    # Restarting an active indicator does not count it twice
+    sm.start_busy_indicator("Test", busy_id="same")
+    sm.start_busy_indicator("Test again", busy_id="same")
+    sm.finish_busy_indicator("same")
+    assert not sm.is_busy()
 
 
-class TestStatusManager(unittest.TestCase):
+def _reset(sm):
+    """Resetting drops every message, progress and busy indicator."""
+    sm.add_status_message("Pinned", StatusLevel.WARNING, persistent=True)
+    sm.add_status_message("Temporary", auto_remove_ms=60000)
+    progress_id = sm.start_progress("Test")
+    sm.finish_progress(progress_id)
+    sm.start_progress("Running")
+    sm.start_busy_indicator("Test")
+    
+    sm.reset()
+    
+    assert not sm.get_status_messages()
+    assert not sm.status_history
+    assert not sm.progress_history
+    assert not sm.is_busy()
+    assert not sm.auto_remove_timer.isActive()
+    assert sm.get_ui_state()['status_message_count'] == 0
+
+
+_STATUS_MANAGER_OPS = [
+    _add_status_message,
+    _add_status_messages,
+    _update_status_message,
+    _remove_status_message,
+    _evict_oldest_messages,
+    _auto_remove_messages,
+    _cleanup_old_messages,
+    _start_progress,
+    _update_progress,
+    _finish_progress,
+    _start_busy_indicator,
+    _finish_busy_indicator,
+    _is_busy,
+    _reset,
+]
+
+
+@pytest.fixture(scope="class")
+def class_status_manager(qapp):
+    """Share one StatusManager across the operations of a test class."""
+    status_manager = StatusManager()
+    yield status_manager
+    status_manager.cleanup()
+
+
+@pytest.fixture
+def status_manager(class_status_manager):
+    """Provide the shared StatusManager with state from earlier tests cleared."""
+    class_status_manager.reset()
+    return class_status_manager
+
+
+class TestStatusManager:
     """Test the StatusManager class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.status_manager = StatusManager()
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.status_manager.cleanup()
-        
-    def test_add_status_message(self):
-        """Test adding status messages."""
-        message_id = self.status_manager.add_status_message(
-            "Test message", StatusLevel.INFO, "TestSource"
-        )
-        
-        self.assertIsNotNone(message_id)
-        self.assertIn(message_id, self.status_manager.status_messages)
-        
-        message = self.status_manager.status_messages[message_id]
-        self.assertEqual(message.message, "Test message")
-        self.assertEqual(message.level, StatusLevel.INFO)
-        self.assertEqual(message.source, "TestSource")
-        
-    def test_update_status_message(self):
-        """Test updating status messages."""
-        message_id = self.status_manager.add_status_message("Original message")
-        
-        success = self.status_manager.update_status_message(
-            message_id, "Updated message", StatusLevel.SUCCESS
-        )
-        
-        self.assertTrue(success)
-        message = self.status_manager.status_messages[message_id]
-        self.assertEqual(message.message, "Updated message")
-        self.assertEqual(message.level, StatusLevel.SUCCESS)
-        
-    def test_remove_status_message(self):
-        """Test removing status messages."""
-        message_id = self.status_manager.add_status_message("Test message")
-        
-        success = self.status_manager.remove_status_message(message_id)
-        
-        self.assertTrue(success)
-        self.assertNotIn(message_id, self.status_manager.status_messages)
-        
-    def test_start_progress(self):
-        """Test starting progress indicators."""
-        progress_id = self.status_manager.start_progress(
-            "Test Progress", ProgressType.DETERMINATE, 100, "Starting..."
-        )
-        
-        self.assertIsNotNone(progress_id)
-        self.assertIn(progress_id, self.status_manager.active_progress)
-        
-        progress = self.status_manager.active_progress[progress_id]
-        self.assertEqual(progress.title, "Test Progress")
-        self.assertEqual(progress.progress_type, ProgressType.DETERMINATE)
-        self.assertEqual(progress.maximum, 100)
-        self.assertEqual(progress.message, "Starting...")
-        
-    def test_update_progress(self):
-        """Test updating progress indicators."""
-        progress_id = self.status_manager.start_progress("Test Progress")
-        
-        success = self.status_manager.update_progress(
-            progress_id, current=50, message="Half way done"
-        )
-        
-        self.assertTrue(success)
-        progress = self.status_manager.active_progress[progress_id]
-        self.assertEqual(progress.current, 50)
-        self.assertEqual(progress.message, "Half way done")
-        
-    def test_finish_progress(self):
-        """Test finishing progress indicators."""
-        progress_id = self.status_manager.start_progress("Test Progress")
-        
-        success = self.status_manager.finish_progress(progress_id, "Completed!")
-        
-        self.assertTrue(success)
-        self.assertNotIn(progress_id, self.status_manager.active_progress)
-        self.assertEqual(len(self.status_manager.progress_history), 1)
-        
-    def test_start_busy_indicator(self):
-        """Test starting busy indicators."""
-        busy_id = self.status_manager.start_busy_indicator(
-            "Processing", "Please wait..."
-        )
-        
-        self.assertIsNotNone(busy_id)
-        self.assertIn(busy_id, self.status_manager.busy_indicators)
-        
-        busy = self.status_manager.busy_indicators[busy_id]
-        self.assertEqual(busy.operation, "Processing")
-        self.assertEqual(busy.message, "Please wait...")
-        
-    def test_finish_busy_indicator(self):
-        """Test finishing busy indicators."""
-        busy_id = self.status_manager.start_busy_indicator("Processing")
-        
-        success = self.status_manager.finish_busy_indicator(busy_id)
-        
-        self.assertTrue(success)
-        self.assertNotIn(busy_id, self.status_manager.busy_indicators)
-        
-    def test_is_busy(self):
-        """Test checking if system is busy."""
-        self.assertFalse(self.status_manager.is_busy())
-        
-        # Add progress indicator
-        progress_id = self.status_manager.start_progress("Test")
-        self.assertTrue(self.status_manager.is_busy())
-        
-        # Finish progress
-        self.status_manager.finish_progress(progress_id)
-        self.assertFalse(self.status_manager.is_busy())
-        
-        # Add busy indicator
-        busy_id = self.status_manager.start_busy_indicator("Test")
-        self.assertTrue(self.status_manager.is_busy())
-        
-        # Finish busy
-        self.status_manager.finish_busy_indicator(busy_id)
-        self.assertFalse(self.status_manager.is_busy())
+    @pytest.mark.parametrize("op", _STATUS_MANAGER_OPS, ids=lambda op: op.__name__.lstrip('_'))
+    def test_operation(self, status_manager, op):
+        """Run one StatusManager operation against a clean manager."""
+        op(status_manager)
+
 
+@pytest.fixture(scope="module")
+def progress_widgets():
+    """Import the progress widgets module on first use."""
+    from scripts.ui.components import progress_widgets
+    return progress_widgets
 
-class TestProgressWidgets(unittest.TestCase):
+
+class TestProgressWidgets:
     """Test the progress widget components."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        from scripts.ui.utils.status_manager import ProgressInfo, BusyIndicator, StatusMessage
-        
-        # Create test data
-        self.progress_info = ProgressInfo(
-            id="test_progress",
-            title="Test Progress",
-            progress_type=ProgressType.DETERMINATE,
-            current=25,
-            maximum=100,
-            message="Processing..."
-        )
-        
-        self.busy_info = BusyIndicator(
-            id="test_busy",
-            operation="Test Operation",
-            message="Please wait..."
-        )
-        
-        self.status_message = StatusMessage(
-            id="test_status",
-            message="Test status message",
-            level=StatusLevel.INFO,
-            timestamp=None  # Will be set automatically
-        )
-        
-    def test_progress_widget_creation(self):
+    def test_progress_widget_creation(self, progress_widgets):
         """Test creating progress widgets."""
-        widget = ProgressWidget(self.progress_info)
-        widget.initialize()
-        
-        self.assertEqual(widget.progress_info.id, "test_progress")
-        self.assertEqual(widget.progress_info.title, "Test Progress")
+        widget = progress_widgets.ProgressWidget(_PROGRESS_INFO)
         
-        widget.cleanup()
+        assert widget.progress_info.id == "test_progress"
+        assert widget.progress_info.title == "Test Progress"
+        # Child widgets are only built by initialize()
+        assert widget.progress_bar is None
         
-    def test_busy_widget_creation(self):
+    def test_busy_widget_creation(self, progress_widgets):
         """Test creating busy widgets."""
-        widget = BusyWidget(self.busy_info)
-        widget.initialize()
+        widget = progress_widgets.BusyWidget(_BUSY_INFO)
+        
+        assert widget.busy_info.id == "test_busy"
+        assert widget.busy_info.operation == "Test Operation"
+        assert widget.spinner is None
         
-        self.assertEqual(widget.busy_info.id, "test_busy")
-        self.assertEqual(widget.busy_info.operation, "Test Operation")
+    def test_status_style_sheet_cached_per_level(self, progress_widgets, monkeypatch):
+        """Status style sheets are built once per level and styles instance."""
+        from scripts.ui.styles import app_styles
+        widget_class = progress_widgets.StatusMessageWidget
         
-        widget.cleanup()
+        first = widget_class._level_style_sheet(StatusLevel.ERROR)
+        assert widget_class._level_style_sheet(StatusLevel.ERROR) is first
+        assert widget_class._level_style_sheet(StatusLevel.INFO) != first
         
-    def test_progress_panel_management(self):
+        # A refreshed styles instance invalidates the cache
+        monkeypatch.setattr(app_styles, '_styles_instance', app_styles.AppStyles())
+        assert widget_class._level_style_sheet(StatusLevel.ERROR) is not first
+        
+    def test_progress_panel_management(self, progress_widgets):
         """Test progress panel widget management."""
-        panel = ProgressPanel()
+        panel = progress_widgets.ProgressPanel()
         panel.initialize()
         
         # Add progress widget
-        panel.add_progress_widget(self.progress_info)
-        self.assertIn(self.progress_info.id, panel.progress_widgets)
+        panel.add_progress_widget(_PROGRESS_INFO)
+        assert _PROGRESS_INFO.id in panel.progress_widgets
         
         # Add busy widget
-        panel.add_busy_widget(self.busy_info)
-        self.assertIn(self.busy_info.id, panel.busy_widgets)
+        panel.add_busy_widget(_BUSY_INFO)
+        assert _BUSY_INFO.id in panel.busy_widgets
         
         # Add status widget
-        panel.add_status_widget(self.status_message)
-        self.assertIn(self.status_message.id, panel.status_widgets)
+        panel.add_status_widget(_STATUS_MESSAGE)
+        assert _STATUS_MESSAGE.id in panel.status_model
         
         # Remove widgets
-        panel.remove_progress_widget(self.progress_info.id)
-        self.assertNotIn(self.progress_info.id, panel.progress_widgets)
+        panel.remove_progress_widget(_PROGRESS_INFO.id)
+        assert _PROGRESS_INFO.id not in panel.progress_widgets
         
-        panel.remove_busy_widget(self.busy_info.id)
-        self.assertNotIn(self.busy_info.id, panel.busy_widgets)
+        panel.remove_busy_widget(_BUSY_INFO.id)
+        assert _BUSY_INFO.id not in panel.busy_widgets
         
-        panel.remove_status_widget(self.status_message.id)
-        self.assertNotIn(self.status_message.id, panel.status_widgets)
+        panel.remove_status_widget(_STATUS_MESSAGE.id)
+        assert _STATUS_MESSAGE.id not in panel.status_model
         
         panel.cleanup()
+        
+    def test_status_messages_render_through_model(self, progress_widgets):
+        """Status rows live in a list model and are painted by the delegate."""
+        panel = progress_widgets.ProgressPanel()
+        panel.initialize()
+        model = panel.status_model
+        changed = []
+        model.dataChanged.connect(lambda top_left, bottom_right: changed.append(top_left.row()))
+        
+        pinned = StatusMessage(id="pinned", message="Pinned", level=StatusLevel.WARNING,
+                               timestamp=None, persistent=True)
+        model.add_messages([_STATUS_MESSAGE, pinned, _STATUS_MESSAGE])
+        assert model.rowCount() == 2
+        assert panel.status_list_view.indexWidget(model.index(0)) is None
+        
+        updated = StatusMessage(id="pinned", message="Still pinned", level=StatusLevel.ERROR,
+                                timestamp=None, persistent=True)
+        panel.update_status_widget(updated)
+        assert changed == [1]
+        assert model.index(1).data() == "Still pinned"
+        
+        # Paint every row once
+        panel.status_list_view.resize(300, 150)
+        assert not panel.status_list_view.grab().isNull()
+        
+        panel.cleanup()
+        assert model.rowCount() == 0
+        
+    def test_status_model_tracks_rows_after_removal(self, progress_widgets):
+        """Removing a row keeps the id lookup pointing at the right rows."""
+        model = progress_widgets.StatusMessageModel()
+        messages = [StatusMessage(id=f"m{i}", message=f"Message {i}", level=StatusLevel.INFO,
+                                  timestamp=None) for i in range(4)]
+        model.add_messages(messages)
+        
+        assert model.remove_message("m1")
+        assert "m1" not in model
+        assert not model.remove_message("m1")
+        
+        changed = []
+        model.dataChanged.connect(lambda top_left, bottom_right: changed.append(top_left.row()))
+        updated = StatusMessage(id="m3", message="Updated", level=StatusLevel.ERROR, timestamp=None)
+        assert model.update_message(updated)
+        assert changed == [2]
+        assert [model.index(row).data() for row in range(model.rowCount())] == [
+            "Message 0", "Message 2", "Updated"
+        ]
+        
+    def test_animation_timers_run_when_enabled(self, progress_widgets, monkeypatch):
+        """Smoke test the animation timer path that the suite disables."""
+        monkeypatch.setattr(progress_widgets, '_animations_enabled', True)
+        pulse_bar = progress_widgets.PulsingProgressBar()
+        spinner = progress_widgets.BusySpinner()
+        other_spinner = progress_widgets.BusySpinner()
+        
+        assert pulse_bar.pulse_timer.isActive()
+        assert spinner.spin_timer.isActive()
+        # Spinners share one clock rather than owning a timer each
+        assert spinner.spin_timer is other_spinner.spin_timer
+        
+        angle = spinner.angle
+        spinner._clock._tick()
+        assert spinner.angle == (angle + 30) % 360
+        
+        pulse_bar.cleanup()
+        spinner.cleanup()
+        assert not pulse_bar.pulse_timer.isActive()
+        assert other_spinner.spin_timer.isActive()
+        
+        other_spinner.cleanup()
+        assert not other_spinner.spin_timer.isActive()
+
+
+@pytest.fixture(scope="module")
+def pdf_handler_class():
+    """
+    Patch PDFHandler once for the module to avoid file system dependencies.
+    
+    Not autospecced: MainWindow connects to the handler's bound signals and
+    instance attributes, which a class spec cannot provide.
+    """
+    patcher = patch('scripts.ui.handlers.PDFHandler')
+    mock_handler_class = patcher.start()
+    
+    # Configure mock methods
+    mock_handler_class.return_value.initialize.return_value = None
+    mock_handler_class.return_value.set_status_manager.return_value = None
+    
+    yield mock_handler_class
+    patcher.stop()
+
+
+def _build_main_window():
+    """Construct and initialize a MainWindow (PDFHandler must be patched)."""
+    from scripts.ui.components.main_window import MainWindow
+    
+    main_window = MainWindow()
+    main_window.initialize()
+    return main_window
+
+
+@pytest.fixture
+def main_window(qapp, pdf_handler_class):
+    """Provide a freshly constructed MainWindow for construction-time checks."""
+    window = _build_main_window()
+    yield window
+    window.cleanup()
 
 
-class TestRightPanelIntegration(unittest.TestCase):
+@pytest.fixture(scope="module")
+def _module_main_window(qapp, pdf_handler_class):
+    """Build one MainWindow for the module; cleaned up once at teardown."""
+    window = _build_main_window()
+    yield window
+    window.cleanup()
+
+
+@pytest.fixture(scope="session")
+def _session_right_panel(qapp):
+    """Build one RightPanel for the session; cleaned up once at teardown."""
+    from scripts.ui.components.right_panel import RightPanel
+    
+    panel = RightPanel()
+    panel.initialize()
+    yield panel
+    panel.cleanup()
+
+
+@pytest.fixture
+def shared_main_window(_module_main_window):
+    """Provide the shared MainWindow with a clean status manager."""
+    _module_main_window.get_status_manager().reset()
+    return _module_main_window
+
+
+@pytest.fixture
+def shared_right_panel(_session_right_panel):
+    """Provide the shared RightPanel with a clean status manager."""
+    _session_right_panel.get_status_manager().reset()
+    return _session_right_panel
+
+
+@pytest.mark.slow
+class TestRightPanelIntegration:
     """Test right panel integration with status management."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.right_panel = RightPanel()
-        self.right_panel.initialize()
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.right_panel.cleanup()
-        
-    def test_status_manager_integration(self):
+    def test_status_manager_integration(self, shared_right_panel):
         """Test status manager integration."""
-        status_manager = self.right_panel.get_status_manager()
-        self.assertIsNotNone(status_manager)
+        status_manager = shared_right_panel.get_status_manager()
+        assert status_manager is not None
         
         # Add status message
-        message_id = self.right_panel.add_status_message(
+        message_id = shared_right_panel.add_status_message(
             "Test message", StatusLevel.INFO, "TestSource"
         )
-        self.assertIsNotNone(message_id)
+        assert message_id is not None
         
         # Check that message was added to status manager
         messages = status_manager.get_status_messages()
-        self.assertEqual(len(messages), 1)
-        self.assertEqual(messages[0].message, "Test message")
-        
-    def test_progress_indicator_integration(self):
+        assert len(messages) == 1
+        assert messages[0].message == "Test message"
+        
+    def test_bulk_status_messages_update_console_once(self, shared_right_panel):
+        """A batch of status messages reaches the console as one update."""
+        updates = []
+        shared_right_panel.status_changed.connect(updates.append)
+        try:
+            shared_right_panel.get_status_manager().add_status_messages([
+                ("First", StatusLevel.INFO, None),
+                ("Second", StatusLevel.WARNING, None),
+            ])
+        finally:
+            shared_right_panel.status_changed.disconnect(updates.append)
+        
+        assert updates == ["Status: First\nStatus: Second"]
+        
+    def test_progress_indicator_integration(self, shared_right_panel):
         """Test progress indicator integration."""
         # Start progress
-        progress_id = self.right_panel.start_progress_indicator(
+        progress_id = shared_right_panel.start_progress_indicator(
             "Test Progress", ProgressType.DETERMINATE, 100, "Starting..."
         )
-        self.assertIsNotNone(progress_id)
+        assert progress_id is not None
         
         # Update progress
-        success = self.right_panel.update_progress_indicator(
+        success = shared_right_panel.update_progress_indicator(
             progress_id, current=50, message="Half done"
         )
-        self.assertTrue(success)
+        assert success
         
         # Finish progress
-        success = self.right_panel.finish_progress_indicator(
+        success = shared_right_panel.finish_progress_indicator(
             progress_id, "Completed!"
         )
-        self.assertTrue(success)
+        assert success
         
-    def test_busy_indicator_integration(self):
+    def test_busy_indicator_integration(self, shared_right_panel):
         """Test busy indicator integration."""
         # Start busy indicator
-        busy_id = self.right_panel.start_busy_indicator(
+        busy_id = shared_right_panel.start_busy_indicator(
             "Test Operation", "Processing..."
         )
-        self.assertIsNotNone(busy_id)
+        assert busy_id is not None
         
         # Check system is busy
-        self.assertTrue(self.right_panel.is_system_busy())
+        assert shared_right_panel.is_system_busy()
         
         # Finish busy indicator
-        success = self.right_panel.finish_busy_indicator(busy_id)
-        self.assertTrue(success)
+        success = shared_right_panel.finish_busy_indicator(busy_id)
+        assert success
         
         # Check system is no longer busy
-        self.assertFalse(self.right_panel.is_system_busy())
+        assert not shared_right_panel.is_system_busy()
 
 
-class TestMainWindowIntegration(unittest.TestCase):
+@pytest.mark.slow
+class TestMainWindowIntegration:
     """Test main window integration with progress system."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Mock the PDF handler to avoid file system dependencies
-        with patch('scripts.ui.handlers.PDFHandler') as mock_handler_class:
-            self.mock_pdf_handler = Mock()
-            mock_handler_class.return_value = self.mock_pdf_handler
-            
-            # Configure mock methods
-            self.mock_pdf_handler.initialize.return_value = None
-            self.mock_pdf_handler.set_status_manager.return_value = None
-            
-            self.main_window = MainWindow()
-            self.main_window.initialize()
-            
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.main_window.cleanup()
-        
-    def test_status_manager_access(self):
+    @pytest.fixture(autouse=True)
+    def _reset_pdf_handler_mock(self, pdf_handler_class):
+        """Reset mock call history so per-test call assertions hold."""
+        pdf_handler_class.return_value.reset_mock()
+        
+    def test_status_manager_access(self, shared_main_window):
         """Test accessing status manager through main window."""
-        status_manager = self.main_window.get_status_manager()
-        self.assertIsNotNone(status_manager)
+        status_manager = shared_main_window.get_status_manager()
+        assert status_manager is not None
         
-    def test_enhanced_status_message(self):
+    def test_enhanced_status_message(self, shared_main_window):
         """Test adding enhanced status messages."""
-        message_id = self.main_window.add_enhanced_status_message(
+        message_id = shared_main_window.add_enhanced_status_message(
             "Test message", "info", "TestSource"
         )
-        self.assertIsNotNone(message_id)
+        assert message_id is not None
         
-        status_manager = self.main_window.get_status_manager()
+        status_manager = shared_main_window.get_status_manager()
         messages = status_manager.get_status_messages()
-        self.assertEqual(len(messages), 1)
+        assert len(messages) == 1
         
-    def test_progress_operation_lifecycle(self):
+    def test_progress_operation_lifecycle(self, shared_main_window):
         """Test complete progress operation lifecycle."""
         # Start progress operation
-        progress_id = self.main_window.start_progress_operation(
+        progress_id = shared_main_window.start_progress_operation(
             "Test Operation", "Starting...", 100
         )
-        self.assertIsNotNone(progress_id)
+        assert progress_id is not None
         
         # Update progress
-        success = self.main_window.update_progress_operation(
+        success = shared_main_window.update_progress_operation(
             progress_id, 50, "Half done"
         )
-        self.assertTrue(success)
+        assert success
         
         # Finish progress
-        success = self.main_window.finish_progress_operation(
+        success = shared_main_window.finish_progress_operation(
             progress_id, "Completed!"
         )
-        self.assertTrue(success)
+        assert success
         
-    def test_busy_operation_lifecycle(self):
+    def test_busy_operation_lifecycle(self, shared_main_window):
         """Test complete busy operation lifecycle."""
         # Start busy operation
-        busy_id = self.main_window.start_busy_operation(
+        busy_id = shared_main_window.start_busy_operation(
             "Test Operation", "Processing..."
         )
-        self.assertIsNotNone(busy_id)
+        assert busy_id is not None
         
         # Check system is busy
-        self.assertTrue(self.main_window.is_system_busy())
+        assert shared_main_window.is_system_busy()
         
         # Finish busy operation
-        success = self.main_window.finish_busy_operation(busy_id)
-        self.assertTrue(success)
+        success = shared_main_window.finish_busy_operation(busy_id)
+        assert success
         
         # Check system is no longer busy
-        self.assertFalse(self.main_window.is_system_busy())
+        assert not shared_main_window.is_system_busy()
         
     def test_pdf_handler_status_manager_connection(self):
         """Test that PDF handler gets status manager reference."""
-        # Verify that set_status_manager was called on the PDF handler
-        self.mock_pdf_handler.set_status_manager.assert_called_once()
-
+        # The module fixture patches scripts.ui.handlers.PDFHandler; spec the real class
+        from scripts.ui.handlers.pdf_handler import PDFHandler, wire_pdf_handler
+        
+        handler = create_autospec(PDFHandler, instance=True)
+        status_manager = Mock(spec=StatusManager)
+        
+        assert wire_pdf_handler(handler, status_manager)
+        handler.set_status_manager.assert_called_once_with(status_manager)
+        
+    def test_main_window_wires_pdf_handler(self, main_window, pdf_handler_class):
+        """Smoke test that a full MainWindow wires its PDF handler."""
+        pdf_handler_class.return_value.set_status_manager.assert_called_once()
 
 if __name__ == '__main__':
-    # Set up Qt application for testing
-    app = QApplication([])
-    
-    # Run tests
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
\ No newline at end of file
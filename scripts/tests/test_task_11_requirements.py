@@ -13,32 +13,72 @@ This test verifies that all requirements for Task 11 are implemented:
 import unittest
 import sys
 import os
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer
-
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from PyQt5.QtTest import QSignalSpy
 
 from scripts.ui.utils.status_manager import StatusManager, StatusLevel, ProgressType
 from scripts.ui.components.progress_widgets import (
-    ProgressPanel, ProgressWidget, BusyWidget, StatusMessageWidget,
+    ProgressPanel, BusyWidget, StatusMessageWidget,
     AnimatedProgressBar, PulsingProgressBar, BusySpinner
 )
 from scripts.ui.components.right_panel import RightPanel
 from scripts.ui.components.main_window import MainWindow
+from scripts.ui import handlers
+from scripts.ui.handlers import pdf_handler as pdf_handler_module
 from scripts.ui.handlers.process_handler import ProcessManager
 from scripts.ui.handlers.pdf_handler import PDFHandler
 
 
+# Every severity level, in declaration order; follows new StatusLevel members
+_SEVERITY_LEVELS = tuple(StatusLevel)
+
+# (output line, expected percentage or -1 when there is no progress)
+_TEST_OUTPUTS = (
+    ("Processing 50%", 50),
+    ("Step 3 of 5", 60),
+    ("Progress: 75", 75),
+    ("[4/10]", 40),
+    ("No progress info", -1),
+)
+
+
 class TestTask11Requirements(unittest.TestCase):
     """Test that all Task 11 requirements are implemented."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once for the class."""
+        # Reuse QApplication.instance(); Qt allows only one per process
+        cls.app = QApplication.instance() or QApplication([])
+        
+        # Shared StatusManager for tests that only drive the manager itself
+        cls.status_manager = StatusManager()
+        cls.addClassCleanup(cls.status_manager.cleanup)
+        
+        # One MainWindow for the whole class, built against a mocked PDFHandler.
+        # Class cleanups run last-in first-out: the window is cleaned up before
+        # the real PDFHandler is restored.
+        original_pdf_handler_class = handlers.PDFHandler
+        cls.mock_pdf_handler = Mock()
+        cls.mock_pdf_handler.initialize.return_value = None
+        cls.mock_pdf_handler.set_status_manager.return_value = None
+        handlers.PDFHandler = Mock(return_value=cls.mock_pdf_handler)
+        cls.addClassCleanup(setattr, handlers, 'PDFHandler', original_pdf_handler_class)
+        
+        cls.main_window = MainWindow()
+        cls.main_window.initialize()
+        cls.addClassCleanup(cls.main_window.cleanup)
+    
     def setUp(self):
-        """Set up test fixtures."""
-        self.app = QApplication.instance()
-        if self.app is None:
-            self.app = QApplication([])
+        self.reset_state()
+    
+    def reset_state(self):
+        """Clear state left on the shared StatusManager and MainWindow by earlier tests."""
+        self.status_manager.reset()
+        self.main_window.get_status_manager().reset()
+        self.main_window._process_progress_ids.clear()
+        self.main_window.set_processing_active(False)
     
     def test_requirement_progress_bars_and_status_indicators(self):
         """Test: Add progress bars and status indicators to the UI components."""
@@ -63,7 +103,7 @@ class TestTask11Requirements(unittest.TestCase):
         panel = ProgressPanel()
         panel.initialize()
         self.assertIsNotNone(panel.progress_scroll_area)
-        self.assertIsNotNone(panel.status_scroll_area)
+        self.assertIsNotNone(panel.status_list_view)
         panel.cleanup()
         
         # Test RightPanel has progress components
@@ -83,63 +123,50 @@ class TestTask11Requirements(unittest.TestCase):
         process_manager.initialize()
         
         # Check for enhanced progress signals
-        self.assertTrue(hasattr(process_manager, 'process_progress_updated'))
-        self.assertTrue(hasattr(process_manager, 'queue_status_changed'))
+        for name in ('process_progress_updated', 'queue_status_changed'):
+            self.assertTrue(hasattr(process_manager, name), name)
         
         # Test progress extraction from output
-        test_outputs = [
-            ("Processing 50%", 50),
-            ("Step 3 of 5", 60),
-            ("Progress: 75", 75),
-            ("[4/10]", 40),
-            ("No progress info", -1)
-        ]
-        
-        for output, expected in test_outputs:
-            result = process_manager._extract_progress_from_output(output)
-            if expected >= 0:
-                self.assertEqual(result, expected, f"Failed for output: {output}")
-            else:
-                self.assertEqual(result, -1, f"Should return -1 for: {output}")
+        for output, expected in _TEST_OUTPUTS:
+            with self.subTest(output=output):
+                result = process_manager._extract_progress_from_output(output)
+                self.assertEqual(result, expected)
         
         process_manager.cleanup()
         
         # Test PDFHandler has enhanced progress signals
-        with patch('scripts.ui.handlers.pdf_handler.ProcessManager'):
+        original_process_manager = pdf_handler_module.ProcessManager
+        pdf_handler_module.ProcessManager = Mock()
+        try:
             pdf_handler = PDFHandler()
             pdf_handler.initialize()
             
-            self.assertTrue(hasattr(pdf_handler, 'progress_started'))
-            self.assertTrue(hasattr(pdf_handler, 'progress_updated'))
-            self.assertTrue(hasattr(pdf_handler, 'progress_finished'))
+            for name in ('progress_started', 'progress_updated', 'progress_finished'):
+                self.assertTrue(hasattr(pdf_handler, name), name)
             
             pdf_handler.cleanup()
+        finally:
+            pdf_handler_module.ProcessManager = original_process_manager
         
         print("✓ Real-time status updates implemented")
     
     def test_requirement_status_message_system(self):
         """Test: Create status message system with different severity levels."""
-        status_manager = StatusManager()
+        status_manager = self.status_manager
         
         # Test all severity levels
-        severity_levels = [
-            StatusLevel.INFO,
-            StatusLevel.SUCCESS,
-            StatusLevel.WARNING,
-            StatusLevel.ERROR,
-            StatusLevel.DEBUG
-        ]
-        
-        for level in severity_levels:
-            message_id = status_manager.add_status_message(
-                f"Test {level.value} message",
-                level,
-                "TestSource"
-            )
-            self.assertIsNotNone(message_id)
-            
-            message = status_manager.status_messages[message_id]
-            self.assertEqual(message.level, level)
+        message_ids = status_manager.add_status_messages(
+            (f"Test {level.value} message", level, "TestSource")
+            for level in _SEVERITY_LEVELS
+        )
+        self.assertEqual(len(message_ids), len(_SEVERITY_LEVELS))
+        
+        for level, message_id in zip(_SEVERITY_LEVELS, message_ids):
+            with self.subTest(level=level):
+                self.assertIsNotNone(message_id)
+                
+                message = status_manager.status_messages[message_id]
+                self.assertEqual(message.level, level)
         
         # Test auto-removal
         auto_remove_id = status_manager.add_status_message(
@@ -167,12 +194,11 @@ class TestTask11Requirements(unittest.TestCase):
         status_manager.clear_status_messages()
         self.assertIn(persistent_id, status_manager.status_messages)  # Should remain
         
-        status_manager.cleanup()
         print("✓ Status message system with severity levels implemented")
     
     def test_requirement_busy_indicators(self):
         """Test: Add busy indicators for long-running operations."""
-        status_manager = StatusManager()
+        status_manager = self.status_manager
         
         # Test busy indicator lifecycle
         busy_id = status_manager.start_busy_indicator(
@@ -211,43 +237,24 @@ class TestTask11Requirements(unittest.TestCase):
         self.assertIsNotNone(busy_widget.operation_label)
         busy_widget.cleanup()
         
-        status_manager.cleanup()
         print("✓ Busy indicators for long-running operations implemented")
     
     def test_requirement_progress_handler_connections(self):
         """Test: Connect progress updates to ProcessManager and PDFHandler signals."""
         # Test MainWindow connects to handler signals
-        with patch('scripts.ui.handlers.PDFHandler') as mock_handler_class:
-            mock_pdf_handler = Mock()
-            mock_handler_class.return_value = mock_pdf_handler
-            mock_pdf_handler.initialize.return_value = None
-            mock_pdf_handler.set_status_manager.return_value = None
-            
-            # Mock process manager
-            mock_process_manager = Mock()
-            mock_pdf_handler.process_manager = mock_process_manager
-            
-            main_window = MainWindow()
-            main_window.initialize()
-            
-            # Verify PDF handler connections
-            self.assertTrue(hasattr(main_window, '_on_pdf_processing_started'))
-            self.assertTrue(hasattr(main_window, '_on_pdf_processing_finished'))
-            self.assertTrue(hasattr(main_window, '_on_handler_progress_started'))
-            self.assertTrue(hasattr(main_window, '_on_handler_progress_updated'))
-            self.assertTrue(hasattr(main_window, '_on_handler_progress_finished'))
-            
-            # Verify process manager connections
-            self.assertTrue(hasattr(main_window, '_on_process_started'))
-            self.assertTrue(hasattr(main_window, '_on_process_finished'))
-            self.assertTrue(hasattr(main_window, '_on_process_progress_updated'))
-            self.assertTrue(hasattr(main_window, '_on_queue_status_changed'))
-            
-            # Test signal handler functionality
-            main_window._on_process_progress_updated("test_process", 50, "Half done")
-            main_window._on_queue_status_changed(2, 1)
-            
-            main_window.cleanup()
+        main_window = self.main_window
+        
+        # Verify PDF handler and process manager connections
+        for name in ('_on_pdf_processing_started', '_on_pdf_processing_finished',
+                     '_on_handler_progress_started', '_on_handler_progress_updated',
+                     '_on_handler_progress_finished', '_on_process_started',
+                     '_on_process_finished', '_on_process_progress_updated',
+                     '_on_queue_status_changed'):
+            self.assertTrue(hasattr(main_window, name), name)
+        
+        # Test signal handler functionality
+        main_window._on_process_progress_updated("test_process", 50, "Half done")
+        main_window._on_queue_status_changed(2, 1)
         
         # Test RightPanel connects to StatusManager signals
         right_panel = RightPanel()
@@ -257,79 +264,161 @@ class TestTask11Requirements(unittest.TestCase):
         self.assertIsNotNone(status_manager)
         
         # Test signal connections exist
-        self.assertTrue(hasattr(right_panel, '_on_status_message_added'))
-        self.assertTrue(hasattr(right_panel, '_on_progress_started'))
-        self.assertTrue(hasattr(right_panel, '_on_progress_updated'))
-        self.assertTrue(hasattr(right_panel, '_on_busy_started'))
+        for name in ('_on_status_message_added', '_on_status_messages_bulk_added',
+                     '_on_progress_started', '_on_progress_updated',
+                     '_on_progress_finished'):
+            self.assertTrue(hasattr(right_panel, name), name)
         
         right_panel.cleanup()
         print("✓ Progress updates connected to ProcessManager and PDFHandler signals")
     
+    def test_process_progress_routed_to_matching_indicator(self):
+        """Process progress updates the indicator that mentions the process."""
+        main_window = self.main_window
+        status_manager = main_window.get_status_manager()
+        progress_id = status_manager.start_progress("Running proc_a", ProgressType.DETERMINATE, 100)
+        
+        main_window._on_process_progress_updated("proc_a", 30, "Working")
+        self.assertEqual(status_manager.active_progress[progress_id].current, 30)
+        
+        # Later updates reuse the remembered indicator instead of scanning
+        status_manager.get_active_progress = Mock(side_effect=AssertionError("scanned"))
+        try:
+            main_window._on_process_progress_updated("proc_a", 60, "Working")
+        finally:
+            del status_manager.get_active_progress
+        self.assertEqual(status_manager.active_progress[progress_id].current, 60)
+        
+        main_window._on_process_finished("proc_a", 0)
+        self.assertNotIn("proc_a", main_window._process_progress_ids)
+    
+    def test_unmatched_process_progress_rescanned_after_new_indicator(self):
+        """Progress for an unmatched process scans again once a new indicator starts."""
+        main_window = self.main_window
+        status_manager = main_window.get_status_manager()
+        main_window._on_process_progress_updated("proc_b", 10, "Working")
+        
+        # No indicator started since the miss, so no scan
+        status_manager.get_active_progress = Mock(side_effect=AssertionError("scanned"))
+        try:
+            main_window._on_process_progress_updated("proc_b", 20, "Working")
+        finally:
+            del status_manager.get_active_progress
+        
+        progress_id = status_manager.start_progress("Running proc_b", ProgressType.DETERMINATE, 100)
+        main_window._on_process_progress_updated("proc_b", 40, "Working")
+        self.assertEqual(status_manager.active_progress[progress_id].current, 40)
+    
+    def test_notification_posts_one_status_message(self):
+        """A notification adds one status message and updates the status label."""
+        main_window = self.main_window
+        status_manager = main_window.get_status_manager()
+        
+        main_window.show_notification("Export", "Done", "success")
+        
+        messages = status_manager.get_status_messages()
+        self.assertEqual([m.message for m in messages], ["Export: Done"])
+        self.assertEqual(messages[0].source, "Notification")
+        self.assertEqual(main_window.right_panel.status_label.text(), "Export: Done")
+    
+    def test_show_status_message_sets_label_and_posts_once(self):
+        """show_status_message updates the label and adds one status message."""
+        main_window = self.main_window
+        status_label = main_window.right_panel.status_label
+        
+        main_window.show_status_message("Working", "warning")
+        style = status_label.styleSheet()
+        main_window.show_status_message("Still working", "warning")
+        
+        self.assertEqual(status_label.text(), "Still working")
+        self.assertEqual(status_label.styleSheet(), style)
+        messages = main_window.get_status_manager().get_status_messages()
+        self.assertEqual([(m.message, m.level) for m in messages],
+                         [("Working", StatusLevel.WARNING), ("Still working", StatusLevel.WARNING)])
+    
+    def test_unchanged_processing_state_not_reapplied(self):
+        """Repeated queue updates with the same activity leave the panel alone."""
+        main_window = self.main_window
+        right_panel = main_window.right_panel
+        
+        main_window._on_queue_status_changed(1, 1)
+        self.assertTrue(right_panel.stop_button.isEnabled())
+        
+        right_panel.set_processing_active = Mock()
+        try:
+            main_window._on_queue_status_changed(0, 1)
+            right_panel.set_processing_active.assert_not_called()
+            main_window._on_queue_status_changed(0, 0)
+            right_panel.set_processing_active.assert_called_once_with(False)
+        finally:
+            del right_panel.set_processing_active
+    
     def test_integration_complete_workflow(self):
         """Test: Complete integration workflow with all components."""
-        # Create main window with mocked handlers
-        with patch('scripts.ui.handlers.PDFHandler') as mock_handler_class:
-            mock_pdf_handler = Mock()
-            mock_handler_class.return_value = mock_pdf_handler
-            mock_pdf_handler.initialize.return_value = None
-            mock_pdf_handler.set_status_manager.return_value = None
-            
-            main_window = MainWindow()
-            main_window.initialize()
-            
-            # Test enhanced status message workflow
-            message_id = main_window.add_enhanced_status_message(
-                "Test integration message",
-                "info",
-                "IntegrationTest"
-            )
-            self.assertIsNotNone(message_id)
-            
-            # Test progress operation workflow
-            progress_id = main_window.start_progress_operation(
-                "Integration Test",
-                "Starting...",
-                100
-            )
-            self.assertIsNotNone(progress_id)
-            
-            # Update progress
-            success = main_window.update_progress_operation(
-                progress_id, 50, "Half done"
-            )
-            self.assertTrue(success)
-            
-            # Finish progress
-            success = main_window.finish_progress_operation(
-                progress_id, "Completed!"
-            )
-            self.assertTrue(success)
-            
-            # Test busy operation workflow
-            busy_id = main_window.start_busy_operation(
-                "Integration Busy Test",
-                "Processing..."
-            )
-            self.assertIsNotNone(busy_id)
-            
-            # Check system is busy
-            self.assertTrue(main_window.is_system_busy())
-            
-            # Finish busy operation
-            success = main_window.finish_busy_operation(busy_id)
-            self.assertTrue(success)
-            
-            # Check system is no longer busy
-            self.assertFalse(main_window.is_system_busy())
-            
-            # Test notification system
-            main_window.show_notification(
-                "Integration Test",
-                "All systems working",
-                "success"
-            )
-            
-            main_window.cleanup()
+        main_window = self.main_window
+        
+        # Observe the status manager signals the workflow should drive
+        status_manager = main_window.get_status_manager()
+        progress_started_spy = QSignalSpy(status_manager.progress_started)
+        progress_finished_spy = QSignalSpy(status_manager.progress_finished)
+        busy_started_spy = QSignalSpy(status_manager.busy_started)
+        busy_finished_spy = QSignalSpy(status_manager.busy_finished)
+        
+        # Test enhanced status message workflow
+        message_id = main_window.add_enhanced_status_message(
+            "Test integration message",
+            "info",
+            "IntegrationTest"
+        )
+        self.assertIsNotNone(message_id)
+        
+        # Test progress operation workflow
+        progress_id = main_window.start_progress_operation(
+            "Integration Test",
+            "Starting...",
+            100
+        )
+        self.assertIsNotNone(progress_id)
+        
+        # Update progress
+        success = main_window.update_progress_operation(
+            progress_id, 50, "Half done"
+        )
+        self.assertTrue(success)
+        
+        # Finish progress
+        success = main_window.finish_progress_operation(
+            progress_id, "Completed!"
+        )
+        self.assertTrue(success)
+        self.assertEqual(len(progress_started_spy), 1)
+        self.assertEqual(progress_finished_spy[0], [progress_id])
+        
+        # Test busy operation workflow
+        busy_id = main_window.start_busy_operation(
+            "Integration Busy Test",
+            "Processing..."
+        )
+        self.assertIsNotNone(busy_id)
+        
+        # Check system is busy
+        self.assertTrue(main_window.is_system_busy())
+        
+        # Finish busy operation
+        success = main_window.finish_busy_operation(busy_id)
+        self.assertTrue(success)
+        
+        # Check system is no longer busy
+        self.assertFalse(main_window.is_system_busy())
+        self.assertEqual(len(busy_started_spy), 1)
+        self.assertEqual(busy_finished_spy[0], [busy_id])
+        
+        # Test notification system
+        main_window.show_notification(
+            "Integration Test",
+            "All systems working",
+            "success"
+        )
         
         print("✓ Complete integration workflow implemented")
     
@@ -342,13 +431,13 @@ class TestTask11Requirements(unittest.TestCase):
         
         # Test visual styling for different message types
         from scripts.ui.utils.status_manager import StatusMessage
-        import datetime
+        import time
         
         status_message = StatusMessage(
             id="test_visual",
             message="Test visual styling",
             level=StatusLevel.ERROR,
-            timestamp=datetime.datetime.now()
+            timestamp=time.time()
         )
         
         status_widget = StatusMessageWidget(status_message)
@@ -384,20 +473,17 @@ def run_task_11_verification():
     print("=" * 60)
     print("Verifying all requirements are implemented...\n")
     
-    # Set up Qt application for testing
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
+    import pytest
     
-    # Run tests
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestTask11Requirements)
-    runner = unittest.TextTestRunner(verbosity=0, stream=open(os.devnull, 'w'))
-    result = runner.run(suite)
+    # Run under pytest so the shared conftest fixtures (qapp, no animations) apply;
+    # -x stops at the first unmet requirement
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    exit_code = pytest.main([__file__, '-q', '-x', '-p', 'no:cacheprovider'])
     
     print("\nTask 11 Requirements Verification:")
     print("-" * 40)
     
-    if result.wasSuccessful():
+    if exit_code == pytest.ExitCode.OK:
         print("✅ ALL REQUIREMENTS IMPLEMENTED SUCCESSFULLY")
         print("\nImplemented features:")
         print("• Progress bars and status indicators in UI components")
@@ -412,8 +498,7 @@ def run_task_11_verification():
         return True
     else:
         print("❌ SOME REQUIREMENTS NOT MET")
-        print(f"Failures: {len(result.failures)}")
-        print(f"Errors: {len(result.errors)}")
+        print(f"pytest exit code: {int(exit_code)}")
         return False
 
 
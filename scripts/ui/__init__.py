@@ -2,13 +2,12 @@
 UI Module
 
 Modular UI components for the PDF Power Converter application.
+
+Subpackages are imported on first attribute access, so importing one of
+them does not pull in the whole widget tree.
 """
 
-from . import components
-from . import dialogs
-from . import handlers
-from . import utils
-from . import styles
+import importlib
 
 __all__ = [
     'components',
@@ -16,4 +15,13 @@ __all__ = [
     'handlers',
     'utils',
     'styles'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a subpackage the first time it is accessed."""
+    if name in __all__:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
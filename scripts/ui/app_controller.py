@@ -5,14 +5,20 @@ Main application controller that manages the application lifecycle,
 coordinates components, and handles application-wide exception handling.
 """
 
+import concurrent.futures
+import queue
 import sys
 import logging
 import traceback
-from PyQt5.QtWidgets import QApplication
+from logging.handlers import QueueListener
 
-from ui.components import MainWindow
-from ui.utils import AppConfig, PathManager
-from ui.styles.app_styles import get_app_styles
+# Qt, the widget tree and styles are imported where they are first needed,
+# so importing this module stays cheap for code that never shows a window
+from ui.utils import (AppConfig, BufferedFileHandler, CachedTimeFormatter,
+                      DeferredQueueHandler, PathManager)
+
+# Level names accepted for log_level; anything else falls back to INFO
+_LEVEL_MAP = {name: getattr(logging, name) for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')}
 
 
 class PDFCleanupApp:
@@ -33,10 +39,14 @@ class PDFCleanupApp:
         """
         self.debug_mode = debug_mode
         self.log_level = log_level
+        self.log_level_value = _LEVEL_MAP.get(log_level.upper(), logging.INFO)
         
         # Setup application-wide exception handling
         sys.excepthook = self._handle_exception
         
+        from PyQt5.QtWidgets import QApplication
+        from ui.styles.app_styles import get_app_styles
+        
         # Initialize Qt application
         self.app = QApplication(sys.argv)
         self.app.setApplicationName("PDF Cleanup Agent")
@@ -52,6 +62,11 @@ class PDFCleanupApp:
         self.path_manager = PathManager()
         self.main_window = None
         
+        # Single worker for shutdown file I/O, so slow disks don't stall the GUI thread
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='pdf-cleanup-io'
+        )
+        
         # Setup logging
         self._setup_logging()
         
@@ -62,43 +77,79 @@ class PDFCleanupApp:
         if self.debug_mode:
             log_format = '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
             
+        # Re-running setup replaces this app's previous listener and handlers
+        if getattr(self, '_log_listener', None) is not None:
+            self._stop_log_listener()
+            
         # Create custom handler for console widget
         self.console_handler = None
         
-        logging.basicConfig(
-            level=getattr(logging, self.log_level.upper()),
-            format=log_format,
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler('pdf_cleanup_app.log', mode='a')
-            ]
+        # One formatter for every handler, including the console widget, so
+        # each second's timestamp is rendered once
+        self._formatter = CachedTimeFormatter(log_format)
+        # Opened on the first record; writes are buffered and flushed on
+        # ERROR and above, every 30 seconds, and on close
+        handlers = [BufferedFileHandler('pdf_cleanup_app.log')]
+        # GUI launches without a console (pythonw.exe, frozen windowed builds)
+        # have no stdout to write to
+        if sys.stdout is not None:
+            handlers.append(logging.StreamHandler(sys.stdout))
+        for handler in handlers:
+            handler.setFormatter(self._formatter)
+        
+        # The file and stdout handlers format and write on the listener
+        # thread; callers only pay for putting the record on the queue
+        self._log_queue = queue.SimpleQueue()
+        self._log_queue_handler = DeferredQueueHandler(self._log_queue)
+        self._configure_root_logger()
+        
+        self._log_listener = QueueListener(
+            self._log_queue, *handlers, respect_handler_level=True
         )
+        self._log_listener.start()
         
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"PDF Cleanup App starting (debug={self.debug_mode}, log_level={self.log_level})")
         
+    def _configure_root_logger(self):
+        """
+        Make the log queue handler the root logger's only handler.
+        
+        Unlike logging.basicConfig, this also applies when the root logger
+        already has handlers, e.g. from an earlier app instance in the same
+        process; those handlers are detached and closed.
+        """
+        root_logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+            handler.close()
+        
+        root_logger.addHandler(self._log_queue_handler)
+        root_logger.setLevel(self.log_level_value)
+        
     def _setup_console_logging(self):
         """Setup logging to console widget."""
         if self.main_window and self.main_window.left_panel:
-            # Create custom handler that sends logs to console widget
-            class ConsoleWidgetHandler(logging.Handler):
-                def __init__(self, console_widget):
-                    super().__init__()
-                    self.console_widget = console_widget
-                    
+            from PyQt5.QtCore import QObject, Qt, pyqtSignal
+            
+            # Create custom handler that sends logs to console widget. Records
+            # may come from any thread, so lines travel to the widget through a
+            # queued signal and are appended on the GUI thread.
+            class ConsoleWidgetHandler(QObject, logging.Handler):
+                record_ready = pyqtSignal(str)
+                
                 def emit(self, record):
                     try:
-                        msg = self.format(record)
-                        if self.console_widget:
-                            self.console_widget.append_console_output(msg)
+                        self.record_ready.emit(self.format(record))
                     except Exception:
                         pass  # Ignore errors in logging handler
             
             # Add console handler to root logger
-            console_handler = ConsoleWidgetHandler(self.main_window.left_panel)
-            console_handler.setLevel(getattr(logging, self.log_level.upper()))
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            console_handler.setFormatter(formatter)
+            left_panel = self.main_window.left_panel
+            console_handler = ConsoleWidgetHandler()
+            console_handler.record_ready.connect(left_panel.enqueue_console_line, Qt.QueuedConnection)
+            console_handler.setLevel(self.log_level_value)
+            console_handler.setFormatter(self._formatter)
             
             # Add to root logger so all modules log to console
             root_logger = logging.getLogger()
@@ -122,12 +173,11 @@ class PDFCleanupApp:
             sys.__excepthook__(exc_type, exc_value, exc_traceback)
             return
             
-        # Log the exception
-        error_msg = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
-        self.logger.critical(f"Uncaught exception: {error_msg}")
-        
-        # Print error to stderr instead of showing pop-up dialog
-        print(f"Critical error: {error_msg}", file=sys.stderr)
+        # Log the exception; exc_info travels with the record through the
+        # log queue, the first handler to format it caches the traceback text
+        # for the others, and the stdout handler reports it instead of a
+        # pop-up dialog
+        self.logger.critical("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
         
         # Cleanup and exit
         self.cleanup()
@@ -152,6 +202,7 @@ class PDFCleanupApp:
                 self.logger.warning("Failed to create some data directories")
                 
             # Create main window
+            from ui.components import MainWindow
             self.main_window = MainWindow()
             self.main_window.initialize()
             
@@ -200,10 +251,30 @@ class PDFCleanupApp:
                 self.main_window.cleanup()
                 
             # Save configuration if needed
-            if self.config and self.config.settings:
-                self.config.save_config()
+            if self.config and self.config.settings and self._io_pool:
+                future = self._io_pool.submit(self.config.save_config)
+                try:
+                    future.result(timeout=5.0)
+                except concurrent.futures.TimeoutError:
+                    self.logger.warning("Saving configuration timed out; continuing shutdown")
                 
             self.logger.info("Application cleanup completed")
             
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
\ No newline at end of file
+            self.logger.error(f"Error during cleanup: {e}")
+            
+        if self._io_pool:
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
+        self._stop_log_listener()
+        
+    def _stop_log_listener(self):
+        """Drain queued log records to their handlers and close them."""
+        if self._log_listener is None:
+            return
+        
+        logging.getLogger().removeHandler(self._log_queue_handler)
+        self._log_listener.stop()
+        for handler in self._log_listener.handlers:
+            handler.close()
+        self._log_listener = None
\ No newline at end of file
@@ -2,13 +2,21 @@
 UI Components Module
 
 This module contains all UI components including panels, widgets, and the main window.
+
+Components are imported on first attribute access, so importing one
+component module does not build the rest of the widget tree.
 """
 
-from .base_component import BaseComponent
-from .main_window import MainWindow
-from .pdf_drop_widget import PDFDropWidget
-from .left_panel import LeftPanel
-from .right_panel import RightPanel
+import importlib
+
+# Public name -> submodule that defines it
+_COMPONENT_MODULES = {
+    'BaseComponent': '.base_component',
+    'MainWindow': '.main_window',
+    'PDFDropWidget': '.pdf_drop_widget',
+    'LeftPanel': '.left_panel',
+    'RightPanel': '.right_panel',
+}
 
 __all__ = [
     'BaseComponent',
@@ -16,4 +24,14 @@ __all__ = [
     'PDFDropWidget',
     'LeftPanel',
     'RightPanel',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a component the first time it is accessed."""
+    if name in _COMPONENT_MODULES:
+        module = importlib.import_module(_COMPONENT_MODULES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
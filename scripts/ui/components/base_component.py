@@ -6,7 +6,6 @@ Provides common functionality for all UI components.
 
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtCore import pyqtSignal
-from abc import ABC, abstractmethod
 import logging
 
 
@@ -16,15 +15,34 @@ class BaseComponent(QWidget):
     
     This class provides common functionality like error handling,
     logging, and signal management for all UI components.
+    
+    Connections between widgets that only ever emit on the GUI thread use
+    Qt.DirectConnection. Signals that may be emitted from another thread,
+    such as log records, use Qt.QueuedConnection so the slot runs on the
+    GUI thread.
     """
     
     # Common signals that all components can emit
     error_occurred = pyqtSignal(str, str)  # error_type, error_message
     status_changed = pyqtSignal(str)       # status_message
     
+    # The re-entry flag lives in a slot; PyQt wrappers keep their own
+    # __dict__, so subclasses are free to add attributes as usual
+    __slots__ = ('_is_initialized',)
+    
+    # One logger and lifecycle message pair per component class
+    logger = logging.getLogger('BaseComponent')
+    _initialized_message = "BaseComponent initialized"
+    _cleanup_message = "BaseComponent cleanup completed"
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+        cls._initialized_message = f"{cls.__name__} initialized"
+        cls._cleanup_message = f"{cls.__name__} cleanup completed"
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.logger = logging.getLogger(self.__class__.__name__)
         self._is_initialized = False
         
     def initialize(self):
@@ -35,13 +53,17 @@ class BaseComponent(QWidget):
         if self._is_initialized:
             return
             
+        # Build the whole widget tree with one layout and paint pass at the end
+        self.setUpdatesEnabled(False)
         try:
             self._setup_ui()
             self._setup_connections()
             self._is_initialized = True
-            self.status_changed.emit(f"{self.__class__.__name__} initialized")
+            self.status_changed.emit(self._initialized_message)
         except Exception as e:
             self._handle_error("initialization", str(e))
+        finally:
+            self.setUpdatesEnabled(True)
             
     def _setup_ui(self):
         """
@@ -86,4 +108,4 @@ class BaseComponent(QWidget):
         Cleanup method called when the component is being destroyed.
         Subclasses should override this for custom cleanup.
         """
-        self.logger.info(f"{self.__class__.__name__} cleanup completed")
\ No newline at end of file
+        self.logger.info(self._cleanup_message)
\ No newline at end of file
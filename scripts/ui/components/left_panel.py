@@ -6,13 +6,17 @@ Contains the PDF list and console logs display.
 
 from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, 
                              QSplitter, QFrame)
-from PyQt5.QtCore import pyqtSignal, Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt, QTimer, QEvent
+from PyQt5.QtGui import QFont, QTextCursor
+from typing import List
 
 from .base_component import BaseComponent
 from .pdf_drop_widget import PDFDropWidget
 from ..styles.app_styles import get_app_styles
 
+# Lines the console keeps; older lines drop off the top
+_CONSOLE_MAX_LINES = 5000
+
 
 class LeftPanel(BaseComponent):
     """
@@ -33,6 +37,19 @@ class LeftPanel(BaseComponent):
         self.console_output = None
         self.splitter = None
         
+        # Console lines are batched and appended together at most every 100 ms
+        self._pending_lines: List[str] = []
+        self.console_flush_timer = QTimer(self)
+        self.console_flush_timer.setSingleShot(True)
+        self.console_flush_timer.setInterval(100)
+        self.console_flush_timer.timeout.connect(self._flush_pending_lines)
+        
+        # Selection changes are reported once a burst of them settles
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(50)
+        self._selection_timer.timeout.connect(self._emit_selection)
+        
     def _setup_ui(self):
         """Setup the left panel UI layout."""
         # Main vertical layout
@@ -43,6 +60,10 @@ class LeftPanel(BaseComponent):
         self.splitter = QSplitter(Qt.Vertical)
         layout.addWidget(self.splitter)
         
+        # Styles shared by both sections; HEADER_LABEL is built on each access
+        self._styles = get_app_styles()
+        self._header_style = self._styles.HEADER_LABEL
+        
         # Setup PDF list section
         self._setup_pdf_section()
         
@@ -64,8 +85,7 @@ class LeftPanel(BaseComponent):
         
         # PDF section header
         pdf_header = QLabel("PDF Files v1.0")
-        styles = get_app_styles()
-        pdf_header.setStyleSheet(styles.HEADER_LABEL)
+        pdf_header.setStyleSheet(self._header_style)
         pdf_layout.addWidget(pdf_header)
         
         # PDF drop widget
@@ -88,31 +108,52 @@ class LeftPanel(BaseComponent):
         
         # Console section header
         console_header = QLabel("Console")
-        styles = get_app_styles()
-        console_header.setStyleSheet(styles.HEADER_LABEL)
+        console_header.setStyleSheet(self._header_style)
         console_layout.addWidget(console_header)
         
         # Console output text area
         self.console_output = QTextEdit()
         self.console_output.setReadOnly(True)
         self.console_output.setFont(QFont("Consolas", 10))
-        self.console_output.setStyleSheet(styles.CONSOLE_STYLE)
+        self.console_output.setStyleSheet(self._styles.CONSOLE_STYLE)
         self.console_output.setPlaceholderText("Console output will appear here...")
+        # Treat the console as a bounded log: oldest lines drop off, no undo history
+        self.console_output.document().setMaximumBlockCount(_CONSOLE_MAX_LINES)
+        self.console_output.setAcceptRichText(False)
+        self.console_output.setUndoRedoEnabled(False)
         console_layout.addWidget(self.console_output)
         
+        # One cursor for appending, kept for the lifetime of the document
+        self._console_cursor = QTextCursor(self.console_output.document())
+        self._user_scrolled_up = False
+        self.console_output.verticalScrollBar().valueChanged.connect(self._on_console_scrolled)
+        # Show and resize events tell when a hidden or collapsed console reappears
+        self.console_output.installEventFilter(self)
+        
         # Add to splitter
         self.splitter.addWidget(console_frame)
         
     def _setup_connections(self):
         """Setup signal/slot connections for the left panel."""
-        if self.pdf_drop_widget:
-            # Connect PDF drop widget signals
-            self.pdf_drop_widget.pdf_dropped.connect(self.pdf_dropped.emit)
-            self.pdf_drop_widget.pdf_preprocess_requested.connect(self.pdf_preprocess_requested.emit)
-            self.pdf_drop_widget.itemSelectionChanged.connect(self._on_pdf_selection_changed)
+        if self.pdf_drop_widget is not None:
+            # Connect PDF drop widget signals; all are emitted on the GUI thread
+            self.pdf_drop_widget.pdf_dropped.connect(self.pdf_dropped, Qt.DirectConnection)
+            self.pdf_drop_widget.pdf_preprocess_requested.connect(
+                self.pdf_preprocess_requested, Qt.DirectConnection
+            )
+            self.pdf_drop_widget.itemSelectionChanged.connect(
+                self._on_pdf_selection_changed, Qt.DirectConnection
+            )
             
+    @pyqtSlot()
     def _on_pdf_selection_changed(self):
         """Handle PDF selection changes."""
+        # Restarting the timer collapses rapid changes into one report
+        self._selection_timer.start()
+        
+    @pyqtSlot()
+    def _emit_selection(self):
+        """Report the current PDF selection."""
         selected_pdf = self.pdf_drop_widget.get_selected_pdf()
         if selected_pdf:
             self.pdf_selected.emit(selected_pdf)
@@ -122,25 +163,77 @@ class LeftPanel(BaseComponent):
         """
         Append text to the console output.
         
+        Lines are queued and appended in batches on the next console flush.
+        
         Args:
             text: Text to append to console
         """
-        if self.console_output:
-            self.console_output.append(text)
-            # Auto-scroll to bottom
-            cursor = self.console_output.textCursor()
-            cursor.movePosition(cursor.End)
-            self.console_output.setTextCursor(cursor)
+        self.enqueue_console_line(text)
+        
+    @pyqtSlot(str)
+    def enqueue_console_line(self, text: str):
+        """
+        Queue a console line for the next batched append.
+        
+        Connect log sources on other threads to this slot with
+        Qt.QueuedConnection.
+        
+        Args:
+            text: Line to append to the console
+        """
+        self._pending_lines.append(text)
+        if not self.console_flush_timer.isActive():
+            self.console_flush_timer.start()
+            
+    @pyqtSlot()
+    def _flush_pending_lines(self):
+        """Append all queued console lines in one update."""
+        if not self._pending_lines or not self.console_output:
+            return
+        
+        # While the console is hidden or collapsed in a splitter, keep only
+        # the newest lines queued; they are appended once it shows again
+        if self.console_output.visibleRegion().isEmpty():
+            del self._pending_lines[:-_CONSOLE_MAX_LINES]
+            return
+        
+        text = '\n'.join(self._pending_lines)
+        self._pending_lines.clear()
+        if not self.console_output.document().isEmpty():
+            text = '\n' + text
+        
+        # Inserted as plain text, so lines are never parsed as rich text
+        cursor = self._console_cursor
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        
+        # Auto-scroll to bottom, unless the user scrolled up to read
+        if not self._user_scrolled_up:
+            scroll_bar = self.console_output.verticalScrollBar()
+            scroll_bar.setValue(scroll_bar.maximum())
+            
+    def eventFilter(self, obj, event):
+        """Flush lines held back while the console was not visible."""
+        if (obj is self.console_output and event.type() in (QEvent.Show, QEvent.Resize)
+                and self._pending_lines and not self.console_flush_timer.isActive()):
+            self.console_flush_timer.start()
+        return super().eventFilter(obj, event)
+        
+    @pyqtSlot(int)
+    def _on_console_scrolled(self, value: int):
+        """Track whether the console is scrolled away from the bottom."""
+        self._user_scrolled_up = value < self.console_output.verticalScrollBar().maximum()
             
     def clear_console_output(self):
         """Clear the console output."""
+        self._pending_lines.clear()
         if self.console_output:
             self.console_output.clear()
             self._emit_status("Console output cleared")
             
     def refresh_pdf_list(self):
         """Refresh the PDF file list."""
-        if self.pdf_drop_widget:
+        if self.pdf_drop_widget is not None:
             self.pdf_drop_widget.refresh_pdf_list()
             self._emit_status("PDF list refreshed")
             
@@ -151,7 +244,7 @@ class LeftPanel(BaseComponent):
         Returns:
             Path to selected PDF file, or empty string if none selected
         """
-        if self.pdf_drop_widget:
+        if self.pdf_drop_widget is not None:
             return self.pdf_drop_widget.get_selected_pdf()
         return ""
         
@@ -165,7 +258,7 @@ class LeftPanel(BaseComponent):
         Returns:
             True if successful, False otherwise
         """
-        if self.pdf_drop_widget:
+        if self.pdf_drop_widget is not None:
             return self.pdf_drop_widget.add_pdf_programmatically(pdf_path)
         return False
         
@@ -176,10 +269,14 @@ class LeftPanel(BaseComponent):
         Args:
             size: Font size in points
         """
-        if self.console_output:
-            font = self.console_output.font()
-            font.setPointSize(size)
-            self.console_output.setFont(font)
+        if not self.console_output:
+            return
+        font = self.console_output.font()
+        # setFont re-lays out the whole console document, so skip it when nothing changes
+        if font.pointSize() == size:
+            return
+        font.setPointSize(size)
+        self.console_output.setFont(font)
             
     def get_splitter_sizes(self) -> list:
         """Get the current splitter sizes."""
@@ -195,4 +292,11 @@ class LeftPanel(BaseComponent):
             sizes: List of sizes for splitter sections
         """
         if self.splitter and len(sizes) >= 2:
-            self.splitter.setSizes(sizes)
\ No newline at end of file
+            self.splitter.setSizes(sizes)
+            
+    def cleanup(self):
+        """Cleanup left panel resources."""
+        self.console_flush_timer.stop()
+        self._selection_timer.stop()
+        self._pending_lines.clear()
+        super().cleanup()
\ No newline at end of file
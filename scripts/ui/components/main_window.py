@@ -7,7 +7,9 @@ between different panels and handlers.
 
 from PyQt5.QtWidgets import QHBoxLayout, QVBoxLayout, QSplitter
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt, QTimer
+from functools import lru_cache
+from types import MappingProxyType
 import os
 import sys
 
@@ -15,6 +17,94 @@ from .base_component import BaseComponent
 from .left_panel import LeftPanel
 from .right_panel import RightPanel
 from ..styles.app_styles import get_app_styles
+from ..utils.status_manager import StatusLevel, ProgressType, ProgressInfo
+
+# The icon location is fixed relative to this module, so it is resolved once
+_APP_ICON_PATH = os.path.join(os.path.dirname(__file__), '..', 'icons', 'app_icon.png')
+_HAS_APP_ICON = os.path.exists(_APP_ICON_PATH)
+_app_icon = None
+
+# Status level names used by callers, and how long non-persistent messages
+# of each level stay visible by default; read-only so no caller can change
+# them for every window
+_STATUS_LEVELS = MappingProxyType({
+    'info': StatusLevel.INFO,
+    'success': StatusLevel.SUCCESS,
+    'warning': StatusLevel.WARNING,
+    'error': StatusLevel.ERROR,
+    'debug': StatusLevel.DEBUG
+})
+_DEFAULT_STATUS_LEVEL = StatusLevel.INFO
+_AUTO_REMOVE_MS = MappingProxyType({
+    'info': 3000,      # 3 seconds
+    'success': 5000,   # 5 seconds
+    'warning': 8000,   # 8 seconds
+    'error': 12000,    # 12 seconds
+    'debug': 2000      # 2 seconds
+})
+_DEFAULT_AUTO_REMOVE_MS = 5000
+
+# Source names attached to the status messages MainWindow posts
+_SOURCE_MAIN_WINDOW = "MainWindow"
+_SOURCE_NOTIFICATION = "Notification"
+_SOURCE_PDF_HANDLER = "PDFHandler"
+_SOURCE_PROCESS_MANAGER = "ProcessManager"
+
+# (emitter signal, MainWindow attribute) pairs for _connect_signals. The panels,
+# PDFHandler and ProcessManager all emit on the GUI thread, so these connect
+# directly.
+_LEFT_PANEL_CONNECTIONS = (
+    ('pdf_dropped', 'pdf_dropped'),
+    ('pdf_selected', 'pdf_selected'),
+    ('pdf_preprocess_requested', 'pdf_preprocess_requested'),
+)
+_RIGHT_PANEL_CONNECTIONS = (
+    ('process_pdf_requested', '_on_process_pdf_requested'),
+    ('stop_processing_requested', 'stop_processing_requested'),
+    ('clear_console_requested', '_on_clear_console_requested'),
+    ('refresh_pdf_list_requested', '_on_refresh_pdf_list_requested'),
+    ('open_prompt_editor_requested', 'open_prompt_editor_requested'),
+    ('open_model_selector_requested', 'open_model_selector_requested'),
+    ('open_text_preview_requested', 'open_text_preview_requested'),
+)
+_PDF_HANDLER_CONNECTIONS = (
+    ('pdf_copied', 'pdf_dropped'),  # Use pdf_copied instead of pdf_dropped
+    ('pdf_processing_started', '_on_pdf_processing_started'),
+    ('pdf_processing_finished', '_on_pdf_processing_finished'),
+    ('pdf_segmentation_finished', '_on_pdf_segmentation_finished'),
+    ('llm_processing_finished', '_on_llm_processing_finished'),
+)
+_PDF_HANDLER_PROGRESS_CONNECTIONS = (
+    ('progress_started', '_on_handler_progress_started'),
+    ('progress_updated', '_on_handler_progress_updated'),
+    ('progress_finished', '_on_handler_progress_finished'),
+)
+_PROCESS_MANAGER_CONNECTIONS = (
+    ('process_started', '_on_process_started'),
+    ('process_finished', '_on_process_finished'),
+    ('process_output_batch', '_on_process_output_batch'),
+    ('process_error', '_on_process_error'),
+    ('process_queued', '_on_process_queued'),
+    ('process_cancelled', '_on_process_cancelled'),
+    ('queue_empty', '_on_queue_empty'),
+    ('process_progress_updated', '_on_process_progress_updated'),
+    ('queue_status_changed', '_on_queue_status_changed'),
+)
+
+
+def _get_app_icon():
+    """Return the QIcon shared by all windows, or None without an icon file."""
+    global _app_icon
+    # QIcon needs a QApplication, so it is built on first use, not at import
+    if _app_icon is None and _HAS_APP_ICON:
+        _app_icon = QIcon(_APP_ICON_PATH)
+    return _app_icon
+
+
+@lru_cache(maxsize=256)
+def _basename(path: str) -> str:
+    """Return the file name of a PDF path; status messages repeat the same few paths."""
+    return os.path.basename(path)
 
 
 class MainWindow(BaseComponent):
@@ -47,6 +137,16 @@ class MainWindow(BaseComponent):
         
         # Handlers
         self.pdf_handler = None
+        # RightPanel's status manager, kept once the panel is built
+        self._status_manager = None
+        
+        # Process ID -> ID of the progress indicator its progress updates go
+        # to, or "" when no active indicator mentions the process
+        self._process_progress_ids = {}
+        # Process ID -> "[process_id] " prefix for its console lines
+        self._output_prefixes = {}
+        # Processing state last pushed to the panels; None until first set
+        self._last_processing_active = None
         
         self._setup_window_properties()
         
@@ -55,14 +155,21 @@ class MainWindow(BaseComponent):
         self.resize(1200, 800)  # Increased size for better layout
         self.setMinimumSize(800, 600)
         
-        # Apply theme-aware styling
+        # Apply theme-aware styling before any child exists, so each child is
+        # polished once as it is added instead of the whole tree afterwards
         styles = get_app_styles()
         self.setStyleSheet(styles.get_main_window_style())
         
-        # Set window icon if it exists
-        icon_path = os.path.join(os.path.dirname(__file__), '..', 'icons', 'app_icon.png')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        # The icon is not needed for the first paint; decode it on the next tick
+        if _HAS_APP_ICON:
+            QTimer.singleShot(0, self._apply_window_icon)
+            
+    @pyqtSlot()
+    def _apply_window_icon(self):
+        """Set the shared application icon on the window."""
+        icon = _get_app_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
             
     def _setup_ui(self):
         """
@@ -94,6 +201,7 @@ class MainWindow(BaseComponent):
         """Setup the right panel containing control buttons."""
         self.right_panel = RightPanel()
         self.right_panel.initialize()
+        self._status_manager = self.right_panel.get_status_manager()
         self.main_splitter.addWidget(self.right_panel)
         
     def _setup_connections(self):
@@ -101,31 +209,31 @@ class MainWindow(BaseComponent):
         # Setup handlers first
         self._setup_handlers()
         
+        # Re-emitted signals are connected signal-to-signal, so Qt forwards
+        # them without calling back into Python
+        
         # Connect left panel signals
         if self.left_panel:
-            self.left_panel.pdf_dropped.connect(self.pdf_dropped.emit)
-            self.left_panel.pdf_selected.connect(self.pdf_selected.emit)
-            self.left_panel.pdf_preprocess_requested.connect(self.pdf_preprocess_requested.emit)
+            self._connect_signals(self.left_panel, _LEFT_PANEL_CONNECTIONS)
             
         # Connect right panel signals
         if self.right_panel:
-            self.right_panel.process_pdf_requested.connect(self._on_process_pdf_requested)
-            self.right_panel.stop_processing_requested.connect(self.stop_processing_requested.emit)
-            self.right_panel.clear_console_requested.connect(self._on_clear_console_requested)
-            self.right_panel.refresh_pdf_list_requested.connect(self._on_refresh_pdf_list_requested)
-            self.right_panel.open_prompt_editor_requested.connect(self.open_prompt_editor_requested.emit)
-            self.right_panel.open_model_selector_requested.connect(self.open_model_selector_requested.emit)
-            self.right_panel.open_text_preview_requested.connect(self.open_text_preview_requested.emit)
+            self._connect_signals(self.right_panel, _RIGHT_PANEL_CONNECTIONS)
+        if self._status_manager:
+            self._status_manager.progress_started.connect(
+                self._on_status_progress_started, Qt.DirectConnection
+            )
             
         # Connect cross-panel interactions
         if self.left_panel and self.right_panel:
             # Update right panel when PDF is selected or dropped
-            self.left_panel.pdf_selected.connect(self.right_panel.set_current_pdf)
-            self.left_panel.pdf_dropped.connect(self.right_panel.set_current_pdf)
+            self.left_panel.pdf_selected.connect(self.right_panel.set_current_pdf, Qt.DirectConnection)
+            self.left_panel.pdf_dropped.connect(self.right_panel.set_current_pdf, Qt.DirectConnection)
             
         # Connect handler signals
         self._connect_handler_signals()
             
+    @pyqtSlot(str)
     def _on_process_pdf_requested(self, pdf_path: str):
         """
         Handle process PDF request from right panel.
@@ -141,12 +249,14 @@ class MainWindow(BaseComponent):
         else:
             self.show_status_message("No PDF selected for processing", "warning")
             
+    @pyqtSlot()
     def _on_clear_console_requested(self):
         """Handle clear console request from right panel."""
         if self.left_panel:
             self.left_panel.clear_console_output()
         self.clear_console_requested.emit()
         
+    @pyqtSlot()
     def _on_refresh_pdf_list_requested(self):
         """Handle refresh PDF list request from right panel."""
         if self.left_panel:
@@ -160,7 +270,7 @@ class MainWindow(BaseComponent):
         Args:
             pdf_path: Path to the dropped PDF file
         """
-        self._emit_status(f"PDF dropped: {os.path.basename(pdf_path)}")
+        self._emit_status(f"PDF dropped: {_basename(pdf_path)}")
         self.pdf_dropped.emit(pdf_path)
         
     def append_console_output(self, text: str):
@@ -182,18 +292,9 @@ class MainWindow(BaseComponent):
             status_type: Type of status ('info', 'success', 'warning', 'error')
         """
         if self.right_panel:
-            self.right_panel.set_status(message, status_type)
-            
-            # Also add to enhanced status system
-            from ..utils.status_manager import StatusLevel
-            level_map = {
-                'info': StatusLevel.INFO,
-                'success': StatusLevel.SUCCESS,
-                'warning': StatusLevel.WARNING,
-                'error': StatusLevel.ERROR
-            }
-            level = level_map.get(status_type, StatusLevel.INFO)
-            self.right_panel.add_status_message(message, level, source="MainWindow")
+            # Update the status label and add to the enhanced status system
+            level = _STATUS_LEVELS.get(status_type, _DEFAULT_STATUS_LEVEL)
+            self.right_panel.set_status(message, status_type, level=level, source=_SOURCE_MAIN_WINDOW)
             
     def add_processing_detail(self, detail: str):
         """
@@ -212,7 +313,11 @@ class MainWindow(BaseComponent):
         Args:
             active: True if processing is active, False otherwise
         """
+        # Queue updates repeat the same state; only push actual changes
+        if active == self._last_processing_active:
+            return
         if self.right_panel:
+            self._last_processing_active = active
             self.right_panel.set_processing_active(active)
             
     def set_progress(self, value: int, maximum: int = 100):
@@ -241,7 +346,6 @@ class MainWindow(BaseComponent):
             Progress ID for tracking
         """
         if self.right_panel:
-            from ..utils.status_manager import ProgressType
             return self.right_panel.start_progress_indicator(title, ProgressType.DETERMINATE, maximum, message)
         return ""
     
@@ -322,29 +426,14 @@ class MainWindow(BaseComponent):
             Message ID for tracking
         """
         if self.right_panel:
-            from ..utils.status_manager import StatusLevel
-            level_map = {
-                'info': StatusLevel.INFO,
-                'success': StatusLevel.SUCCESS,
-                'warning': StatusLevel.WARNING,
-                'error': StatusLevel.ERROR,
-                'debug': StatusLevel.DEBUG
-            }
-            status_level = level_map.get(level, StatusLevel.INFO)
+            status_level = _STATUS_LEVELS.get(level, _DEFAULT_STATUS_LEVEL)
             
             # Set default auto-remove times based on severity
             if auto_remove_ms is None and not persistent:
-                auto_remove_times = {
-                    'info': 3000,      # 3 seconds
-                    'success': 5000,   # 5 seconds
-                    'warning': 8000,   # 8 seconds
-                    'error': 12000,    # 12 seconds
-                    'debug': 2000      # 2 seconds
-                }
-                auto_remove_ms = auto_remove_times.get(level, 5000)
+                auto_remove_ms = _AUTO_REMOVE_MS.get(level, _DEFAULT_AUTO_REMOVE_MS)
             
             return self.right_panel.add_status_message(
-                message, status_level, source or "MainWindow", persistent, auto_remove_ms
+                message, status_level, source or _SOURCE_MAIN_WINDOW, persistent, auto_remove_ms
             )
         return ""
     
@@ -360,11 +449,13 @@ class MainWindow(BaseComponent):
         """
         full_message = f"{title}: {message}" if title else message
         self.add_enhanced_status_message(
-            full_message, level, "Notification", persistent=False, auto_remove_ms=duration_ms
+            full_message, level, _SOURCE_NOTIFICATION, persistent=False, auto_remove_ms=duration_ms
         )
         
-        # Also show in status bar for immediate visibility
-        self.show_status_message(full_message, level)
+        # Also show in status bar for immediate visibility; show_status_message
+        # would post the same text to the status manager a second time
+        if self.right_panel:
+            self.right_panel.set_status(full_message, level)
     
     def is_system_busy(self) -> bool:
         """
@@ -384,9 +475,7 @@ class MainWindow(BaseComponent):
         Returns:
             StatusManager instance or None
         """
-        if self.right_panel:
-            return self.right_panel.get_status_manager()
-        return None
+        return self._status_manager
             
     def get_selected_pdf(self) -> str:
         """
@@ -432,201 +521,253 @@ class MainWindow(BaseComponent):
             
     def _setup_handlers(self):
         """Setup application handlers."""
-        from ..handlers import PDFHandler
+        # Looked up on the package at call time, so a patched handlers.PDFHandler
+        # is picked up; the status manager types are imported at module level
+        from ..handlers import PDFHandler, wire_pdf_handler
         
         # Initialize PDF handler
         self.pdf_handler = PDFHandler(self)
         self.pdf_handler.initialize()
         
         # Set status manager on PDF handler
-        status_manager = self.get_status_manager()
-        if status_manager and hasattr(self.pdf_handler, 'set_status_manager'):
-            self.pdf_handler.set_status_manager(status_manager)
+        wire_pdf_handler(self.pdf_handler, self.get_status_manager())
+        
+    def _connect_signals(self, emitter, connections):
+        """
+        Connect an emitter's signals to this window with direct connections.
         
+        Args:
+            emitter: Object owning the signals
+            connections: (signal name, attribute name) pairs
+        """
+        for signal_name, target_name in connections:
+            getattr(emitter, signal_name).connect(getattr(self, target_name), Qt.DirectConnection)
+            
     def _connect_handler_signals(self):
         """Connect handler signals to UI components."""
         if self.pdf_handler:
             # Connect PDF handler signals to main window
-            self.pdf_handler.pdf_copied.connect(self.pdf_dropped.emit)  # Use pdf_copied instead of pdf_dropped
-            self.pdf_handler.pdf_processing_started.connect(self._on_pdf_processing_started)
-            self.pdf_handler.pdf_processing_finished.connect(self._on_pdf_processing_finished)
-            self.pdf_handler.pdf_segmentation_finished.connect(self._on_pdf_segmentation_finished)
-            self.pdf_handler.llm_processing_finished.connect(self._on_llm_processing_finished)
-            self.pdf_handler.processing_progress.connect(self._on_processing_progress)
+            self._connect_signals(self.pdf_handler, _PDF_HANDLER_CONNECTIONS)
+            if self.right_panel:
+                # Step details go straight to the panel that shows them
+                self.pdf_handler.processing_progress.connect(
+                    self.right_panel.on_processing_progress, Qt.DirectConnection
+                )
             
             # Connect enhanced progress signals to status manager
             status_manager = self.get_status_manager()
             if status_manager:
-                self.pdf_handler.progress_started.connect(self._on_handler_progress_started)
-                self.pdf_handler.progress_updated.connect(self._on_handler_progress_updated)
-                self.pdf_handler.progress_finished.connect(self._on_handler_progress_finished)
+                self._connect_signals(self.pdf_handler, _PDF_HANDLER_PROGRESS_CONNECTIONS)
                 
                 # Connect process manager signals if available
                 if hasattr(self.pdf_handler, 'process_manager') and self.pdf_handler.process_manager:
-                    process_manager = self.pdf_handler.process_manager
-                    process_manager.process_started.connect(self._on_process_started)
-                    process_manager.process_finished.connect(self._on_process_finished)
-                    process_manager.process_output.connect(self._on_process_output)
-                    process_manager.process_error.connect(self._on_process_error)
-                    process_manager.process_queued.connect(self._on_process_queued)
-                    process_manager.process_cancelled.connect(self._on_process_cancelled)
-                    process_manager.queue_empty.connect(self._on_queue_empty)
-                    process_manager.process_progress_updated.connect(self._on_process_progress_updated)
-                    process_manager.queue_status_changed.connect(self._on_queue_status_changed)
+                    self._connect_signals(self.pdf_handler.process_manager, _PROCESS_MANAGER_CONNECTIONS)
             
             # Connect main window signals to PDF handler
-            self.pdf_dropped.connect(self.pdf_handler.handle_pdf_drop)
-            self.process_pdf_requested.connect(self.pdf_handler.start_full_processing)
-            self.stop_processing_requested.connect(self.pdf_handler.cancel_all_processing)
+            self.pdf_dropped.connect(self.pdf_handler.handle_pdf_drop, Qt.DirectConnection)
+            self.process_pdf_requested.connect(self.pdf_handler.start_full_processing, Qt.DirectConnection)
+            self.stop_processing_requested.connect(self.pdf_handler.cancel_all_processing, Qt.DirectConnection)
             
+    @pyqtSlot(str)
     def _on_pdf_processing_started(self, pdf_path: str):
         """Handle PDF processing started."""
         self.set_processing_active(True)
         self.add_enhanced_status_message(
-            f"Started processing: {os.path.basename(pdf_path)}", 
-            "info", "PDFHandler"
+            f"Started processing: {_basename(pdf_path)}", 
+            "info", _SOURCE_PDF_HANDLER
         )
         
+    @pyqtSlot(str, bool)
     def _on_pdf_processing_finished(self, pdf_path: str, success: bool):
         """Handle PDF processing finished."""
         self.set_processing_active(False)
         if success:
             self.add_enhanced_status_message(
-                f"Completed processing: {os.path.basename(pdf_path)}", 
-                "success", "PDFHandler"
+                f"Completed processing: {_basename(pdf_path)}", 
+                "success", _SOURCE_PDF_HANDLER
             )
         else:
             self.add_enhanced_status_message(
-                f"Failed processing: {os.path.basename(pdf_path)}", 
-                "error", "PDFHandler"
+                f"Failed processing: {_basename(pdf_path)}", 
+                "error", _SOURCE_PDF_HANDLER
             )
             
+    @pyqtSlot(str, bool)
     def _on_pdf_segmentation_finished(self, pdf_path: str, success: bool):
         """Handle PDF segmentation finished."""
         if success:
             self.add_enhanced_status_message(
-                f"Segmentation completed: {os.path.basename(pdf_path)}", 
-                "success", "PDFHandler"
+                f"Segmentation completed: {_basename(pdf_path)}", 
+                "success", _SOURCE_PDF_HANDLER
             )
         else:
             self.add_enhanced_status_message(
-                f"Segmentation failed: {os.path.basename(pdf_path)}", 
-                "error", "PDFHandler"
+                f"Segmentation failed: {_basename(pdf_path)}", 
+                "error", _SOURCE_PDF_HANDLER
             )
             
+    @pyqtSlot(str, bool)
     def _on_llm_processing_finished(self, pdf_path: str, success: bool):
         """Handle LLM processing finished."""
         if success:
             self.add_enhanced_status_message(
-                f"LLM processing completed: {os.path.basename(pdf_path)}", 
-                "success", "PDFHandler"
+                f"LLM processing completed: {_basename(pdf_path)}", 
+                "success", _SOURCE_PDF_HANDLER
             )
         else:
             self.add_enhanced_status_message(
-                f"LLM processing failed: {os.path.basename(pdf_path)}", 
-                "error", "PDFHandler"
+                f"LLM processing failed: {_basename(pdf_path)}", 
+                "error", _SOURCE_PDF_HANDLER
             )
             
-    def _on_processing_progress(self, pdf_path: str, step: int, description: str):
-        """Handle processing progress updates."""
-        self.add_processing_detail(f"Step {step}: {description}")
-        
+    @pyqtSlot(str, str)
     def _on_handler_progress_started(self, progress_id: str, title: str):
         """Handle enhanced progress started from handlers."""
         if self.right_panel:
-            from ..utils.status_manager import ProgressType
             self.right_panel.start_progress_indicator(title, ProgressType.INDETERMINATE, 100, "Starting...")
             
+    @pyqtSlot(str, int, str)
     def _on_handler_progress_updated(self, progress_id: str, current: int, message: str):
         """Handle enhanced progress updated from handlers."""
         if self.right_panel and current >= 0:  # -1 means no progress change
             self.right_panel.update_progress_indicator(progress_id, current=current, message=message)
             
+    @pyqtSlot(str, bool, str)
     def _on_handler_progress_finished(self, progress_id: str, success: bool, message: str):
         """Handle enhanced progress finished from handlers."""
         if self.right_panel:
             self.right_panel.finish_progress_indicator(progress_id, message)
     
+    @pyqtSlot(str)
     def _on_process_queued(self, process_id: str):
         """Handle process queued from process manager."""
         self.add_enhanced_status_message(
             f"Process queued: {process_id}", 
-            "info", "ProcessManager"
+            "info", _SOURCE_PROCESS_MANAGER
         )
         
         # Start a busy indicator for queued process
         if self.right_panel:
             self.right_panel.start_busy_indicator(f"Queued: {process_id}", "Waiting in queue...")
     
+    @pyqtSlot(str)
     def _on_process_cancelled(self, process_id: str):
         """Handle process cancelled from process manager."""
         self.add_enhanced_status_message(
             f"Process cancelled: {process_id}", 
-            "warning", "ProcessManager"
+            "warning", _SOURCE_PROCESS_MANAGER
         )
         
+        self._process_progress_ids.pop(process_id, None)
+        self._output_prefixes.pop(process_id, None)
+        
         # Finish any busy indicators for this process
         if self.right_panel:
             # Note: We'd need to track busy IDs per process for proper cleanup
             # For now, we'll rely on the process handler to manage this
             pass
     
+    @pyqtSlot()
     def _on_queue_empty(self):
         """Handle queue empty from process manager."""
         self.add_enhanced_status_message(
             "All processes completed", 
-            "success", "ProcessManager"
+            "success", _SOURCE_PROCESS_MANAGER
         )
         
         # Update processing state
         self.set_processing_active(False)
     
+    @pyqtSlot(str, int, str)
     def _on_process_progress_updated(self, process_id: str, percentage: int, message: str):
         """Handle process progress updates from process manager."""
         # Update any progress indicators with meaningful progress
-        if self.right_panel:
+        status_manager = self._status_manager
+        if status_manager:
             # Try to find matching progress indicator by process_id
-            status_manager = self.get_status_manager()
-            if status_manager:
-                active_progress = status_manager.get_active_progress()
-                for progress in active_progress:
-                    if process_id in progress.title or process_id in progress.message:
-                        status_manager.update_progress(progress.id, current=percentage, message=message)
-                        break
+            progress_id = self._process_progress_ids.get(process_id)
+            if progress_id is None or (progress_id and progress_id not in status_manager.active_progress):
+                progress_id = self._find_process_progress(status_manager, process_id)
+            if progress_id:
+                status_manager.update_progress(progress_id, current=percentage, message=message)
         
         # Also add to console output with progress info
-        self.append_console_output(f"[{process_id}] Progress: {percentage}% - {message}")
+        self.append_console_output(f"{self._output_prefix(process_id)}Progress: {percentage}% - {message}")
+    
+    def _output_prefix(self, process_id: str) -> str:
+        """Return the console line prefix for a process, building it once."""
+        prefix = self._output_prefixes.get(process_id)
+        if prefix is None:
+            prefix = self._output_prefixes[process_id] = f"[{process_id}] "
+        return prefix
     
+    def _find_process_progress(self, status_manager, process_id: str) -> str:
+        """
+        Find the active progress indicator that mentions a process.
+        
+        The result is remembered, so later updates for the process skip the
+        scan: a match until that indicator finishes, no match until another
+        indicator starts.
+        
+        Args:
+            status_manager: Status manager holding the active progress
+            process_id: Process identifier
+            
+        Returns:
+            Progress ID, or empty string if no indicator mentions the process
+        """
+        for progress in status_manager.get_active_progress():
+            if process_id in progress.title or process_id in progress.message:
+                self._process_progress_ids[process_id] = progress.id
+                return progress.id
+        self._process_progress_ids[process_id] = ""
+        return ""
+    
+    @pyqtSlot(ProgressInfo)
+    def _on_status_progress_started(self, progress_info):
+        """Forget unmatched processes so the new indicator can be matched."""
+        if "" in self._process_progress_ids.values():
+            self._process_progress_ids = {
+                process_id: progress_id
+                for process_id, progress_id in self._process_progress_ids.items()
+                if progress_id
+            }
+    
+    @pyqtSlot(int, int)
     def _on_queue_status_changed(self, queue_length: int, active_count: int):
         """Handle queue status changes from process manager."""
         if queue_length > 0 or active_count > 0:
             status_msg = f"Queue: {queue_length} waiting, {active_count} active"
             self.add_enhanced_status_message(
-                status_msg, "info", "ProcessManager", persistent=True, auto_remove_ms=5000
+                status_msg, "info", _SOURCE_PROCESS_MANAGER, persistent=True, auto_remove_ms=5000
             )
         
         # Update processing state based on activity
         is_busy = queue_length > 0 or active_count > 0
         self.set_processing_active(is_busy)
     
+    @pyqtSlot(str)
     def _on_process_started(self, process_id: str):
         """Handle process started from process manager."""
         self.add_enhanced_status_message(
             f"Process started: {process_id}", 
-            "info", "ProcessManager"
+            "info", _SOURCE_PROCESS_MANAGER
         )
         
         # Start a busy indicator for the process
         if self.right_panel:
             self.right_panel.start_busy_indicator(f"Running {process_id}", "Process executing...")
     
+    @pyqtSlot(str, int)
     def _on_process_finished(self, process_id: str, exit_code: int):
         """Handle process finished from process manager."""
         success = exit_code == 0
         status_level = "success" if success else "error"
         message = f"Process {process_id} {'completed' if success else 'failed'}"
         
-        self.add_enhanced_status_message(message, status_level, "ProcessManager")
+        self.add_enhanced_status_message(message, status_level, _SOURCE_PROCESS_MANAGER)
+        self._process_progress_ids.pop(process_id, None)
+        self._output_prefixes.pop(process_id, None)
         
         # Finish any busy indicators for this process
         if self.right_panel:
@@ -634,25 +775,24 @@ class MainWindow(BaseComponent):
             # For now, we'll rely on the process handler to manage this
             pass
     
-    def _on_process_output(self, process_id: str, output: str):
-        """Handle process output from process manager."""
-        # Add to console output
-        self.append_console_output(f"[{process_id}] {output}")
-        
-        # Update any progress indicators with meaningful output
-        if self.right_panel and len(output.strip()) < 100:  # Only short messages
-            # This would need process-to-progress mapping for proper implementation
-            pass
+    @pyqtSlot(str, list)
+    def _on_process_output_batch(self, process_id: str, lines: list):
+        """Handle the output lines of one process read from process manager."""
+        # One console append per read; the console itself batches appends
+        # further before laying out the text
+        prefix = self._output_prefix(process_id)
+        self.append_console_output("\n".join(prefix + line for line in lines))
     
+    @pyqtSlot(str, str)
     def _on_process_error(self, process_id: str, error: str):
         """Handle process error from process manager."""
         # Add to console output with error formatting
-        self.append_console_output(f"[{process_id}] ERROR: {error}")
+        self.append_console_output(f"{self._output_prefix(process_id)}ERROR: {error}")
         
         # Add error status message
         self.add_enhanced_status_message(
             f"Process error in {process_id}: {error}", 
-            "error", "ProcessManager", auto_remove_ms=10000
+            "error", _SOURCE_PROCESS_MANAGER, auto_remove_ms=10000
         )
             
     def get_pdf_handler(self):
@@ -5,14 +5,127 @@ Enhanced drag and drop widget for PDF files with proper visual feedback
 and file validation.
 """
 
-from PyQt5.QtWidgets import QListWidget, QListWidgetItem
-from PyQt5.QtCore import pyqtSignal, Qt, QMimeDatabase
+from PyQt5.QtWidgets import QListWidget
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont
+from functools import lru_cache
 import os
 import shutil
+import stat
+import tempfile
 
 from .base_component import BaseComponent
 
+# Parallel copies beyond this only make the disk seek between files
+_MAX_PARALLEL_COPIES = 4
+
+# Every PDF file starts with this header
+_PDF_MAGIC = b'%PDF-'
+
+
+def _looks_like_pdf(file_path: str) -> bool:
+    """Check only the file name, without touching the disk."""
+    return file_path.lower().endswith('.pdf')
+
+
+@lru_cache(maxsize=128)
+def _has_pdf_header(file_path: str, mtime_ns: int, size: int) -> bool:
+    """
+    Check that a file starts with the PDF header.
+    
+    The answer is cached, so a file validated again unchanged, such as the
+    same PDF dropped twice, is not read again. mtime_ns and size are part
+    of the key so a file that changes on disk is read again.
+    """
+    # Read just the header; a MIME database lookup is far slower and
+    # only ends up checking the same magic bytes for PDFs
+    with open(file_path, 'rb', buffering=0) as f:
+        return f.read(len(_PDF_MAGIC)) == _PDF_MAGIC
+
+
+def _remove_quietly(path: str):
+    """Remove a file, ignoring a failure to do so."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _link_if_free(part_path: str, dest_path: str) -> bool:
+    """Give a finished copy the name dest_path, unless that name is taken."""
+    try:
+        os.link(part_path, dest_path)
+        return True
+    except FileExistsError:
+        return False
+    except OSError:
+        pass
+    # No hard links on this filesystem: claim the name, then move the copy
+    # over the empty placeholder
+    try:
+        fd = os.open(dest_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        return False
+    os.close(fd)
+    os.replace(part_path, dest_path)
+    return True
+
+
+def _copy_into_dir(source_path: str, pdf_dir: str) -> str:
+    """
+    Copy a file into pdf_dir under its own name, or name_N if that is taken.
+    
+    The copy is written to a hidden .part file and only linked to its final
+    name once complete, so the directory never lists a partial PDF. Linking
+    fails if the name exists, which makes finding a free name and taking it
+    one atomic step, even with several copies running at once.
+    """
+    filename = os.path.basename(source_path)
+    fd, part_path = tempfile.mkstemp(prefix=f".{filename}.", suffix='.part', dir=pdf_dir)
+    os.close(fd)
+    try:
+        # copy2 already uses the platform fast-copy path (sendfile on Linux,
+        # fcopyfile on macOS, 1 MiB readinto chunks on Windows)
+        shutil.copy2(source_path, part_path)
+        
+        # Handle duplicate filenames
+        dest_path = os.path.join(pdf_dir, filename)
+        counter = 1
+        base_name, ext = os.path.splitext(filename)
+        while not _link_if_free(part_path, dest_path):
+            new_filename = f"{base_name}_{counter}{ext}"
+            dest_path = os.path.join(pdf_dir, new_filename)
+            counter += 1
+        return dest_path
+    finally:
+        _remove_quietly(part_path)
+
+
+class _CopyWorkerSignals(QObject):
+    """Signals emitted by _CopyWorker; QRunnable cannot emit signals itself."""
+    
+    finished = pyqtSignal(str, str)  # source_path, dest_path
+    failed = pyqtSignal(str, str)  # source_path, error_message
+
+
+class _CopyWorker(QRunnable):
+    """Copy one dropped PDF into the data/pdf directory on a pool thread."""
+    
+    def __init__(self, source_path: str, pdf_dir: str):
+        super().__init__()
+        self.source_path = source_path
+        self.pdf_dir = pdf_dir
+        self.signals = _CopyWorkerSignals()
+        
+    def run(self):
+        """Copy the file and report the outcome."""
+        try:
+            dest_path = _copy_into_dir(self.source_path, self.pdf_dir)
+        except Exception as e:
+            self.signals.failed.emit(self.source_path, str(e))
+        else:
+            self.signals.finished.emit(self.source_path, dest_path)
+
 
 class PDFDropWidget(QListWidget):
     """
@@ -31,8 +144,10 @@ class PDFDropWidget(QListWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._drag_active = False
-        self._mime_db = QMimeDatabase()
         self.logger = None  # Will be set by parent if needed
+        # Dropped files are copied off the GUI thread
+        self._copy_pool = QThreadPool(self)
+        self._copy_pool.setMaxThreadCount(_MAX_PARALLEL_COPIES)
         self.initialize()
         
     def initialize(self):
@@ -59,6 +174,7 @@ class PDFDropWidget(QListWidget):
         
     def refresh_pdf_list(self):
         """Refresh the list of PDF files from the data/pdf directory."""
+        _has_pdf_header.cache_clear()
         self.clear()
         pdf_dir = self._get_pdf_directory()
         
@@ -67,12 +183,22 @@ class PDFDropWidget(QListWidget):
             return
             
         try:
-            for fname in os.listdir(pdf_dir):
-                if fname.lower().endswith('.pdf'):
-                    self.addItem(QListWidgetItem(fname))
+            # scandir reports the entry type with the name, so no extra stat
+            # is needed to skip directories
+            with os.scandir(pdf_dir) as entries:
+                names = [entry.name for entry in entries
+                         if entry.name.lower().endswith('.pdf') and entry.is_file()]
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error refreshing PDF list: {e}")
+            return
+            
+        # Insert all rows at once and repaint the list a single time
+        self.setUpdatesEnabled(False)
+        try:
+            self.addItems(names)
+        finally:
+            self.setUpdatesEnabled(True)
                 
     def _get_pdf_directory(self) -> str:
         """Get the PDF directory path."""
@@ -82,7 +208,7 @@ class PDFDropWidget(QListWidget):
         ))
         
     def dragEnterEvent(self, event):
-        """Handle drag enter events with proper MIME type validation."""
+        """Handle drag enter events, accepting drags that carry a .pdf file."""
         try:
             if not event:
                 return
@@ -95,15 +221,9 @@ class PDFDropWidget(QListWidget):
                 event.ignore()
                 return
                 
-            # Check if any of the dragged files are PDFs using MIME type
-            valid_pdf_found = False
-            for url in mime.urls():
-                file_path = url.toLocalFile()
-                if self._is_valid_pdf_file(file_path):
-                    valid_pdf_found = True
-                    break
-                    
-            if valid_pdf_found:
+            # Drag-enter only checks names; files are fully validated on drop
+            urls = mime.urls()
+            if any(_looks_like_pdf(url.toLocalFile()) for url in urls):
                 self._drag_active = True
                 self.setProperty("dragActive", True)
                 self.style().polish(self)  # Refresh styling
@@ -151,7 +271,7 @@ class PDFDropWidget(QListWidget):
                 event.ignore()
                 return
                 
-            processed_files = []
+            started_copies = 0
             
             # Process each dropped file
             for url in mime.urls():
@@ -163,22 +283,18 @@ class PDFDropWidget(QListWidget):
                     self.pdf_drop_rejected.emit(file_path, validation_result['reason'])
                     continue
                 
-                # Copy PDF to data directory and request pre-processing
+                # Copy PDF to data directory in the background; pre-processing
+                # is requested once the copy finishes
                 try:
-                    copied_path = self._copy_pdf_to_data_dir(file_path)
-                    if copied_path:
-                        processed_files.append(copied_path)
-                        self.pdf_dropped.emit(copied_path)
-                        # Request pre-processing only (convert to text)
-                        self.pdf_preprocess_requested.emit(copied_path)
+                    self._start_copy(file_path)
+                    started_copies += 1
                         
                 except Exception as e:
                     self._handle_error("file_copy", f"Failed to copy {file_path}: {e}")
                     self.pdf_drop_rejected.emit(file_path, f"Copy failed: {e}")
                     
-            if processed_files:
-                self._emit_status(f"Successfully processed {len(processed_files)} PDF file(s)")
-                self.refresh_pdf_list()
+            if started_copies:
+                self._emit_status(f"Copying {started_copies} PDF file(s)")
             
             event.acceptProposedAction()
             
@@ -207,48 +323,37 @@ class PDFDropWidget(QListWidget):
             
             painter.end()
             
-    def _is_valid_pdf_file(self, file_path: str) -> bool:
-        """Check if file is a valid PDF using MIME type detection."""
-        if not file_path or not os.path.isfile(file_path):
-            return False
-            
-        try:
-            # Check file extension first (quick check)
-            if not file_path.lower().endswith('.pdf'):
-                return False
-                
-            # Check MIME type for more robust validation
-            mime_type = self._mime_db.mimeTypeForFile(file_path)
-            return mime_type.name() == 'application/pdf'
-            
-        except Exception as e:
-            if self.logger:
-                self.logger.warning(f"Error checking PDF file {file_path}: {e}")
-            return False
-            
     def _validate_pdf_file(self, file_path: str) -> dict:
         """Comprehensive PDF file validation."""
         if not file_path:
             return {'valid': False, 'reason': 'Empty file path'}
             
-        if not os.path.exists(file_path):
+        # One stat answers existence, type and size
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return {'valid': False, 'reason': 'File does not exist'}
+        except Exception as e:
+            return {'valid': False, 'reason': f'Cannot read file size: {e}'}
             
-        if not os.path.isfile(file_path):
+        if not stat.S_ISREG(st.st_mode):
             return {'valid': False, 'reason': 'Path is not a file'}
             
         # Check file size (avoid empty files or extremely large files)
-        try:
-            file_size = os.path.getsize(file_path)
-            if file_size == 0:
-                return {'valid': False, 'reason': 'File is empty'}
-            if file_size > 100 * 1024 * 1024:  # 100MB limit
-                return {'valid': False, 'reason': 'File too large (>100MB)'}
-        except Exception as e:
-            return {'valid': False, 'reason': f'Cannot read file size: {e}'}
+        if st.st_size == 0:
+            return {'valid': False, 'reason': 'File is empty'}
+        if st.st_size > 100 * 1024 * 1024:  # 100MB limit
+            return {'valid': False, 'reason': 'File too large (>100MB)'}
             
         # Check if it's a valid PDF
-        if not self._is_valid_pdf_file(file_path):
+        try:
+            is_pdf = (_looks_like_pdf(file_path)
+                      and _has_pdf_header(file_path, st.st_mtime_ns, st.st_size))
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Error checking PDF file {file_path}: {e}")
+            is_pdf = False
+        if not is_pdf:
             return {'valid': False, 'reason': 'Not a valid PDF file'}
             
         return {'valid': True, 'reason': 'Valid PDF file'}
@@ -261,19 +366,8 @@ class PDFDropWidget(QListWidget):
         pdf_dir = self._get_pdf_directory()
         os.makedirs(pdf_dir, exist_ok=True)
         
-        filename = os.path.basename(source_path)
-        dest_path = os.path.join(pdf_dir, filename)
-        
-        # Handle duplicate filenames
-        counter = 1
-        base_name, ext = os.path.splitext(filename)
-        while os.path.exists(dest_path):
-            new_filename = f"{base_name}_{counter}{ext}"
-            dest_path = os.path.join(pdf_dir, new_filename)
-            counter += 1
-            
         try:
-            shutil.copy2(source_path, dest_path)
+            dest_path = _copy_into_dir(source_path, pdf_dir)
             if self.logger:
                 self.logger.info(f"PDF copied to: {dest_path}")
             return dest_path
@@ -282,6 +376,38 @@ class PDFDropWidget(QListWidget):
                 self.logger.error(f"Failed to copy PDF: {e}")
             raise
             
+    def _start_copy(self, source_path: str):
+        """Copy a PDF that passed _validate_pdf_file to data/pdf on the copy pool."""
+        pdf_dir = self._get_pdf_directory()
+        os.makedirs(pdf_dir, exist_ok=True)
+        
+        worker = _CopyWorker(source_path, pdf_dir)
+        # The worker emits from a pool thread
+        worker.signals.finished.connect(self._on_copy_finished, Qt.QueuedConnection)
+        worker.signals.failed.connect(self._on_copy_failed, Qt.QueuedConnection)
+        self._copy_pool.start(worker)
+        
+    @pyqtSlot(str, str)
+    def _on_copy_finished(self, source_path: str, dest_path: str):
+        """Announce a copied PDF and request its pre-processing."""
+        if self.logger:
+            self.logger.info(f"PDF copied to: {dest_path}")
+        self.pdf_dropped.emit(dest_path)
+        # Request pre-processing only (convert to text)
+        self.pdf_preprocess_requested.emit(dest_path)
+        
+        # List just this file; a full refresh per copy would rescan the
+        # directory once for every file of a multi-file drop
+        filename = os.path.basename(dest_path)
+        if not self.findItems(filename, Qt.MatchExactly):
+            self.addItem(filename)
+        
+    @pyqtSlot(str, str)
+    def _on_copy_failed(self, source_path: str, error_message: str):
+        """Reject a dropped file whose copy failed."""
+        self._handle_error("file_copy", f"Failed to copy {source_path}: {error_message}")
+        self.pdf_drop_rejected.emit(source_path, f"Copy failed: {error_message}")
+        
     def _emit_status(self, message: str):
         """Emit status message if logger is available."""
         if self.logger:
@@ -6,16 +6,73 @@ Enhanced progress indicator widgets for the PDF Cleanup Agent.
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QProgressBar, QPushButton, QFrame, QScrollArea,
-                             QSizePolicy, QGroupBox)
-from PyQt5.QtCore import pyqtSignal, QTimer, Qt, QPropertyAnimation, QEasingCurve
+                             QSizePolicy, QGroupBox, QListView, QStyledItemDelegate)
+from PyQt5.QtCore import (pyqtSignal, pyqtSlot, QObject, QTimer, Qt, QPropertyAnimation,
+                          QEasingCurve, QAbstractListModel, QModelIndex, QEvent, QRect, QSize)
 from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QFont
+from PyQt5 import sip
 from typing import Dict, Optional, List
 import math
+import weakref
 
 from .base_component import BaseComponent
 from ..utils.status_manager import ProgressInfo, ProgressType, BusyIndicator, StatusMessage, StatusLevel
 from ..styles.app_styles import get_app_styles
 
+# When False, animated widgets jump straight to their final state and
+# never start a timer; the test suite turns this off
+_animations_enabled = True
+
+
+class _AnimationClock(QObject):
+    """
+    Shared timer that ticks every animation widget running at one interval.
+    
+    One timeout per interval is dispatched through the event loop no matter
+    how many spinners or pulse bars are visible.
+    """
+    
+    def __init__(self, interval_ms: int):
+        super().__init__()
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self._tick)
+        self.subscribers = weakref.WeakSet()
+        
+    def subscribe(self, widget):
+        """Start ticking a widget, starting the timer if it was idle."""
+        self.subscribers.add(widget)
+        if not self.timer.isActive():
+            self.timer.start()
+            
+    def unsubscribe(self, widget):
+        """Stop ticking a widget, stopping the timer once none are left."""
+        self.subscribers.discard(widget)
+        if not self.subscribers:
+            self.timer.stop()
+            
+    @pyqtSlot()
+    def _tick(self):
+        """Advance every subscribed widget by one frame."""
+        for widget in list(self.subscribers):
+            if sip.isdeleted(widget):
+                self.subscribers.discard(widget)
+            else:
+                widget._on_animation_tick()
+        if not self.subscribers:
+            self.timer.stop()
+
+
+_animation_clocks: Dict[int, _AnimationClock] = {}
+
+
+def _animation_clock(interval_ms: int) -> _AnimationClock:
+    """Get the shared animation clock for an interval, creating it on first use."""
+    clock = _animation_clocks.get(interval_ms)
+    if clock is None:
+        clock = _animation_clocks[interval_ms] = _AnimationClock(interval_ms)
+    return clock
+
 
 class AnimatedProgressBar(QProgressBar):
     """
@@ -42,6 +99,9 @@ class AnimatedProgressBar(QProgressBar):
         
     def setValueAnimated(self, value: int):
         """Set progress value with smooth animation."""
+        if not _animations_enabled:
+            self.setValue(value)
+            return
         self.animation.setStartValue(self.value())
         self.animation.setEndValue(value)
         self.animation.start()
@@ -58,10 +118,15 @@ class PulsingProgressBar(QWidget):
         self.pulse_value = 0
         self.pulse_direction = 1
         
-        # Timer for pulsing animation
-        self.pulse_timer = QTimer()
-        self.pulse_timer.timeout.connect(self._update_pulse)
-        self.pulse_timer.start(50)  # 20 FPS
+        # Shared clock for pulsing animation
+        self._clock = _animation_clock(50)  # 20 FPS
+        self.pulse_timer = self._clock.timer
+        if _animations_enabled:
+            self._clock.subscribe(self)
+        
+    def _on_animation_tick(self):
+        """Advance the pulse by one frame."""
+        self._update_pulse()
         
     def _update_pulse(self):
         """Update pulse animation."""
@@ -95,8 +160,8 @@ class PulsingProgressBar(QWidget):
         painter.drawRoundedRect(bar_rect, 6, 6)
         
     def cleanup(self):
-        """Stop the pulse timer."""
-        self.pulse_timer.stop()
+        """Stop receiving pulse ticks."""
+        self._clock.unsubscribe(self)
 
 
 class BusySpinner(QWidget):
@@ -109,10 +174,15 @@ class BusySpinner(QWidget):
         self.setFixedSize(24, 24)
         self.angle = 0
         
-        # Timer for spinning animation
-        self.spin_timer = QTimer()
-        self.spin_timer.timeout.connect(self._update_spin)
-        self.spin_timer.start(100)  # 10 FPS
+        # Shared clock for spinning animation
+        self._clock = _animation_clock(100)  # 10 FPS
+        self.spin_timer = self._clock.timer
+        if _animations_enabled:
+            self._clock.subscribe(self)
+        
+    def _on_animation_tick(self):
+        """Advance the spinner by one frame."""
+        self._update_spin()
         
     def _update_spin(self):
         """Update spinning animation."""
@@ -145,8 +215,8 @@ class BusySpinner(QWidget):
             painter.rotate(45)
             
     def cleanup(self):
-        """Stop the spin timer."""
-        self.spin_timer.stop()
+        """Stop receiving spin ticks."""
+        self._clock.unsubscribe(self)
 
 
 class ProgressWidget(BaseComponent):
@@ -246,6 +316,7 @@ class ProgressWidget(BaseComponent):
                 }}
             """)
     
+    @pyqtSlot()
     def _on_cancel_clicked(self):
         """Handle cancel button click."""
         self.cancel_requested.emit(self.progress_info.id)
@@ -353,6 +424,10 @@ class StatusMessageWidget(BaseComponent):
     # Signals
     message_dismissed = pyqtSignal(str)  # message_id
     
+    # Style sheets per level, built once for the styles instance they came from
+    _QSS_BY_LEVEL: Dict[StatusLevel, str] = {}
+    _qss_styles = None
+    
     def __init__(self, status_message: StatusMessage, parent=None):
         super().__init__(parent)
         self.status_message = status_message
@@ -390,19 +465,170 @@ class StatusMessageWidget(BaseComponent):
         
     def _apply_level_styling(self):
         """Apply styling based on message level."""
-        styles = get_app_styles()
-        
-
+        self.setStyleSheet(self._level_style_sheet(self.status_message.level))
         
+    @classmethod
+    def _level_style_sheet(cls, level: StatusLevel) -> str:
+        """Return the cached style sheet for a message level."""
         styles = get_app_styles()
-        level_name = self.status_message.level.name.lower()
-        self.setStyleSheet(styles.get_status_message_widget_style(level_name))
-        
+        if cls._qss_styles is not styles:
+            # Styles were refreshed (e.g. theme change); rebuild on demand
+            cls._QSS_BY_LEVEL.clear()
+            cls._qss_styles = styles
+        
+        qss = cls._QSS_BY_LEVEL.get(level)
+        if qss is None:
+            qss = styles.get_status_message_widget_style(level.name.lower())
+            cls._QSS_BY_LEVEL[level] = qss
+        return qss
+        
+    @pyqtSlot()
     def _on_dismiss_clicked(self):
         """Handle dismiss button click."""
         self.message_dismissed.emit(self.status_message.id)
 
 
+class StatusMessageModel(QAbstractListModel):
+    """
+    List model of status messages, one row per message in arrival order.
+    """
+    
+    MessageRole = Qt.UserRole + 1
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._messages: List[StatusMessage] = []
+        self._rows: Dict[str, int] = {}  # message_id -> row in _messages
+        
+    def __contains__(self, message_id: str) -> bool:
+        return message_id in self._rows
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._messages)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        message = self._messages[index.row()]
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return message.message
+        if role == self.MessageRole:
+            return message
+        return None
+        
+    def add_messages(self, status_messages: List[StatusMessage]):
+        """Append messages that are not already shown in one insertion."""
+        first = len(self._messages)
+        new_rows = {}
+        new_messages = []
+        for status_message in status_messages:
+            if status_message.id not in self._rows and status_message.id not in new_rows:
+                new_rows[status_message.id] = first + len(new_messages)
+                new_messages.append(status_message)
+        if not new_messages:
+            return
+        self.beginInsertRows(QModelIndex(), first, first + len(new_messages) - 1)
+        self._messages.extend(new_messages)
+        self._rows.update(new_rows)
+        self.endInsertRows()
+        
+    def update_message(self, status_message: StatusMessage) -> bool:
+        """Replace a shown message and repaint only its row."""
+        row = self._rows.get(status_message.id)
+        if row is None:
+            return False
+        self._messages[row] = status_message
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
+        
+    def remove_message(self, message_id: str) -> bool:
+        """Remove a shown message."""
+        row = self._rows.get(message_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._messages[row]
+        del self._rows[message_id]
+        # Rows below the removed one move up by one
+        for later_row in range(row, len(self._messages)):
+            self._rows[self._messages[later_row].id] = later_row
+        self.endRemoveRows()
+        return True
+        
+    def clear(self):
+        """Remove all messages."""
+        self.beginResetModel()
+        self._messages.clear()
+        self._rows.clear()
+        self.endResetModel()
+
+
+class StatusMessageDelegate(QStyledItemDelegate):
+    """
+    Paints status message rows directly, styled like StatusMessageWidget.
+    """
+    
+    # Signals
+    dismiss_requested = pyqtSignal(str)  # message_id
+    
+    MARGIN = 2
+    PADDING = 8
+    DISMISS_SIZE = 16
+    
+    def _frame_rect(self, option) -> QRect:
+        margin = self.MARGIN
+        return option.rect.adjusted(margin, margin, -margin, -margin)
+        
+    def _dismiss_rect(self, option) -> QRect:
+        frame = self._frame_rect(option)
+        size = self.DISMISS_SIZE
+        return QRect(frame.right() - self.PADDING - size + 1,
+                     frame.center().y() - size // 2, size, size)
+        
+    def paint(self, painter, option, index):
+        status_message = index.data(StatusMessageModel.MessageRole)
+        if status_message is None:
+            super().paint(painter, option, index)
+            return
+        
+        styles = get_app_styles()
+        colors = styles.STATUS_COLORS.get(status_message.level.value, styles.STATUS_COLORS['info'])
+        frame = self._frame_rect(option)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(colors['border']), 1))
+        painter.setBrush(QBrush(QColor(colors['background'])))
+        painter.drawRoundedRect(frame, 4, 4)
+        
+        text_rect = frame.adjusted(self.PADDING, 0, -self.PADDING, 0)
+        if not status_message.persistent:
+            text_rect.setRight(self._dismiss_rect(option).left() - self.PADDING)
+            painter.setPen(QColor(colors['text']))
+            painter.drawText(self._dismiss_rect(option), Qt.AlignCenter, "✕")
+        
+        painter.setFont(option.font)
+        painter.setPen(QColor(colors['text']))
+        text = option.fontMetrics.elidedText(status_message.message, Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, text)
+        painter.restore()
+        
+    def sizeHint(self, option, index) -> QSize:
+        height = max(option.fontMetrics.height(), self.DISMISS_SIZE)
+        return QSize(option.rect.width(), height + 2 * (self.PADDING + self.MARGIN))
+        
+    def editorEvent(self, event, model, option, index):
+        """Request dismissal when the ✕ of a non-persistent row is clicked."""
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            status_message = index.data(StatusMessageModel.MessageRole)
+            if (status_message is not None and not status_message.persistent
+                    and self._dismiss_rect(option).contains(event.pos())):
+                self.dismiss_requested.emit(status_message.id)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
 class ProgressPanel(BaseComponent):
     """
     Panel for displaying all progress indicators and status messages.
@@ -416,12 +642,13 @@ class ProgressPanel(BaseComponent):
         super().__init__(parent)
         self.progress_widgets: Dict[str, ProgressWidget] = {}
         self.busy_widgets: Dict[str, BusyWidget] = {}
-        self.status_widgets: Dict[str, StatusMessageWidget] = {}
+        self.status_model = StatusMessageModel(self)
+        self.status_delegate = StatusMessageDelegate(self)
+        self.status_delegate.dismiss_requested.connect(self.status_message_dismissed)
         
         self.progress_scroll_area = None
-        self.status_scroll_area = None
+        self.status_list_view = None
         self.progress_container = None
-        self.status_container = None
         
     def _setup_ui(self):
         """Setup the progress panel UI."""
@@ -454,18 +681,17 @@ class ProgressPanel(BaseComponent):
         status_layout = QVBoxLayout()
         status_group.setLayout(status_layout)
         
-        # Scroll area for status messages
-        self.status_scroll_area = QScrollArea()
-        self.status_scroll_area.setWidgetResizable(True)
-        self.status_scroll_area.setMaximumHeight(150)
-        self.status_scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.status_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        
-        self.status_container = QWidget()
-        self.status_container.setLayout(QVBoxLayout())
-        self.status_scroll_area.setWidget(self.status_container)
-        
-        status_layout.addWidget(self.status_scroll_area)
+        # List view for status messages; rows are painted by the delegate
+        self.status_list_view = QListView()
+        self.status_list_view.setModel(self.status_model)
+        self.status_list_view.setItemDelegate(self.status_delegate)
+        self.status_list_view.setUniformItemSizes(True)
+        self.status_list_view.setSelectionMode(QListView.NoSelection)
+        self.status_list_view.setMaximumHeight(150)
+        self.status_list_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.status_list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        
+        status_layout.addWidget(self.status_list_view)
         layout.addWidget(status_group)
         
         # Initially hide if no content
@@ -482,7 +708,7 @@ class ProgressPanel(BaseComponent):
             
         widget = ProgressWidget(progress_info)
         widget.initialize()
-        widget.cancel_requested.connect(self.progress_cancelled.emit)
+        widget.cancel_requested.connect(self.progress_cancelled)
         
         self.progress_widgets[progress_info.id] = widget
         if self.progress_container and self.progress_container.layout():
@@ -503,19 +729,14 @@ class ProgressPanel(BaseComponent):
         self._update_visibility()
         
     def add_status_widget(self, status_message: StatusMessage):
-        """Add a status message widget."""
-        if status_message.id in self.status_widgets:
-            return
-            
-        widget = StatusMessageWidget(status_message)
-        widget.initialize()
-        widget.message_dismissed.connect(self.status_message_dismissed.emit)
-        
-        self.status_widgets[status_message.id] = widget
-        if self.status_container and self.status_container.layout():
-            self.status_container.layout().addWidget(widget)
+        """Add a status message row."""
+        self.status_model.add_messages([status_message])
         self._update_visibility()
         
+    def update_status_widget(self, status_message: StatusMessage):
+        """Update a status message row."""
+        self.status_model.update_message(status_message)
+        
     def update_progress_widget(self, progress_info: ProgressInfo):
         """Update a progress widget."""
         if progress_info.id in self.progress_widgets:
@@ -545,12 +766,8 @@ class ProgressPanel(BaseComponent):
             self._update_visibility()
             
     def remove_status_widget(self, message_id: str):
-        """Remove a status message widget."""
-        if message_id in self.status_widgets:
-            widget = self.status_widgets[message_id]
-            widget.cleanup()
-            widget.setParent(None)
-            del self.status_widgets[message_id]
+        """Remove a status message row."""
+        if self.status_model.remove_message(message_id):
             self._update_visibility()
             
     def clear_all_widgets(self):
@@ -567,18 +784,15 @@ class ProgressPanel(BaseComponent):
             widget.setParent(None)
         self.busy_widgets.clear()
         
-        # Clear status widgets
-        for widget in self.status_widgets.values():
-            widget.cleanup()
-            widget.setParent(None)
-        self.status_widgets.clear()
+        # Clear status messages
+        self.status_model.clear()
         
         self._update_visibility()
         
     def _update_visibility(self):
         """Update panel visibility based on content."""
         has_progress = len(self.progress_widgets) > 0 or len(self.busy_widgets) > 0
-        has_status = len(self.status_widgets) > 0
+        has_status = self.status_model.rowCount() > 0
         
         self.setVisible(has_progress or has_status)
         
@@ -7,12 +7,12 @@ Contains control buttons and status information.
 from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
     QProgressBar, QFrame, QGroupBox, QTextEdit, QSpacerItem,
     QSizePolicy, QSplitter)
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt
 from PyQt5.QtGui import QFont
 
 from .base_component import BaseComponent
 from .progress_widgets import AnimatedProgressBar
-from ..utils.status_manager import StatusManager, StatusLevel, ProgressType
+from ..utils.status_manager import StatusManager, StatusLevel, ProgressType, StatusMessage, ProgressInfo
 from ..styles.app_styles import get_app_styles
 
 
@@ -39,6 +39,7 @@ class RightPanel(BaseComponent):
         self.stop_button = None
         self.progress_bar = None
         self.status_label = None
+        self._status_label_type = None  # status_type the label is styled for
         self.current_pdf_label = None
         self.processing_status = None
         
@@ -106,7 +107,7 @@ class RightPanel(BaseComponent):
         # Stop processing button
         self.stop_button = QPushButton("Stop Processing")
         self.stop_button.setStyleSheet(styles.BUTTON_ERROR)
-        self.stop_button.clicked.connect(self.stop_processing_requested.emit)
+        self.stop_button.clicked.connect(self.stop_processing_requested)
         self.stop_button.setEnabled(False)  # Initially disabled
         self.stop_button.setVisible(True)  # Explicitly set visible
         self.stop_button.setMinimumHeight(35)  # Ensure minimum height
@@ -174,12 +175,12 @@ class RightPanel(BaseComponent):
         
         # Clear console button
         clear_console_btn = QPushButton("Clear Console")
-        clear_console_btn.clicked.connect(self.clear_console_requested.emit)
+        clear_console_btn.clicked.connect(self.clear_console_requested)
         utility_layout.addWidget(clear_console_btn)
         
         # Refresh PDF list button
         refresh_list_btn = QPushButton("Refresh PDF List")
-        refresh_list_btn.clicked.connect(self.refresh_pdf_list_requested.emit)
+        refresh_list_btn.clicked.connect(self.refresh_pdf_list_requested)
         utility_layout.addWidget(refresh_list_btn)
         
         # Separator
@@ -215,15 +216,18 @@ class RightPanel(BaseComponent):
         # Connect status manager signals
         if self.status_manager:
             self.status_manager.status_message_added.connect(self._on_status_message_added)
+            self.status_manager.status_messages_bulk_added.connect(self._on_status_messages_bulk_added)
             self.status_manager.progress_started.connect(self._on_progress_started)
             self.status_manager.progress_updated.connect(self._on_progress_updated)
             self.status_manager.progress_finished.connect(self._on_progress_finished)
         
+    @pyqtSlot()
     def _on_process_pdf_clicked(self):
         """Handle process PDF button click."""
         # This will be connected to get the selected PDF from left panel
         self.process_pdf_requested.emit("")  # Empty string means use selected PDF
         
+    @pyqtSlot()
     def _on_open_data_directory(self):
         """Handle open data directory button click."""
         import os
@@ -261,6 +265,7 @@ class RightPanel(BaseComponent):
             import traceback
             self.logger.error(f"Data directory error: {traceback.format_exc()}")
             
+    @pyqtSlot()
     def _on_edit_prompts_clicked(self):
         """Handle edit prompts button click."""
         import os
@@ -377,6 +382,7 @@ class RightPanel(BaseComponent):
             import traceback
             self.logger.error(f"Prompts file error: {traceback.format_exc()}")
             
+    @pyqtSlot()
     def _on_select_model_clicked(self):
         """Handle select model button click."""
         import os
@@ -440,6 +446,7 @@ available_models:
             import traceback
             self.logger.error(f"Model config error: {traceback.format_exc()}")
         
+    @pyqtSlot(str)
     def set_current_pdf(self, pdf_path: str):
         """
         Set the current PDF being processed.
@@ -456,24 +463,31 @@ available_models:
             else:
                 self.current_pdf_label.setText("No PDF selected")
                 
-    def set_status(self, status: str, status_type: str = "info"):
+    def set_status(self, status: str, status_type: str = "info",
+                   level: StatusLevel = None, source: str = None):
         """
         Set the status message with appropriate styling.
         
         Args:
             status: Status message
             status_type: Type of status ('info', 'success', 'warning', 'error')
+            level: If given, also add the message to the status manager at this level
+            source: Source component name for the status manager message
         """
         if self.status_label:
             self.status_label.setText(status)
             
-            styles = get_app_styles()
-            
-            # Apply styling based on status type
-            self.status_label.setStyleSheet(styles.get_status_label_style(status_type))
-            self.status_label.setMinimumHeight(30)  # Ensure readable height
+            # Restyling repolishes the label, so only do it when the type changes
+            if status_type != self._status_label_type:
+                styles = get_app_styles()
+                self.status_label.setStyleSheet(styles.get_status_label_style(status_type))
+                self.status_label.setMinimumHeight(30)  # Ensure readable height
+                self._status_label_type = status_type
             self._emit_status(f"Status updated: {status} ({status_type})")
             
+        if level is not None:
+            self.add_status_message(status, level, source=source)
+            
     def add_processing_detail(self, detail: str):
         """
         Add a processing detail to the status area.
@@ -484,6 +498,18 @@ available_models:
         # Processing details now go to console in left panel
         self._emit_status(f"Processing: {detail}")
             
+    @pyqtSlot(str, int, str)
+    def on_processing_progress(self, pdf_path: str, step: int, description: str):
+        """
+        Add a processing step reported by the PDF handler.
+        
+        Args:
+            pdf_path: Path of the PDF being processed
+            step: Step number
+            description: Step description
+        """
+        self._emit_status(f"Processing: Step {step}: {description}")
+        
     def clear_processing_details(self):
         """Clear the processing details."""
         # Processing details now go to console in left panel
@@ -658,11 +684,22 @@ available_models:
     
     # Signal handlers for enhanced status system
     
+    @pyqtSlot(StatusMessage)
     def _on_status_message_added(self, status_message):
         """Handle new status message."""
         # Status messages now go to console in left panel
         self._emit_status(f"Status: {status_message.message}")
     
+    @pyqtSlot(list)
+    def _on_status_messages_bulk_added(self, message_ids):
+        """Handle a batch of new status messages with one console update."""
+        status_messages = self.status_manager.status_messages
+        lines = [f"Status: {status_messages[message_id].message}"
+                 for message_id in message_ids if message_id in status_messages]
+        if lines:
+            self._emit_status("\n".join(lines))
+    
+    @pyqtSlot(ProgressInfo)
     def _on_progress_started(self, progress_info):
         """Handle progress started."""
         # Update main progress bar for primary operation
@@ -671,6 +708,7 @@ available_models:
             self.progress_bar.setValueAnimated(progress_info.current)
             self.progress_bar.setVisible(True)
     
+    @pyqtSlot(ProgressInfo)
     def _on_progress_updated(self, progress_info):
         """Handle progress updated."""
         # Update main progress bar for primary operation
@@ -678,6 +716,7 @@ available_models:
             self.progress_bar.setMaximum(progress_info.maximum)
             self.progress_bar.setValueAnimated(progress_info.current)
     
+    @pyqtSlot(str)
     def _on_progress_finished(self, progress_id: str):
         """Handle progress finished."""
         # Hide main progress bar if no active progress
@@ -743,11 +782,12 @@ available_models:
                 background-color: #a4262c;
             }
         """)
-        self.stop_button.clicked.connect(self.stop_processing_requested.emit)
+        self.stop_button.clicked.connect(self.stop_processing_requested)
         self.stop_button.setEnabled(False)
         layout.addWidget(self.stop_button)
         
         # Basic status label
+        self._status_label_type = None
         self.status_label = QLabel("Ready")
         self.status_label.setStyleSheet("""
             QLabel {
@@ -5,13 +5,14 @@ This module contains all business logic handlers that manage application operati
 """
 
 from .base_handler import BaseHandler
-from .pdf_handler import PDFHandler
+from .pdf_handler import PDFHandler, wire_pdf_handler
 from .process_handler import ProcessManager
 from .file_handler import FileHandler
 
 __all__ = [
     'BaseHandler',
     'PDFHandler',
+    'wire_pdf_handler',
     'ProcessManager',
     'FileHandler',
 ]
\ No newline at end of file
@@ -93,6 +93,23 @@ class ProcessingState:
         return datetime.now().isoformat()
 
 
+def wire_pdf_handler(handler, status_manager) -> bool:
+    """
+    Give a PDF handler its status manager reference.
+    
+    Args:
+        handler: PDFHandler (or compatible) instance
+        status_manager: StatusManager instance, may be None
+        
+    Returns:
+        True if the status manager was set, False otherwise
+    """
+    if status_manager and hasattr(handler, 'set_status_manager'):
+        handler.set_status_manager(status_manager)
+        return True
+    return False
+
+
 class PDFHandler(BaseHandler):
     """
     Handles PDF file operations and processing pipeline.
@@ -5,11 +5,14 @@ Manages QProcess instances for running external scripts and commands.
 """
 
 from PyQt5.QtCore import QProcess, pyqtSignal, QTimer
-from typing import Dict, Optional, List, NamedTuple
+from typing import Callable, Deque, Dict, Optional, List, NamedTuple, Tuple
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 import sys
 import os
+import re
+import time
 import uuid
 
 from .base_handler import BaseHandler
@@ -24,6 +27,23 @@ class ProcessState(Enum):
     CANCELLED = "cancelled"
 
 
+# States in which a process will not run again
+_COMPLETED_STATES = frozenset({ProcessState.FINISHED, ProcessState.FAILED, ProcessState.CANCELLED})
+
+# Progress updates are coalesced and flushed at most this often (~30 Hz)
+_PROGRESS_FLUSH_INTERVAL_MS = 33
+
+# Common progress patterns, tried in order; the first match wins
+_PROGRESS_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)%',  # "50%"
+    r'(\d+)/(\d+)',  # "5/10"
+    r'Progress:\s*(\d+)',  # "Progress: 75"
+    r'Step\s*(\d+)\s*of\s*(\d+)',  # "Step 3 of 5"
+    r'Processing\s*(\d+)\s*of\s*(\d+)',  # "Processing 3 of 5"
+    r'\[(\d+)/(\d+)\]',  # "[3/5]"
+))
+
+
 @dataclass
 class ProcessInfo:
     """Information about a process."""
@@ -58,6 +78,7 @@ class ProcessManager(BaseHandler):
     process_started = pyqtSignal(str)  # process_id
     process_finished = pyqtSignal(str, int)  # process_id, exit_code
     process_output = pyqtSignal(str, str)  # process_id, output
+    process_output_batch = pyqtSignal(str, list)  # process_id, output lines from one read
     process_error = pyqtSignal(str, str)  # process_id, error
     process_queued = pyqtSignal(str)  # process_id
     process_cancelled = pyqtSignal(str)  # process_id
@@ -67,10 +88,12 @@ class ProcessManager(BaseHandler):
     process_progress_updated = pyqtSignal(str, int, str)  # process_id, percentage, message
     queue_status_changed = pyqtSignal(int, int)  # queue_length, active_count
     
-    def __init__(self, parent=None, max_concurrent_processes: int = 1, auto_process_queue: bool = True):
+    def __init__(self, parent=None, max_concurrent_processes: int = 1, auto_process_queue: bool = True,
+                 time_fn: Callable[[], float] = time.time):
         super().__init__(parent)
+        self._time_fn = time_fn
         self.active_processes: Dict[str, QProcess] = {}
-        self.process_queue: List[QueuedProcess] = []
+        self.process_queue: Deque[QueuedProcess] = deque()
         self.process_info: Dict[str, ProcessInfo] = {}
         self.max_concurrent_processes = max_concurrent_processes
         self.auto_process_queue = auto_process_queue
@@ -80,6 +103,13 @@ class ProcessManager(BaseHandler):
         self.queue_timer.timeout.connect(self._process_queue)
         self.queue_timer.setSingleShot(True)
         
+        # Latest (percentage, message) per process, waiting for the next flush
+        self._pending_progress: Dict[str, Tuple[int, str]] = {}
+        self.progress_timer = QTimer()
+        self.progress_timer.setSingleShot(True)
+        self.progress_timer.setInterval(_PROGRESS_FLUSH_INTERVAL_MS)
+        self.progress_timer.timeout.connect(self._flush_progress)
+        
     def _setup(self):
         """Setup the process manager."""
         # Start queue processing timer
@@ -136,6 +166,11 @@ class ProcessManager(BaseHandler):
         """
         Start a new process immediately (bypassing queue).
         
+        The process is launched asynchronously: ``process_started`` is emitted
+        once Qt reports the process as running, and a failed launch is reported
+        through ``process_error``/``process_finished`` instead of blocking the
+        event loop in ``waitForStarted``.
+        
         Args:
             process_id: Unique identifier for the process
             command: Command to execute
@@ -143,7 +178,7 @@ class ProcessManager(BaseHandler):
             working_dir: Working directory for the process
             
         Returns:
-            True if process started successfully, False otherwise
+            True if the process was submitted for launch, False otherwise
         """
         if process_id in self.active_processes:
             self._handle_error("process_error", f"Process {process_id} already running")
@@ -160,6 +195,12 @@ class ProcessManager(BaseHandler):
             process = QProcess(self)
             
             # Setup process connections
+            process.started.connect(
+                lambda: self._on_started(process_id)
+            )
+            process.errorOccurred.connect(
+                lambda error: self._on_start_error(process_id, error)
+            )
             process.readyReadStandardOutput.connect(
                 lambda: self._handle_stdout(process_id)
             )
@@ -191,29 +232,44 @@ class ProcessManager(BaseHandler):
                 
             self.process_info[process_id].start_time = self._get_current_time()
             
-            # Start the process
+            # Start the process; completion is reported via the started/errorOccurred signals
             if args:
                 process.start(command, args)
             else:
                 process.start(command)
-                
-            if process.waitForStarted(3000):
-                self.process_started.emit(process_id)
-                self._emit_status(f"Process {process_id} started")
-                
-                # Emit queue status update
-                self.queue_status_changed.emit(len(self.process_queue), len(self.active_processes))
-                return True
-            else:
-                self._cleanup_process(process_id)
-                self._handle_error("process_error", f"Failed to start process {process_id}")
-                return False
+            return True
                 
         except Exception as e:
             self._cleanup_process(process_id)
             self._handle_error("process_error", f"Error starting process {process_id}: {e}")
             return False
             
+    def _on_started(self, process_id: str):
+        """Handle a process reporting that it has started."""
+        self.process_started.emit(process_id)
+        self._emit_status(f"Process {process_id} started")
+        
+        # Emit queue status update
+        self.queue_status_changed.emit(len(self.process_queue), len(self.active_processes))
+        
+    def _on_start_error(self, process_id: str, error):
+        """Handle a process that could not be launched."""
+        # Errors after a successful start (crashes, timeouts) are reported via finished
+        if error != QProcess.FailedToStart:
+            return
+            
+        if process_id in self.process_info:
+            self.process_info[process_id].state = ProcessState.FAILED
+            self.process_info[process_id].end_time = self._get_current_time()
+            
+        self._cleanup_process(process_id)
+        self._handle_error("process_error", f"Failed to start process {process_id}")
+        self.process_finished.emit(process_id, -1)
+        
+        # Continue processing queue if auto processing is enabled
+        if self.auto_process_queue and self.process_queue:
+            self.queue_timer.start(100)
+            
     def cancel_process(self, process_id: str) -> bool:
         """
         Cancel a process (remove from queue or stop if running).
@@ -227,7 +283,7 @@ class ProcessManager(BaseHandler):
         # Check if process is in queue
         for i, queued_process in enumerate(self.process_queue):
             if queued_process.process_id == process_id:
-                self.process_queue.pop(i)
+                del self.process_queue[i]
                 if process_id in self.process_info:
                     self.process_info[process_id].state = ProcessState.CANCELLED
                 self.process_cancelled.emit(process_id)
@@ -304,7 +360,7 @@ class ProcessManager(BaseHandler):
             return
             
         # Get next process from queue
-        queued_process = self.process_queue.pop(0)
+        queued_process = self.process_queue.popleft()
         
         # Start the process
         success = self.start_process(
@@ -345,14 +401,10 @@ class ProcessManager(BaseHandler):
         
     def clear_completed_processes(self):
         """Clear information about completed processes."""
-        completed_ids = [
-            pid for pid, info in self.process_info.items()
-            if info.state in [ProcessState.FINISHED, ProcessState.FAILED, ProcessState.CANCELLED]
-            and pid not in self.active_processes
-        ]
-        
-        for process_id in completed_ids:
-            del self.process_info[process_id]
+        self.process_info = {
+            pid: info for pid, info in self.process_info.items()
+            if info.state not in _COMPLETED_STATES or pid in self.active_processes
+        }
             
     def get_python_executable(self) -> str:
         """Get the appropriate Python executable path."""
@@ -366,40 +418,57 @@ class ProcessManager(BaseHandler):
         
     def _get_current_time(self) -> float:
         """Get current timestamp."""
-        import time
-        return time.time()
+        return self._time_fn()
         
     def _handle_stdout(self, process_id: str):
         """Handle standard output from a process."""
         if process_id in self.active_processes:
             process = self.active_processes[process_id]
-            output = process.readAllStandardOutput().data().decode(errors='replace')
-            if output:
-                # Split output into lines for better handling
-                lines = output.rstrip().split('\n')
-                for line in lines:
-                    if line.strip():
-                        self.process_output.emit(process_id, line.strip())
-                        
-                        # Try to extract progress information
-                        progress_percentage = self._extract_progress_from_output(line.strip())
-                        if progress_percentage >= 0:
-                            self.process_progress_updated.emit(process_id, progress_percentage, line.strip())
+            # Decode the whole buffer once, then split into lines
+            output = process.readAllStandardOutput().data().decode('utf-8', errors='replace')
+            lines = []
+            for line in output.splitlines():
+                line = line.strip()
+                if line:
+                    lines.append(line)
+                    self.process_output.emit(process_id, line)
+                    
+                    # Try to extract progress information
+                    progress_percentage = self._extract_progress_from_output(line)
+                    if progress_percentage >= 0:
+                        self._pending_progress[process_id] = (progress_percentage, line)
+            
+            # Display consumers take the whole read at once
+            if lines:
+                self.process_output_batch.emit(process_id, lines)
+            
+            if self._pending_progress and not self.progress_timer.isActive():
+                self.progress_timer.start()
+                
+    def _flush_progress(self):
+        """Emit the latest coalesced progress update for each process."""
+        self.progress_timer.stop()
+        pending, self._pending_progress = self._pending_progress, {}
+        for process_id, (percentage, message) in pending.items():
+            self.process_progress_updated.emit(process_id, percentage, message)
                 
     def _handle_stderr(self, process_id: str):
         """Handle standard error from a process."""
         if process_id in self.active_processes:
             process = self.active_processes[process_id]
-            error = process.readAllStandardError().data().decode(errors='replace')
-            if error:
-                # Split error into lines for better handling
-                lines = error.rstrip().split('\n')
-                for line in lines:
-                    if line.strip():
-                        self.process_error.emit(process_id, line.strip())
+            # Decode the whole buffer once, then split into lines
+            error = process.readAllStandardError().data().decode('utf-8', errors='replace')
+            for line in error.splitlines():
+                line = line.strip()
+                if line:
+                    self.process_error.emit(process_id, line)
                 
     def _handle_finished(self, process_id: str, exit_code: int):
         """Handle process completion."""
+        # Deliver any buffered progress before the completion signal
+        if process_id in self._pending_progress:
+            self._flush_progress()
+        
         # Update process info
         if process_id in self.process_info:
             self.process_info[process_id].exit_code = exit_code
@@ -431,6 +500,8 @@ class ProcessManager(BaseHandler):
             process = self.active_processes[process_id]
             try:
                 # Disconnect signals to prevent issues during cleanup
+                process.started.disconnect()
+                process.errorOccurred.disconnect()
                 process.readyReadStandardOutput.disconnect()
                 process.readyReadStandardError.disconnect()
                 process.finished.disconnect()
@@ -443,6 +514,8 @@ class ProcessManager(BaseHandler):
     def cleanup(self):
         """Cleanup all processes when shutting down."""
         self.queue_timer.stop()
+        self.progress_timer.stop()
+        self._pending_progress.clear()
         self.stop_all_processes()
         
         # Wait for processes to finish (create a copy of the list to avoid iteration issues)
@@ -463,25 +536,13 @@ class ProcessManager(BaseHandler):
         Returns:
             Progress percentage (0-100) or -1 if no progress found
         """
-        import re
-        
-        # Common progress patterns
-        patterns = [
-            r'(\d+)%',  # "50%"
-            r'(\d+)/(\d+)',  # "5/10"
-            r'Progress:\s*(\d+)',  # "Progress: 75"
-            r'Step\s*(\d+)\s*of\s*(\d+)',  # "Step 3 of 5"
-            r'Processing\s*(\d+)\s*of\s*(\d+)',  # "Processing 3 of 5"
-            r'\[(\d+)/(\d+)\]',  # "[3/5]"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, output, re.IGNORECASE)
+        for pattern in _PROGRESS_PATTERNS:
+            match = pattern.search(output)
             if match:
-                if len(match.groups()) == 1:
+                if pattern.groups == 1:
                     # Direct percentage
                     return min(100, max(0, int(match.group(1))))
-                elif len(match.groups()) == 2:
+                elif pattern.groups == 2:
                     # Fraction format
                     try:
                         current = int(match.group(1))
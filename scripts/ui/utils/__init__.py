@@ -2,15 +2,40 @@
 UI Utils Module
 
 This module contains utility classes and functions for the UI.
+
+Utilities are imported on first attribute access, so using one of them
+does not import the Qt widget helpers as well.
 """
 
-from .config import AppConfig, AppSettings
-from .paths import PathManager
-from .ui_helpers import UIHelpers
+import importlib
+
+# Public name -> submodule that defines it
+_UTILITY_MODULES = {
+    'AppConfig': '.config',
+    'AppSettings': '.config',
+    'BufferedFileHandler': '.log_handlers',
+    'CachedTimeFormatter': '.log_handlers',
+    'DeferredQueueHandler': '.log_handlers',
+    'PathManager': '.paths',
+    'UIHelpers': '.ui_helpers',
+}
 
 __all__ = [
     'AppConfig',
     'AppSettings',
+    'BufferedFileHandler',
+    'CachedTimeFormatter',
+    'DeferredQueueHandler',
     'PathManager',
     'UIHelpers',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a utility the first time it is accessed."""
+    if name in _UTILITY_MODULES:
+        module = importlib.import_module(_UTILITY_MODULES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Logging Handlers
+
+Logging handlers and formatters used by the application's logging setup.
+"""
+
+import logging
+import threading
+import time
+from logging.handlers import QueueHandler
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that buffers writes instead of flushing every record.
+
+    Records are written into a large file buffer. The buffer is flushed when
+    a record at or above flush_level arrives, every flush_interval seconds
+    from a background thread, and when the handler is closed.
+    """
+
+    def __init__(self, filename: str, mode: str = 'a', encoding: str = 'utf-8',
+                 delay: bool = True, buffer_size: int = 64 * 1024,
+                 flush_interval: float = 30.0, flush_level: int = logging.ERROR):
+        """
+        Initialize the buffered file handler.
+
+        Args:
+            filename: Log file path
+            mode: File open mode
+            encoding: File encoding
+            delay: Open the file on the first record instead of immediately
+            buffer_size: Size of the file buffer in bytes
+            flush_interval: Seconds between periodic flushes
+            flush_level: Records at or above this level are flushed at once
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._deferring_flush = False
+        super().__init__(filename, mode=mode, encoding=encoding, delay=delay)
+
+        self._stop_flushing = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, name='BufferedFileHandler-flush', daemon=True
+        )
+        self._flush_thread.start()
+
+    def _open(self):
+        """Open the log file with a buffer_size byte buffer."""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord):
+        """Write a record, leaving it in the buffer unless it is severe."""
+        self._deferring_flush = record.levelno < self.flush_level
+        try:
+            super().emit(record)
+        finally:
+            self._deferring_flush = False
+
+    def flush(self):
+        """Flush the buffer, except for the per-record flush of emit()."""
+        if not self._deferring_flush:
+            super().flush()
+
+    def _flush_periodically(self):
+        """Flush the buffer every flush_interval seconds until closed."""
+        while not self._stop_flushing.wait(self.flush_interval):
+            # Bypass flush() so an emit() on another thread cannot defer this
+            logging.StreamHandler.flush(self)
+
+    def close(self):
+        """Stop periodic flushing, then flush and close the file."""
+        self._stop_flushing.set()
+        if self._flush_thread is not threading.current_thread():
+            self._flush_thread.join()
+        super().close()
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the handlers behind the queue.
+    
+    QueueHandler.prepare formats the message and traceback on the logging
+    thread and drops exc_info. The queue here never leaves the process, so
+    the record is enqueued as it is and the listener's handlers format it on
+    the listener thread. Objects passed as log arguments must therefore not
+    be mutated after the call.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue the record unformatted."""
+        return record
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders each second's timestamp only once.
+
+    The default formatTime calls time.localtime and time.strftime for every
+    record. Records logged within the same second share the rendered text;
+    only the milliseconds are filled in per record, so the output matches
+    logging.Formatter exactly.
+    """
+
+    def __init__(self, fmt: str = None, datefmt: str = None):
+        """
+        Initialize the formatter.
+
+        Args:
+            fmt: Record format string
+            datefmt: strftime format for asctime, or None for the default
+        """
+        super().__init__(fmt, datefmt)
+        # (whole second, rendered text); replaced as a single tuple so
+        # handlers on different threads never see a half-updated entry
+        self._time_cache = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        """Format the record's creation time, reusing the current second's text."""
+        datefmt = datefmt or self.datefmt
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if cached_second != second:
+            ct = self.converter(record.created)
+            text = time.strftime(datefmt or self.default_time_format, ct)
+            self._time_cache = (second, text)
+        if datefmt or not self.default_msec_format:
+            return text
+        return self.default_msec_format % (text, record.msecs)
@@ -4,12 +4,16 @@ Status Manager
 Centralized status and progress management system for the PDF Cleanup Agent.
 """
 
-from PyQt5.QtCore import QObject, pyqtSignal, QTimer
-from typing import Dict, Optional, List, Any
+from PyQt5.QtCore import QObject, pyqtSignal, QTimer, QElapsedTimer
+from typing import Deque, Dict, Iterable, Optional, List, Any, Tuple
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
-import uuid
+import heapq
+import itertools
+import sys
+import time
 
 
 class StatusLevel(Enum):
@@ -28,23 +32,37 @@ class ProgressType(Enum):
     PULSE = "pulse"  # Pulsing indicator
 
 
-@dataclass
+# Slotted records drop the per-instance __dict__; dataclass(slots=True) needs 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Process-wide counter for generated IDs; cheaper than uuid4 and unique per run
+_id_counter = itertools.count(1)
+
+
+def _next_id() -> str:
+    """Return the next generated status/progress/busy ID."""
+    return str(next(_id_counter))
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class StatusMessage:
     """Represents a status message."""
     id: str
     message: str
     level: StatusLevel
-    timestamp: datetime
+    timestamp: float  # Seconds since the epoch; format only when displayed
     source: Optional[str] = None
     details: Optional[str] = None
     persistent: bool = False
     
     def __post_init__(self):
         if not self.id:
-            self.id = str(uuid.uuid4())[:8]
+            self.id = _next_id()
+        if self.timestamp is None:
+            self.timestamp = time.time()
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProgressInfo:
     """Represents progress information."""
     id: str
@@ -59,7 +77,7 @@ class ProgressInfo:
     
     def __post_init__(self):
         if not self.id:
-            self.id = str(uuid.uuid4())[:8]
+            self.id = _next_id()
         if not self.start_time:
             self.start_time = datetime.now()
     
@@ -76,7 +94,7 @@ class ProgressInfo:
         return self.current >= self.maximum and self.progress_type == ProgressType.DETERMINATE
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BusyIndicator:
     """Represents a busy indicator for long-running operations."""
     id: str
@@ -87,7 +105,7 @@ class BusyIndicator:
     
     def __post_init__(self):
         if not self.id:
-            self.id = str(uuid.uuid4())[:8]
+            self.id = _next_id()
         if not self.start_time:
             self.start_time = datetime.now()
 
@@ -102,6 +120,7 @@ class StatusManager(QObject):
     
     # Signals for status updates
     status_message_added = pyqtSignal(StatusMessage)
+    status_messages_bulk_added = pyqtSignal(list)  # message_ids
     status_message_updated = pyqtSignal(StatusMessage)
     status_message_removed = pyqtSignal(str)  # message_id
     status_cleared = pyqtSignal()
@@ -125,8 +144,11 @@ class StatusManager(QObject):
         
         # Status message storage
         self.status_messages: Dict[str, StatusMessage] = {}
-        self.status_history: List[StatusMessage] = []
+        self.max_status_messages = 500
+        # Non-persistent message IDs, oldest first (dicts keep insertion order)
+        self.message_order: Dict[str, None] = {}
         self.max_history_size = 1000
+        self.status_history: Deque[StatusMessage] = deque(maxlen=self.max_history_size)
         
         # Progress tracking
         self.active_progress: Dict[str, ProgressInfo] = {}
@@ -134,14 +156,22 @@ class StatusManager(QObject):
         
         # Busy indicators
         self.busy_indicators: Dict[str, BusyIndicator] = {}
+        self._busy_count = 0  # len(busy_indicators), kept for is_busy()
         
         # Auto-cleanup timer for non-persistent messages
         self.cleanup_timer = QTimer()
         self.cleanup_timer.timeout.connect(self._cleanup_old_messages)
         self.cleanup_timer.start(30000)  # Clean up every 30 seconds
         
-        # Message display timer for temporary messages
-        self.message_timers: Dict[str, QTimer] = {}
+        # Auto-removal of temporary messages: deadlines are milliseconds on a
+        # monotonic clock, and one single-shot timer fires for the soonest
+        self.auto_remove_clock = QElapsedTimer()
+        self.auto_remove_clock.start()
+        self.auto_remove_deadlines: Dict[str, int] = {}
+        self._auto_remove_queue: List[Tuple[int, str]] = []  # Heap; may hold stale entries
+        self.auto_remove_timer = QTimer()
+        self.auto_remove_timer.setSingleShot(True)
+        self.auto_remove_timer.timeout.connect(self._remove_expired_messages)
         
     def add_status_message(self, message: str, level: StatusLevel = StatusLevel.INFO,
                           source: Optional[str] = None, details: Optional[str] = None,
@@ -164,31 +194,72 @@ class StatusManager(QObject):
             id="",  # Will be auto-generated
             message=message,
             level=level,
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             source=source,
             details=details,
             persistent=persistent
         )
         
         self.status_messages[status_msg.id] = status_msg
-        self.status_history.append(status_msg)
-        
-        # Trim history if needed
-        if len(self.status_history) > self.max_history_size:
-            self.status_history = self.status_history[-self.max_history_size:]
+        self.status_history.append(status_msg)  # Bounded; oldest entries drop off
+        if not persistent:
+            self.message_order[status_msg.id] = None
         
         self.status_message_added.emit(status_msg)
+        self._evict_old_messages()
         
-        # Set up auto-removal timer if specified
+        # Schedule auto-removal if specified
         if auto_remove_ms and not persistent:
-            timer = QTimer()
-            timer.setSingleShot(True)
-            timer.timeout.connect(lambda: self.remove_status_message(status_msg.id))
-            timer.start(auto_remove_ms)
-            self.message_timers[status_msg.id] = timer
+            self._schedule_auto_remove(status_msg.id, auto_remove_ms)
         
         return status_msg.id
     
+    def add_status_messages(self, entries: Iterable[Tuple[str, StatusLevel, Optional[str]]],
+                            persistent: bool = False,
+                            auto_remove_ms: Optional[int] = None) -> List[str]:
+        """
+        Add several status messages with a single signal emission.
+        
+        Args:
+            entries: (message, level, source) tuples
+            persistent: Whether the messages should persist until manually removed
+            auto_remove_ms: Auto-remove each message after specified milliseconds
+            
+        Returns:
+            Message IDs in the order the entries were given
+        """
+        timestamp = time.time()
+        message_ids = []
+        
+        for message, level, source in entries:
+            status_msg = StatusMessage(
+                id="",  # Will be auto-generated
+                message=message,
+                level=level,
+                timestamp=timestamp,
+                source=source,
+                persistent=persistent
+            )
+            self.status_messages[status_msg.id] = status_msg
+            self.status_history.append(status_msg)
+            if not persistent:
+                self.message_order[status_msg.id] = None
+            message_ids.append(status_msg.id)
+        
+        if not message_ids:
+            return message_ids
+        
+        self.status_messages_bulk_added.emit(message_ids)
+        self._evict_old_messages()
+        
+        # Schedule auto-removal if specified
+        if auto_remove_ms and not persistent:
+            for message_id in message_ids:
+                if message_id in self.status_messages:
+                    self._schedule_auto_remove(message_id, auto_remove_ms)
+        
+        return message_ids
+    
     def update_status_message(self, message_id: str, message: Optional[str] = None,
                              level: Optional[StatusLevel] = None, details: Optional[str] = None) -> bool:
         """
@@ -215,7 +286,7 @@ class StatusManager(QObject):
         if details is not None:
             status_msg.details = details
         
-        status_msg.timestamp = datetime.now()
+        status_msg.timestamp = time.time()
         
         self.status_message_updated.emit(status_msg)
         return True
@@ -234,15 +305,54 @@ class StatusManager(QObject):
             return False
         
         del self.status_messages[message_id]
+        self.message_order.pop(message_id, None)
         
-        # Clean up timer if exists
-        if message_id in self.message_timers:
-            self.message_timers[message_id].stop()
-            del self.message_timers[message_id]
+        # Its queued deadline goes stale and is skipped when reached
+        self.auto_remove_deadlines.pop(message_id, None)
         
         self.status_message_removed.emit(message_id)
         return True
     
+    def _schedule_auto_remove(self, message_id: str, delay_ms: int):
+        """Remove a message once delay_ms has elapsed."""
+        deadline = self.auto_remove_clock.elapsed() + delay_ms
+        self.auto_remove_deadlines[message_id] = deadline
+        heapq.heappush(self._auto_remove_queue, (deadline, message_id))
+        
+        # Only an earlier deadline than the one already armed needs a restart
+        if not self.auto_remove_timer.isActive() or self._auto_remove_queue[0][1] == message_id:
+            self._arm_auto_remove_timer()
+    
+    def _arm_auto_remove_timer(self):
+        """Start the auto-remove timer for the soonest live deadline."""
+        queue = self._auto_remove_queue
+        while queue and self.auto_remove_deadlines.get(queue[0][1]) != queue[0][0]:
+            heapq.heappop(queue)
+        
+        if queue:
+            self.auto_remove_timer.start(max(0, queue[0][0] - self.auto_remove_clock.elapsed()))
+        else:
+            self.auto_remove_timer.stop()
+    
+    def _remove_expired_messages(self):
+        """Remove every message whose auto-remove deadline has passed."""
+        now = self.auto_remove_clock.elapsed()
+        queue = self._auto_remove_queue
+        while queue and queue[0][0] <= now:
+            deadline, message_id = heapq.heappop(queue)
+            if self.auto_remove_deadlines.get(message_id) == deadline:
+                self.remove_status_message(message_id)
+        
+        self._arm_auto_remove_timer()
+    
+    def _evict_old_messages(self):
+        """Remove the oldest non-persistent messages beyond max_status_messages."""
+        while len(self.message_order) > self.max_status_messages:
+            oldest_id = next(iter(self.message_order))
+            if not self.remove_status_message(oldest_id):
+                # Already gone from status_messages; just forget its position
+                del self.message_order[oldest_id]
+    
     def clear_status_messages(self, level: Optional[StatusLevel] = None):
         """
         Clear status messages.
@@ -285,7 +395,7 @@ class StatusManager(QObject):
             Progress ID for tracking
         """
         if progress_id is None:
-            progress_id = str(uuid.uuid4())[:8]
+            progress_id = _next_id()
         
         progress_info = ProgressInfo(
             id=progress_id,
@@ -331,11 +441,11 @@ class StatusManager(QObject):
         
         # Estimate completion time for determinate progress
         if progress_info.progress_type == ProgressType.DETERMINATE and progress_info.current > 0:
-            elapsed = datetime.now() - progress_info.start_time
             if progress_info.current < progress_info.maximum:
+                now = datetime.now()
+                elapsed = now - progress_info.start_time
                 remaining_ratio = (progress_info.maximum - progress_info.current) / progress_info.current
-                estimated_remaining = elapsed * remaining_ratio
-                progress_info.estimated_completion = datetime.now() + estimated_remaining
+                progress_info.estimated_completion = now + elapsed * remaining_ratio
         
         self.progress_updated.emit(progress_info)
         
@@ -409,7 +519,7 @@ class StatusManager(QObject):
             Busy indicator ID for tracking
         """
         if busy_id is None:
-            busy_id = str(uuid.uuid4())[:8]
+            busy_id = _next_id()
         
         busy_indicator = BusyIndicator(
             id=busy_id,
@@ -419,6 +529,8 @@ class StatusManager(QObject):
             start_time=datetime.now()
         )
         
+        if busy_id not in self.busy_indicators:
+            self._busy_count += 1
         self.busy_indicators[busy_id] = busy_indicator
         self.busy_started.emit(busy_indicator)
         
@@ -459,6 +571,7 @@ class StatusManager(QObject):
         
         self.busy_indicators[busy_id].is_active = False
         del self.busy_indicators[busy_id]
+        self._busy_count -= 1
         
         self.busy_finished.emit(busy_id)
         return True
@@ -488,7 +601,7 @@ class StatusManager(QObject):
     
     def is_busy(self) -> bool:
         """Check if any operations are currently busy."""
-        return len(self.busy_indicators) > 0 or len(self.active_progress) > 0
+        return self._busy_count > 0 or bool(self.active_progress)
     
     def get_ui_state(self) -> dict:
         """
@@ -508,8 +621,7 @@ class StatusManager(QObject):
     
     def _cleanup_old_messages(self):
         """Clean up old non-persistent status messages."""
-        cutoff_time = datetime.now()
-        cutoff_time = cutoff_time.replace(minute=cutoff_time.minute - 5)  # 5 minutes ago
+        cutoff_time = time.time() - 5 * 60  # 5 minutes ago
         
         to_remove = [
             msg_id for msg_id, msg in self.status_messages.items()
@@ -519,16 +631,28 @@ class StatusManager(QObject):
         for msg_id in to_remove:
             self.remove_status_message(msg_id)
     
-    def cleanup(self):
-        """Cleanup status manager resources."""
-        self.cleanup_timer.stop()
+    def reset(self):
+        """
+        Drop every message, progress and busy indicator, and the history.
         
-        # Stop all message timers
-        for timer in self.message_timers.values():
-            timer.stop()
-        self.message_timers.clear()
+        Persistent messages are dropped too. No signals are emitted, so use
+        this only when nothing is displaying the state, such as between tests.
+        """
+        # Cancel pending auto-removals
+        self.auto_remove_timer.stop()
+        self.auto_remove_deadlines.clear()
+        self._auto_remove_queue.clear()
         
         # Clear all data
         self.status_messages.clear()
+        self.message_order.clear()
+        self.status_history.clear()
         self.active_progress.clear()
-        self.busy_indicators.clear()
\ No newline at end of file
+        self.progress_history.clear()
+        self.busy_indicators.clear()
+        self._busy_count = 0
+    
+    def cleanup(self):
+        """Cleanup status manager resources."""
+        self.cleanup_timer.stop()
+        self.reset()